@@ -0,0 +1,226 @@
+"""
+Etapa de assets estáticos do build.
+
+Cada asset (CSS, JS, imagens, fontes) é copiado para a saída com o hash do
+conteúdo no nome ("styles.css" -> "styles.1a2b3c4d5e.css"), o que permite
+servi-lo com cache de longa duração. O CSS é minificado, e as referências
+"/styles.css" nas páginas renderizadas são reescritas para o nome com hash.
+Só os assets cujo hash mudou desde o último build são processados.
+"""
+import hashlib
+import json
+import os
+import re
+
+from textnode import INLINE_LINK_PATTERN
+from writer import remove_output, write_if_changed
+
+ASSET_TYPES = (".css", ".js", ".svg", ".png", ".jpg", ".jpeg", ".gif", ".ico", ".webp", ".woff2")
+# Tipos que valem a pena comprimir (texto); imagens e fontes já são comprimidas
+COMPRESSIBLE_TYPES = (".css", ".js", ".svg")
+HASH_LENGTH = 10
+HASHED_NAME = re.compile(r"\.[0-9a-f]{%d}\.[^./]+$" % HASH_LENGTH)
+
+# Strings e comentários do CSS são tratados antes dos espaços, para que o
+# conteúdo das strings não seja alterado
+CSS_STRING = r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\''
+CSS_TOKEN = re.compile(rf"({CSS_STRING})|/\*.*?\*/|\s+", re.DOTALL)
+CSS_STRINGS = re.compile(rf"({CSS_STRING})")
+CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+# Trechos em que os espaços são significativos e não podem ser colapsados
+HTML_PRESERVE = re.compile(r"(<(pre|textarea|script|style)\b.*?</\2\s*>)", re.DOTALL | re.IGNORECASE)
+HTML_WHITESPACE = re.compile(r"\s{2,}|[\t\r\n]")
+REFERENCE_PATTERN = re.compile(r'\b(href|src)="([^"]*)"')
+
+
+def minify_css(css):
+    """
+    Remove comentários e espaços desnecessários de uma folha de estilo.
+    """
+    def token(match):
+        if match.group(1) is not None:
+            return match.group(1)
+        # Comentários e espaços viram um espaço; os supérfluos saem abaixo
+        return " "
+
+    css = CSS_TOKEN.sub(token, css)
+    # Espaços em volta da pontuação saem apenas fora das strings
+    pieces = CSS_STRINGS.split(css)
+    for i in range(0, len(pieces), 2):
+        pieces[i] = (
+            CSS_PUNCTUATION.sub(r"\1", pieces[i]).replace(": ", ":").replace(";}", "}")
+        )
+    return "".join(pieces).strip()
+
+
+def collapse_html(html):
+    """
+    Colapsa sequências de espaços e quebras de linha em um único espaço,
+    exceto dentro de <pre>, <textarea>, <script> e <style>.
+    """
+    pieces = HTML_PRESERVE.split(html)
+    # split devolve [texto, trecho, nome da tag, texto, ...]
+    for i in range(0, len(pieces), 3):
+        pieces[i] = HTML_WHITESPACE.sub(" ", pieces[i])
+    return "".join(pieces[i] for i in range(len(pieces)) if i % 3 != 2)
+
+
+def hashed_name(path, digest):
+    """
+    Mapeia "css/site.css" para "css/site.<hash>.css".
+    """
+    root, extension = os.path.splitext(path)
+    return f"{root}.{digest[:HASH_LENGTH]}{extension}"
+
+
+def find_assets(assets_dir):
+    """
+    Retorna os caminhos relativos (com "/") dos assets, em ordem, ignorando
+    diretórios ocultos e arquivos que já têm hash no nome.
+    """
+    assets = []
+    for dirpath, dirnames, filenames in os.walk(assets_dir):
+        dirnames[:] = [name for name in dirnames if not name.startswith((".", "__"))]
+        for filename in filenames:
+            if filename.endswith(ASSET_TYPES) and not HASHED_NAME.search(filename):
+                full_path = os.path.join(dirpath, filename)
+                assets.append(os.path.relpath(full_path, assets_dir).replace(os.sep, "/"))
+    return sorted(assets)
+
+
+class AssetPipeline:
+    """
+    Opções e estado da etapa de assets, compartilhados com os workers de
+    renderização para o pós-processamento das páginas.
+    """
+    def __init__(self, assets_dir=None, minify_html=False, precompress=False):
+        """
+        Args:
+            assets_dir: Diretório com os assets de origem (None desativa os assets)
+            minify_html: Se True, colapsa os espaços do HTML das páginas
+            precompress: Se True, grava também uma cópia .gz dos assets de texto
+        """
+        self.assets_dir = assets_dir
+        self.minify_html = minify_html
+        self.precompress = precompress
+        # Referência original -> referência com hash ("/styles.css" -> "/styles.<hash>.css")
+        self.mapping = {}
+
+    def load(self, assets):
+        """
+        Define as referências a partir das entradas de assets de um manifesto.
+        """
+        self.mapping = {f"/{source}": f"/{entry['output']}" for source, entry in assets.items()}
+
+    def key(self, template_source=""):
+        """
+        Identifica o que afeta o HTML de todas as páginas: a minificação e os
+        assets referenciados pelo próprio template. Entra no hash do template
+        do manifesto, então uma mudança re-renderiza todas as páginas; assets
+        usados só por algumas páginas ficam na entrada de cada uma
+        (page_references).
+
+        Returns:
+            Uma string vazia se nada disso se aplica
+        """
+        mapping = self.mapping
+        references = sorted({
+            (match.group(2), mapping[match.group(2)])
+            for match in REFERENCE_PATTERN.finditer(template_source)
+            if match.group(2) in mapping
+        }) if mapping else []
+        if not self.minify_html and not references:
+            return ""
+        return json.dumps([self.minify_html, references])
+
+    def page_references(self, markdown):
+        """
+        Retorna, em ordem, os nomes com hash dos assets que os links e imagens
+        de uma página referenciam.
+        """
+        mapping = self.mapping
+        if not mapping or "](" not in markdown:
+            return []
+        return sorted({
+            mapping[url] for _, _, url in INLINE_LINK_PATTERN.findall(markdown) if url in mapping
+        })
+
+    def process(self, output_dir, old_assets, force=False):
+        """
+        Copia para output_dir os assets novos ou alterados e remove as cópias
+        com hash que deixaram de ser usadas.
+
+        Args:
+            old_assets: Entradas {"source": {"hash", "output"}} do build anterior
+            force: Se True, processa todos os assets, mesmo os inalterados
+
+        Returns:
+            Uma tupla (assets, alterados, removidos), com as novas entradas do
+            manifesto e as listas de caminhos relativos processados e removidos
+        """
+        assets = {}
+        changed = []
+        sources = find_assets(self.assets_dir) if self.assets_dir else []
+        for source in sources:
+            with open(os.path.join(self.assets_dir, source), "rb") as fp:
+                data = fp.read()
+            digest = hashlib.sha256(data).hexdigest()
+            entry = {"hash": digest, "output": hashed_name(source, digest)}
+            assets[source] = entry
+            output_path = os.path.join(output_dir, entry["output"])
+            gzip_path = f"{output_path}.gz"
+            compress = self.precompress and source.endswith(COMPRESSIBLE_TYPES)
+            if (
+                not force
+                and old_assets.get(source) == entry
+                and os.path.exists(output_path)
+                and (not compress or os.path.exists(gzip_path))
+            ):
+                continue
+            if source.endswith(".css"):
+                data = minify_css(data.decode("utf-8")).encode("utf-8")
+            write_if_changed(output_path, data)
+            if compress:
+                import gzip
+
+                # mtime=0 deixa o .gz determinístico entre builds
+                write_if_changed(gzip_path, gzip.compress(data, mtime=0))
+            changed.append(source)
+
+        removed = []
+        for source, entry in old_assets.items():
+            if assets.get(source, {}).get("output") != entry["output"]:
+                output_path = os.path.join(output_dir, entry["output"])
+                remove_output(f"{output_path}.gz", output_dir)
+                remove_output(output_path, output_dir)
+                if source not in assets:
+                    removed.append(source)
+        self.load(assets)
+        return assets, changed, removed
+
+    def rewrite_references(self, html):
+        """
+        Troca, nos atributos href e src, as referências absolutas aos assets
+        pelos nomes com hash.
+        """
+        mapping = self.mapping
+        if not mapping:
+            return html
+
+        def replace(match):
+            target = mapping.get(match.group(2))
+            if target is None:
+                return match.group(0)
+            return f'{match.group(1)}="{target}"'
+
+        return REFERENCE_PATTERN.sub(replace, html)
+
+    def finish_page(self, html):
+        """
+        Pós-processa o HTML de uma página renderizada.
+        """
+        html = self.rewrite_references(html)
+        if self.minify_html:
+            html = collapse_html(html)
+        return html
@@ -0,0 +1,362 @@
+"""
+Benchmarks do pipeline de Markdown para HTML.
+
+Uso:
+    python3 src/benchmarks.py [nome ...]
+
+Sem argumentos, executa todos os benchmarks registrados em BENCHMARKS.
+"""
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from htmlnode import (
+    LeafNode,
+    ParentNode,
+    freeze,
+    text_node_to_html_node,
+    text_nodes_to_html,
+)
+from textnode import TextNode, TextType
+
+
+WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit"]
+
+
+def synthetic_paragraph(rng, words=80):
+    """
+    Gera um parágrafo com texto comum misturado a negrito, itálico, código,
+    links e imagens.
+    """
+    parts = []
+    for i in range(words):
+        word = rng.choice(WORDS)
+        roll = rng.random()
+        if roll < 0.05:
+            word = f"**{word}**"
+        elif roll < 0.10:
+            word = f"*{word}*"
+        elif roll < 0.13:
+            word = f"`{word}`"
+        elif roll < 0.16:
+            word = f"[{word}](https://example.com/{i})"
+        elif roll < 0.17:
+            word = f"![{word}](https://example.com/{i}.png)"
+        parts.append(word)
+    return " ".join(parts)
+
+
+def synthetic_document(paragraphs, seed=0):
+    """
+    Gera uma lista reprodutível de parágrafos sintéticos.
+    """
+    rng = random.Random(seed)
+    return [synthetic_paragraph(rng) for _ in range(paragraphs)]
+
+
+def best_of(func, repeat=5):
+    """
+    Executa func repeat vezes e retorna o menor tempo em segundos.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_inline():
+    """
+    Compara o tokenizador de passagem única com o pipeline antigo de cinco passagens.
+    """
+    for size in (1_000, 10_000):
+        document = synthetic_document(size)
+        legacy = best_of(lambda: [TextNode.text_to_textnodes(p, legacy=True) for p in document])
+        single = best_of(lambda: [TextNode.text_to_textnodes(p) for p in document])
+        print(
+            f"inline {size:>6} parágrafos: legacy {legacy * 1000:8.1f} ms"
+            f"  single-pass {single * 1000:8.1f} ms  ({legacy / single:.2f}x)"
+        )
+
+
+def bench_rules():
+    """
+    Custo das regras inline opcionais: nenhuma ativa, todas ativas em texto
+    sem as sintaxes delas e todas ativas em texto que as usa.
+    """
+    from inline_rules import RULES, enable_rules
+
+    document = synthetic_document(10_000)
+    marked = [f"{p} ~~{WORDS[0]}~~ =={WORDS[1]}== [^{i}]" for i, p in enumerate(document)]
+    baseline = best_of(lambda: [TextNode.text_to_textnodes(p) for p in document])
+    enable_rules(list(RULES))
+    try:
+        plain = best_of(lambda: [TextNode.text_to_textnodes(p) for p in document])
+        used = best_of(lambda: [TextNode.text_to_textnodes(p) for p in marked])
+    finally:
+        enable_rules([])
+    print(
+        f"rules 10000 parágrafos: desativadas {baseline * 1000:8.1f} ms"
+        f"  {len(RULES)} ativas {plain * 1000:8.1f} ms ({plain / baseline:.2f}x)"
+        f"  usadas {used * 1000:8.1f} ms"
+    )
+
+
+def bench_link_scaling():
+    """
+    Mede split_nodes_link e split_nodes_image em um único nó com 1k, 10k e 100k
+    marcadores. O tempo por marcador deve permanecer constante (crescimento linear).
+    """
+    for count in (1_000, 10_000, 100_000):
+        links = " ".join(f"see [page {i}](/pages/{i}.html)" for i in range(count))
+        images = " ".join(f"see ![img {i}](/img/{i}.png)" for i in range(count))
+        link_node = [TextNode(links, TextType.TEXT)]
+        image_node = [TextNode(images, TextType.TEXT)]
+        link_time = best_of(lambda: TextNode.split_nodes_link(link_node), repeat=3)
+        image_time = best_of(lambda: TextNode.split_nodes_image(image_node), repeat=3)
+        print(
+            f"links {count:>7}: {link_time * 1000:8.1f} ms ({link_time / count * 1e9:6.0f} ns/link)"
+            f"  imagens: {image_time * 1000:8.1f} ms ({image_time / count * 1e9:6.0f} ns/imagem)"
+        )
+
+
+class DictTextNode:
+    """
+    Referência com o layout antigo do TextNode (atributos em __dict__).
+    """
+    def __init__(self, text, text_type, url=None):
+        self.text = text
+        self.text_type = text_type
+        self.url = url
+
+
+class DictLeafNode:
+    """
+    Referência com o layout antigo do LeafNode (__dict__, lista e dict vazios
+    alocados em cada nó).
+    """
+    def __init__(self, tag, value, props=None):
+        self.tag = tag
+        self.value = value
+        self.children = []
+        self.props = props if props is not None else {}
+
+
+def measure_nodes(factory, count=100_000):
+    """
+    Retorna (bytes por nó, nós construídos por segundo) para factory(i).
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [factory(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del nodes
+    elapsed = best_of(lambda: [factory(i) for i in range(count)], repeat=3)
+    return size / count, count / elapsed
+
+
+def bench_node_memory():
+    """
+    Compara memória e velocidade de construção dos nós com __slots__ com o
+    layout antigo baseado em __dict__.
+    """
+    text = "shared text"
+    cases = [
+        ("TextNode (dict)", lambda i: DictTextNode(text, TextType.TEXT)),
+        ("TextNode (slots)", lambda i: TextNode(text, TextType.TEXT)),
+        ("LeafNode (dict)", lambda i: DictLeafNode("b", text)),
+        ("LeafNode (slots)", lambda i: LeafNode("b", text)),
+        ("ParentNode (slots)", lambda i: ParentNode("p", [])),
+    ]
+    for name, factory in cases:
+        per_node, throughput = measure_nodes(factory)
+        print(f"{name:<20} {per_node:7.1f} bytes/nó  {throughput / 1e6:6.2f} M nós/s")
+
+
+def bench_convert():
+    """
+    Compara a conversão nó a nó (LeafNode + to_html) com text_nodes_to_html.
+    """
+    document = synthetic_document(5_000)
+    paragraphs = [TextNode.text_to_textnodes(p) for p in document]
+    per_node = best_of(lambda: [
+        "".join(text_node_to_html_node(node).to_html() for node in nodes) for nodes in paragraphs
+    ])
+    batch = best_of(lambda: [text_nodes_to_html(nodes) for nodes in paragraphs])
+    print(
+        f"convert {len(paragraphs)} parágrafos: LeafNode {per_node * 1000:8.1f} ms"
+        f"  batch {batch * 1000:8.1f} ms  ({per_node / batch:.2f}x)"
+    )
+
+
+def bench_extract():
+    """
+    Compara re.findall com o padrão em string (implementação antiga) com os
+    padrões pré-compilados e o pré-filtro literal, em prosa sem links e em
+    texto com links.
+    """
+    rng = random.Random(0)
+    prose = [" ".join(rng.choice(WORDS) for _ in range(120)) for _ in range(5_000)]
+    linked = synthetic_document(5_000)
+    image_pattern = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
+    link_pattern = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
+    for name, paragraphs in (("prosa", prose), ("com links", linked)):
+        old = best_of(lambda: [
+            (re.findall(image_pattern, p), re.findall(link_pattern, p)) for p in paragraphs
+        ])
+        new = best_of(lambda: [
+            (TextNode.extract_markdown_images(p), TextNode.extract_markdown_links(p))
+            for p in paragraphs
+        ])
+        spans = best_of(lambda: [TextNode.extract_markdown_spans(p) for p in paragraphs])
+        print(
+            f"extract {name:<10}: re.findall {old * 1000:7.1f} ms  compilado {new * 1000:7.1f} ms"
+            f" ({old / new:.2f}x)  spans {spans * 1000:7.1f} ms"
+        )
+
+
+def bench_ir():
+    """
+    Compara memória e tempo de renderização de uma página enorme como árvore de
+    HTMLNode e como HTMLTree (arrays paralelos), convertida da árvore ou
+    montada direto dos blocos (from_blocks).
+    """
+    from blocks import markdown_to_html_node
+    from htmlir import HTMLTree
+
+    markdown = "\n\n".join(synthetic_document(20_000))
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    node = markdown_to_html_node(markdown)
+    node_bytes = tracemalloc.get_traced_memory()[0] - before
+    before = tracemalloc.get_traced_memory()[0]
+    tree = HTMLTree.from_node(node)
+    tree_bytes = tracemalloc.get_traced_memory()[0] - before
+    del node
+    before = tracemalloc.get_traced_memory()[0]
+    blocks_tree = HTMLTree.from_blocks(markdown.split("\n"))
+    blocks_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    node_time = best_of(lambda: markdown_to_html_node(markdown).to_html(), repeat=3)
+    tree_time = best_of(tree.to_html, repeat=3)
+    blocks_time = best_of(lambda: HTMLTree.from_blocks(markdown.split("\n")).to_html(), repeat=3)
+    print(
+        f"ir {len(tree)} nós: HTMLNode {node_bytes / 1e6:6.1f} MB"
+        f"  HTMLTree {tree_bytes / 1e6:6.1f} MB {tree_time * 1000:7.1f} ms (só serializar)"
+    )
+    print(
+        f"ir página inteira: HTMLNode {node_time * 1000:7.1f} ms"
+        f"  from_blocks {len(blocks_tree)} nós {blocks_bytes / 1e6:6.1f} MB"
+        f" {blocks_time * 1000:7.1f} ms"
+    )
+
+
+def bench_frozen():
+    """
+    Mede páginas que repetem o mesmo menu e rodapé, com a moldura em
+    ParentNode comum e congelada com freeze().
+    """
+    def chrome():
+        links = [
+            ParentNode("li", [LeafNode("a", f"Seção {i}", {"href": f"/secao/{i}"})])
+            for i in range(200)
+        ]
+        return ParentNode("nav", [ParentNode("ul", links)]), ParentNode("footer", links[:50])
+
+    nav, footer = chrome()
+    frozen_nav, frozen_footer = (freeze(node) for node in chrome())
+    body = [LeafNode("p", paragraph) for paragraph in synthetic_document(5)]
+    plain = best_of(lambda: [
+        ParentNode("body", [nav, *body, footer]).to_html() for _ in range(1_000)
+    ])
+    frozen = best_of(lambda: [
+        ParentNode("body", [frozen_nav, *body, frozen_footer]).to_html() for _ in range(1_000)
+    ])
+    print(
+        f"frozen 1000 páginas: ParentNode {plain * 1000:8.1f} ms"
+        f"  FrozenNode {frozen * 1000:8.1f} ms  ({plain / frozen:.2f}x)"
+    )
+
+
+def parse_importtime(stderr):
+    """
+    Lê a saída de -X importtime e retorna uma lista (módulo, nível, próprio µs,
+    acumulado µs) dos módulos importados; o nível 0 são os imports de topo.
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((name.strip(), depth, int(own), int(cumulative)))
+    return modules
+
+
+def bench_startup(repeat=10):
+    """
+    Mede o tempo de início de comandos rápidos do main.py em processos novos,
+    com o cache de bytecode ativo (em um diretório temporário), e lista os
+    imports mais caros de cada um segundo -X importtime.
+    """
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    main_path = os.path.join(src_dir, "main.py")
+    template = os.path.join(os.path.dirname(os.path.dirname(src_dir)), "template.html")
+    with tempfile.TemporaryDirectory() as tempdir:
+        page = os.path.join(tempdir, "page.md")
+        with open(page, "w", encoding="utf-8") as fp:
+            fp.write("\n\n".join(synthetic_document(20)))
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=os.path.join(tempdir, "pycache"))
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        commands = {
+            "python -c pass": ["-c", "pass"],
+            "--version": [main_path, "--version"],
+            "render": [main_path, "render", page],
+            "render --template": [main_path, "render", page, "--template", template],
+        }
+        for name, args in commands.items():
+            def run(extra=()):
+                return subprocess.run(
+                    [sys.executable, *extra, *args], env=env, check=True,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                )
+            run()
+            elapsed = best_of(run, repeat)
+            modules = parse_importtime(run(("-X", "importtime")).stderr)
+            top = sorted((m for m in modules if m[1] == 0), key=lambda m: -m[3])
+            heaviest = ", ".join(f"{name} {total / 1000:.1f}" for name, _, _, total in top[:4])
+            print(f"startup {name:<18}: {elapsed * 1000:6.1f} ms  ({len(modules)} módulos; {heaviest} ms)")
+
+
+BENCHMARKS = {
+    "inline": bench_inline,
+    "rules": bench_rules,
+    "links": bench_link_scaling,
+    "nodes": bench_node_memory,
+    "convert": bench_convert,
+    "extract": bench_extract,
+    "ir": bench_ir,
+    "frozen": bench_frozen,
+    "startup": bench_startup,
+}
+
+
+def main(argv):
+    names = argv or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Benchmark desconhecido: {name}", file=sys.stderr)
+            return 1
+        BENCHMARKS[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
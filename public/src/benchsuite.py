@@ -0,0 +1,234 @@
+"""
+Suíte de benchmarks do pipeline de Markdown para HTML.
+
+Mede cada etapa separadamente (extract_markdown_*, split_nodes_*,
+text_to_textnodes, conversão e to_html) sobre corpora sintéticos
+reprodutíveis, grava os resultados em JSON e compara com um baseline
+salvo, falhando quando alguma etapa fica mais lenta que o limite. O
+baseline fica versionado em fixtures/, para que o CI compare com ele.
+
+benchmarks.py continua separado: ele compara implementações (antiga contra
+nova, dict contra slots) e só imprime os números, enquanto esta suíte mede
+sempre as mesmas etapas, com saída estável em JSON, e serve de portão de
+regressão.
+
+Uso:
+    python3 src/benchsuite.py [--corpus NOME ...] [--output results.json]
+                              [--baseline baseline.json] [--threshold 0.25]
+                              [--update-baseline]
+
+Usa apenas a biblioteca padrão e roda offline.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from benchmarks import WORDS, synthetic_paragraph
+from htmlnode import ParentNode, text_nodes_to_html, text_nodes_to_html_nodes
+from textnode import TextNode, TextType
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(SRC_DIR, "fixtures", "bench-baseline.json")
+RESULTS_VERSION = 1
+
+
+def link_dense_paragraph(rng, links=200):
+    """
+    Gera um parágrafo em que quase todo termo é um link ou uma imagem.
+    """
+    parts = []
+    for i in range(links):
+        word = rng.choice(WORDS)
+        if i % 10 == 0:
+            parts.append(f"![{word}](/img/{i}.png)")
+        else:
+            parts.append(f"[{word}](/pages/{word}-{i}.html)")
+    return " ".join(parts)
+
+
+class Corpus:
+    def __init__(self, name, paragraphs, nested=False):
+        self.name = name
+        self.paragraphs = paragraphs
+        self.nested = nested
+
+    def build_tree(self):
+        """
+        Monta a árvore HTML do corpus: uma "div" com um "p" por parágrafo ou,
+        para corpora aninhados, uma "section" dentro da outra.
+        """
+        blocks = [
+            ParentNode("p", text_nodes_to_html_nodes(TextNode.text_to_textnodes(paragraph)))
+            for paragraph in self.paragraphs
+        ]
+        if not self.nested:
+            return ParentNode("div", blocks)
+        node = ParentNode("section", [blocks[-1]])
+        for block in reversed(blocks[:-1]):
+            node = ParentNode("section", [block, node])
+        return node
+
+
+def make_corpora(seed=0):
+    """
+    Retorna os corpora sintéticos, sempre iguais para a mesma semente.
+    """
+    rng = random.Random(seed)
+    return {
+        "small": Corpus("small", [synthetic_paragraph(rng) for _ in range(20)]),
+        "medium": Corpus("medium", [synthetic_paragraph(rng) for _ in range(500)]),
+        "huge": Corpus("huge", [synthetic_paragraph(rng, words=400) for _ in range(2_000)]),
+        "link-dense": Corpus("link-dense", [link_dense_paragraph(rng) for _ in range(200)]),
+        "nested": Corpus(
+            "nested", [synthetic_paragraph(rng, words=20) for _ in range(2_000)], nested=True
+        ),
+    }
+
+
+def split_bold(nodes):
+    try:
+        return TextNode.split_nodes_delimiter(nodes, "**", TextType.BOLD)
+    except ValueError:
+        return nodes
+
+
+def stage_functions(corpus):
+    """
+    Retorna {etapa: função sem argumentos} para o corpus. O preparo (nós de
+    entrada, árvore HTML) fica fora das funções medidas.
+    """
+    paragraphs = corpus.paragraphs
+    text_nodes = [[TextNode(paragraph, TextType.TEXT)] for paragraph in paragraphs]
+    parsed = [TextNode.text_to_textnodes(paragraph) for paragraph in paragraphs]
+    tree = corpus.build_tree()
+    return {
+        "extract_markdown_images": lambda: [TextNode.extract_markdown_images(p) for p in paragraphs],
+        "extract_markdown_links": lambda: [TextNode.extract_markdown_links(p) for p in paragraphs],
+        "split_nodes_delimiter": lambda: [split_bold(nodes) for nodes in text_nodes],
+        "split_nodes_image": lambda: [TextNode.split_nodes_image(nodes) for nodes in text_nodes],
+        "split_nodes_link": lambda: [TextNode.split_nodes_link(nodes) for nodes in text_nodes],
+        "text_to_textnodes": lambda: [TextNode.text_to_textnodes(p) for p in paragraphs],
+        "text_nodes_to_html": lambda: [text_nodes_to_html(nodes) for nodes in parsed],
+        "to_html": tree.to_html,
+    }
+
+
+def time_stage(func, repeat):
+    """
+    Executa func repeat vezes e retorna o melhor tempo e a média, em segundos.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "mean": sum(times) / len(times)}
+
+
+def run_suite(corpora, repeat=5):
+    """
+    Mede todas as etapas de cada corpus.
+    
+    Returns:
+        Um dict pronto para ser gravado em JSON
+    """
+    results = {}
+    for name, corpus in corpora.items():
+        results[name] = {}
+        for stage, func in stage_functions(corpus).items():
+            results[name][stage] = time_stage(func, repeat)
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_results(current, baseline, threshold=0.25):
+    """
+    Compara os melhores tempos com o baseline.
+    
+    Args:
+        current: Resultados de run_suite
+        baseline: Resultados salvos anteriormente
+        threshold: Aumento relativo máximo aceito (0.25 = 25% mais lento)
+    
+    Returns:
+        Uma lista de tuplas (corpus, etapa, razão, regrediu) para as etapas
+        presentes nos dois resultados com tempo positivo no baseline
+    """
+    comparison = []
+    for corpus, stages in current["results"].items():
+        baseline_stages = baseline.get("results", {}).get(corpus, {})
+        for stage, timing in stages.items():
+            # Sem tempo positivo no baseline não há razão a calcular
+            if stage not in baseline_stages or baseline_stages[stage]["best"] <= 0:
+                continue
+            ratio = timing["best"] / baseline_stages[stage]["best"]
+            comparison.append((corpus, stage, ratio, ratio > 1 + threshold))
+    return comparison
+
+
+def print_results(results, comparison=None):
+    ratios = {(corpus, stage): (ratio, regressed) for corpus, stage, ratio, regressed in comparison or []}
+    for corpus, stages in results["results"].items():
+        for stage, timing in stages.items():
+            line = f"{corpus:<11} {stage:<24} {timing['best'] * 1000:10.2f} ms"
+            if (corpus, stage) in ratios:
+                ratio, regressed = ratios[(corpus, stage)]
+                line += f"  {ratio:5.2f}x baseline" + ("  REGRESSÃO" if regressed else "")
+            print(line)
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(data, fp, indent=1, sort_keys=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks por etapa do pipeline.")
+    parser.add_argument("--corpus", action="append",
+                        help="corpus a medir (pode repetir); padrão: todos")
+    parser.add_argument("--repeat", type=int, default=5, help="repetições por etapa")
+    parser.add_argument("--seed", type=int, default=0, help="semente dos corpora")
+    parser.add_argument("--output", help="grava os resultados neste arquivo JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="arquivo JSON do baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="aumento relativo máximo antes de acusar regressão")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="grava os resultados como novo baseline")
+    args = parser.parse_args(argv)
+
+    corpora = make_corpora(args.seed)
+    if args.corpus:
+        unknown = [name for name in args.corpus if name not in corpora]
+        if unknown:
+            parser.error(f"corpus desconhecido: {', '.join(unknown)}")
+        corpora = {name: corpora[name] for name in args.corpus}
+
+    results = run_suite(corpora, args.repeat)
+    comparison = None
+    if not args.update_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as fp:
+            comparison = compare_results(results, json.load(fp), args.threshold)
+    print_results(results, comparison)
+
+    if args.output:
+        write_json(args.output, results)
+    if args.update_baseline:
+        write_json(args.baseline, results)
+        print(f"Baseline gravado em {args.baseline}")
+    if comparison and any(regressed for *_, regressed in comparison):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+from enum import Enum
+import re
+
+from htmlnode import LeafNode, ParentNode, RawHTMLNode, text_nodes_to_html, text_nodes_to_html_nodes
+from textnode import TextNode
+
+
+class BlockType(Enum):
+    PARAGRAPH = "paragraph"
+    HEADING = "heading"
+    CODE = "code"
+    QUOTE = "quote"
+    UNORDERED_LIST = "unordered_list"
+    ORDERED_LIST = "ordered_list"
+
+
+HEADING_PATTERN = re.compile(r"(#{1,6}) ")
+ORDERED_ITEM_PATTERN = re.compile(r"\d+\. ")
+CODE_FENCE = "```"
+
+
+def text_to_children(text, cache=None, collect=None):
+    """
+    Converte o texto inline de um bloco em uma lista de HTMLNode. Com um
+    InlineCache, o HTML do texto vem do cache como um único RawHTMLNode.
+
+    Args:
+        collect: Função opcional chamada com os TextNode do texto, para quem
+            precisa deles (links, busca) sem tokenizar o texto de novo
+    """
+    if cache is not None:
+        return [RawHTMLNode(text_to_html(text, cache, collect))]
+    nodes = TextNode.text_to_textnodes(text)
+    if collect is not None:
+        collect(nodes)
+    return text_nodes_to_html_nodes(nodes) or [LeafNode(None, "")]
+
+
+def text_to_html(text, cache=None, collect=None):
+    """
+    Retorna diretamente o HTML do texto inline de um bloco, sem criar
+    HTMLNode (ver text_to_children).
+    """
+    if collect is None:
+        if cache is not None:
+            return cache.text_to_html(text)
+        return text_nodes_to_html(TextNode.text_to_textnodes(text))
+    nodes = cache.text_to_textnodes(text) if cache is not None else TextNode.text_to_textnodes(text)
+    collect(nodes)
+    return text_nodes_to_html(nodes)
+
+
+def heading_level(block):
+    """
+    Retorna o nível (1 a 6) se o bloco for um título "# ...", ou 0 caso contrário.
+    """
+    match = HEADING_PATTERN.match(block)
+    return len(match.group(1)) if match else 0
+
+
+def line_block_type(line):
+    """
+    Classifica uma linha não vazia pelo bloco que ela inicia ou continua.
+    """
+    if line.startswith(CODE_FENCE):
+        return BlockType.CODE
+    if HEADING_PATTERN.match(line):
+        return BlockType.HEADING
+    if line.startswith(">"):
+        return BlockType.QUOTE
+    if line.startswith("- ") or line.startswith("* "):
+        return BlockType.UNORDERED_LIST
+    if ORDERED_ITEM_PATTERN.match(line):
+        return BlockType.ORDERED_LIST
+    return BlockType.PARAGRAPH
+
+
+def iter_blocks(lines):
+    """
+    Agrupa as linhas de um documento Markdown em blocos, consumindo o
+    iterável uma linha por vez. Um arquivo aberto pode ser passado
+    diretamente, sem carregar o documento inteiro na memória.
+    
+    Args:
+        lines: Iterável de linhas (com ou sem "\\n" no final)
+    
+    Yields:
+        Tuplas (BlockType, linhas do bloco). Para blocos de código, as linhas
+        são o conteúdo entre as cercas ```
+    """
+    block_type = None
+    block_lines = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if block_type is BlockType.CODE:
+            if line.startswith(CODE_FENCE):
+                yield block_type, block_lines
+                block_type, block_lines = None, []
+            else:
+                block_lines.append(line)
+            continue
+        if not line.strip():
+            if block_lines:
+                yield block_type, block_lines
+            block_type, block_lines = None, []
+            continue
+        line_type = line_block_type(line)
+        if block_lines and (line_type is not block_type or line_type is BlockType.HEADING):
+            yield block_type, block_lines
+            block_lines = []
+        block_type = line_type
+        if line_type is not BlockType.CODE:
+            block_lines.append(line)
+    # Um bloco de código sem cerca de fechamento vai até o fim do documento
+    if block_lines or block_type is BlockType.CODE:
+        yield block_type, block_lines
+
+
+def join_lines(lines):
+    return " ".join(line.strip() for line in lines)
+
+
+def block_inline_texts(block_type, lines):
+    """
+    Retorna os textos inline de um bloco, sem os marcadores de Markdown: um
+    por item nas listas, nenhum em blocos de código e um nos demais.
+    """
+    if block_type is BlockType.HEADING:
+        return [lines[0][heading_level(lines[0]) + 1:].strip()]
+    if block_type is BlockType.CODE:
+        return []
+    if block_type is BlockType.QUOTE:
+        return [join_lines(line[1:] for line in lines)]
+    if block_type is BlockType.UNORDERED_LIST:
+        return [line[2:].strip() for line in lines]
+    if block_type is BlockType.ORDERED_LIST:
+        return [line.split(". ", 1)[1].strip() for line in lines]
+    return [join_lines(lines)]
+
+
+def block_to_html_node(block_type, lines, cache=None, collect=None):
+    """
+    Converte um bloco de iter_blocks em um ParentNode.
+    """
+    if block_type is BlockType.CODE:
+        code = "".join(line + "\n" for line in lines)
+        return ParentNode("pre", [LeafNode("code", code)])
+    texts = block_inline_texts(block_type, lines)
+    if block_type is BlockType.HEADING:
+        return ParentNode(
+            f"h{heading_level(lines[0])}", text_to_children(texts[0], cache, collect)
+        )
+    if block_type is BlockType.QUOTE:
+        return ParentNode("blockquote", text_to_children(texts[0], cache, collect))
+    if block_type is BlockType.UNORDERED_LIST:
+        return ParentNode(
+            "ul", [ParentNode("li", text_to_children(text, cache, collect)) for text in texts]
+        )
+    if block_type is BlockType.ORDERED_LIST:
+        return ParentNode(
+            "ol", [ParentNode("li", text_to_children(text, cache, collect)) for text in texts]
+        )
+    return ParentNode("p", text_to_children(texts[0], cache, collect))
+
+
+def iter_block_nodes(lines, cache=None, collect=None):
+    """
+    Gera um ParentNode por bloco, à medida que as linhas são lidas.
+    """
+    for block_type, block_lines in iter_blocks(lines):
+        yield block_to_html_node(block_type, block_lines, cache, collect)
+
+
+def markdown_to_html_node(markdown, cache=None, collect=None):
+    """
+    Converte um documento Markdown em um ParentNode "div" com um filho por bloco.
+    
+    Args:
+        markdown: String com o documento completo
+        cache: InlineCache opcional usado para o texto inline dos blocos
+        collect: Função opcional chamada com os TextNode de cada texto
+            inline, na ordem do documento (ver text_to_children)
+    """
+    children = list(iter_block_nodes(markdown.split("\n"), cache, collect))
+    if not children:
+        return LeafNode("div", "")
+    return ParentNode("div", children)
+
+
+def write_markdown_html(lines, fp, cache=None):
+    """
+    Converte Markdown em HTML escrevendo cada bloco em fp assim que ele é
+    lido; apenas um bloco fica na memória por vez.
+    
+    Args:
+        lines: Iterável de linhas, por exemplo um arquivo aberto
+        fp: Arquivo ou buffer de texto de saída
+        cache: InlineCache opcional usado para o texto inline dos blocos
+    """
+    fp.write("<div>")
+    for node in iter_block_nodes(lines, cache):
+        node.write_html(fp)
+    fp.write("</div>")
+
+
+def render_markdown_file(source_path, fp, cache=None):
+    """
+    Lê um arquivo Markdown linha a linha e escreve o HTML correspondente em fp.
+    """
+    with open(source_path, encoding="utf-8") as source:
+        write_markdown_html(source, fp, cache)
+
+
+def plain_text(text):
+    """
+    Retorna o texto inline sem a marcação de Markdown: o conteúdo de negrito,
+    itálico e código, o texto dos links e o alt das imagens.
+    """
+    return "".join([node.text for node in TextNode.text_to_textnodes(text)])
+
+
+def extract_title(markdown):
+    """
+    Retorna o texto do primeiro título "# " do documento, ou None se não houver.
+    Linhas dentro de blocos de código não são títulos.
+    """
+    for block_type, lines in iter_blocks(markdown.split("\n")):
+        if block_type is BlockType.HEADING and heading_level(lines[0]) == 1:
+            return block_inline_texts(block_type, lines)[0]
+    return None
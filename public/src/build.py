@@ -0,0 +1,569 @@
+"""
+Build incremental do site.
+
+Cada execução compara o hash de cada arquivo Markdown e do template com o
+manifesto salvo pela execução anterior, renderiza apenas as páginas cujas
+entradas mudaram e remove as páginas geradas cujo arquivo de origem não existe mais.
+"""
+import hashlib
+import json
+import os
+
+from blocks import extract_title, markdown_to_html_node, plain_text
+from htmlnode import escape_html
+from linkgraph import LinkIndex
+from templates import compile_template, load_template
+from textnode import TextType, inline_extension
+from writer import OutputWriter, remove_output, write_if_changed
+
+# assets e inline_cache só são importados quando usados, para que renderizar
+# uma única página (main.py render) não carregue o pipeline de build inteiro
+
+# Incrementar quando a saída do renderizador mudar, para forçar um build completo
+RENDERER_VERSION = 2
+MANIFEST_VERSION = 1
+
+
+class BuildResult:
+    def __init__(self):
+        self.rendered = []
+        self.skipped = []
+        self.deleted = []
+        self.errors = []
+        # Das páginas renderizadas, quais tiveram o arquivo gravado e quais
+        # já tinham o mesmo conteúdo no disco
+        self.written = []
+        self.unchanged = []
+        # Assets copiados (novos ou alterados) e removidos
+        self.assets = []
+        self.deleted_assets = []
+        # Tuplas (source, tipo, url) de links internos quebrados, com check_links
+        self.broken_links = []
+        # Das páginas renderizadas, as que vieram prontas do FragmentStore
+        self.cached = []
+
+    def __repr__(self):
+        return (
+            f"BuildResult(rendered={len(self.rendered)}, "
+            f"skipped={len(self.skipped)}, deleted={len(self.deleted)}, "
+            f"errors={len(self.errors)}, written={len(self.written)}, "
+            f"unchanged={len(self.unchanged)}, cached={len(self.cached)}, "
+            f"assets={len(self.assets)})"
+        )
+
+
+def content_hash(data):
+    """
+    Retorna o hash SHA-256 (hexadecimal) de uma string ou de bytes.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def empty_manifest():
+    return {
+        "version": MANIFEST_VERSION,
+        "renderer": RENDERER_VERSION,
+        "template": None,
+        "pages": {},
+        "assets": {},
+    }
+
+
+def load_manifest(path):
+    """
+    Lê o manifesto do build anterior. Um manifesto ausente, corrompido ou de
+    outra versão do renderizador equivale a um build do zero.
+    """
+    try:
+        with open(path, encoding="utf-8") as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        return empty_manifest()
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("renderer") != RENDERER_VERSION
+        or not isinstance(manifest.get("pages"), dict)
+    ):
+        return empty_manifest()
+    if not isinstance(manifest.get("assets"), dict):
+        manifest["assets"] = {}
+    return manifest
+
+
+def save_manifest(path, manifest):
+    """
+    Grava o manifesto de forma atômica (arquivo temporário + rename).
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.tmp"
+    # json.dumps sem indentação usa o encoder em C, bem mais rápido em sites grandes
+    with open(temp_path, "w", encoding="utf-8") as fp:
+        fp.write(json.dumps(manifest, sort_keys=True, separators=(",", ":")))
+    os.replace(temp_path, path)
+
+
+def find_pages(content_dir):
+    """
+    Retorna os caminhos relativos (com "/") de todos os arquivos .md, em ordem.
+    """
+    pages = []
+    for dirpath, dirnames, filenames in os.walk(content_dir):
+        for filename in filenames:
+            if filename.endswith(".md"):
+                full_path = os.path.join(dirpath, filename)
+                pages.append(os.path.relpath(full_path, content_dir).replace(os.sep, "/"))
+    return sorted(pages)
+
+
+def output_path_for(source):
+    """
+    Mapeia "blog/post.md" para "blog/post.html".
+    """
+    return source[:-len(".md")] + ".html"
+
+
+def render_page(markdown, template, default_title="", cache=None, collect=None, html_ir=False):
+    """
+    Renderiza uma página Markdown dentro do template, preenchendo os
+    marcadores {{ title }} e {{ content }}. O título entra sem a marcação
+    inline e com o HTML escapado.
+    
+    Args:
+        template: Um Template compilado ou o texto do template
+        collect: Função opcional chamada com os TextNode de cada texto
+            inline do conteúdo (ver markdown_to_html_node)
+        html_ir: Se True, monta o conteúdo como HTMLTree (htmlir), sem a
+            árvore de HTMLNode; o HTML é o mesmo
+    """
+    if isinstance(template, str):
+        template = compile_template(template)
+    title = escape_html(plain_text(extract_title(markdown) or default_title))
+    if html_ir:
+        from htmlir import HTMLTree
+
+        content = HTMLTree.from_blocks(markdown.split("\n"), cache, collect).to_html()
+    else:
+        content = markdown_to_html_node(markdown, cache, collect).to_html()
+    return template.render({"title": title, "content": content})
+
+
+def pages_key(template, assets=None):
+    """
+    Hash das entradas comuns a todas as páginas: o template e, quando ativos,
+    a minificação, os assets referenciados pelo template e as regras inline
+    opcionais. Quando ele muda, todas as páginas são renderizadas de novo.
+    """
+    key = template.digest
+    if assets is not None:
+        key += assets.key(template.source())
+    extension = inline_extension()
+    if extension is not None:
+        key += f"inline:{extension.key}"
+    return key if key == template.digest else content_hash(key)
+
+
+def page_entry(source, markdown, assets=None):
+    """
+    Monta a entrada de uma página no manifesto: o hash do Markdown, o arquivo
+    de saída e, se houver, os nomes com hash dos assets que ela referencia.
+    Um asset alterado muda só a entrada das páginas que o usam.
+
+    A chave "assets" é opcional, então manifestos anteriores continuam
+    válidos (MANIFEST_VERSION não muda): uma entrada antiga só difere da
+    nova quando a página referencia assets, e nesse caso a página é
+    renderizada de novo uma vez.
+    """
+    entry = {"hash": content_hash(markdown), "output": output_path_for(source)}
+    references = assets.page_references(markdown) if assets is not None else []
+    if references:
+        entry["assets"] = references
+    return entry
+
+
+class PageCollector:
+    """
+    Recolhe, enquanto uma página é renderizada, os links e imagens e o texto
+    dos TextNode já gerados, para que os índices de links e de busca não
+    tokenizem o Markdown de novo, em série, no processo principal.
+    """
+    __slots__ = ("links", "texts")
+
+    def __init__(self, collect):
+        """
+        Args:
+            collect: Nomes do que recolher: "links" e/ou "terms"
+        """
+        self.links = [] if "links" in collect else None
+        self.texts = [] if "terms" in collect else None
+
+    def __call__(self, nodes):
+        links = self.links
+        texts = self.texts
+        for node in nodes:
+            if links is not None and (
+                node.text_type is TextType.LINK or node.text_type is TextType.IMAGE
+            ):
+                links.append([node.text_type.value, node.url])
+            if texts is not None:
+                texts.append(node.text)
+
+    def result(self):
+        """
+        Retorna {"links": [[tipo, url], ...], "terms": {termo: frequência}},
+        com None no que não foi recolhido.
+        """
+        terms = None
+        if self.texts is not None:
+            from search import count_terms
+
+            terms = dict(count_terms(self.texts))
+        return {"links": self.links, "terms": terms}
+
+
+# Template, cache inline, assets e o que recolher das páginas no processo de
+# renderização, definidos uma vez por worker
+_worker_template = None
+_worker_cache = None
+_worker_assets = None
+_worker_collect = ()
+
+
+def _init_worker(template, cache_size=0, cache_path=None, assets=None, inline_rules=None,
+                 collect=()):
+    global _worker_template, _worker_cache, _worker_assets, _worker_collect
+    if isinstance(template, str):
+        template = compile_template(template)
+    # Workers iniciados sem fork não herdam as regras inline ativas do
+    # processo principal; None mantém as regras atuais
+    extension = inline_extension()
+    if inline_rules is not None and tuple(inline_rules) != (
+        extension.names if extension is not None else ()
+    ):
+        from inline_rules import enable_rules
+
+        enable_rules(inline_rules)
+    _worker_template = template
+    _worker_assets = assets
+    _worker_collect = tuple(collect)
+    _worker_cache = None
+    if cache_size > 0:
+        from inline_cache import InlineCache
+
+        _worker_cache = InlineCache(cache_size)
+    if _worker_cache is not None and cache_path:
+        _worker_cache.load(cache_path)
+
+
+def render_job(job):
+    """
+    Renderiza uma página (source, markdown, default_title) com o template do
+    worker. Erros são devolvidos em vez de propagados, para que uma página com
+    problema não interrompa as demais.
+    
+    Returns:
+        Uma tupla (source, html, erro, recolhido), com html ou erro igual a
+        None e, se o worker recolhe links ou termos, recolhido igual a
+        PageCollector.result() (None nos demais casos)
+    """
+    source, markdown, default_title = job
+    collector = PageCollector(_worker_collect) if _worker_collect else None
+    try:
+        html = render_page(markdown, _worker_template, default_title, _worker_cache, collector)
+        if _worker_assets is not None:
+            html = _worker_assets.finish_page(html)
+        return source, html, None, collector.result() if collector is not None else None
+    except Exception as error:
+        return source, None, f"{type(error).__name__}: {error}", None
+
+
+def render_pages(jobs, template, workers=1, chunksize=16, cache_size=0, cache_path=None,
+                 profiler=None, assets=None, collect=()):
+    """
+    Renderiza as páginas, em série ou distribuídas em um ProcessPoolExecutor.
+    
+    Args:
+        jobs: Lista de tuplas (source, markdown, default_title)
+        template: Template compilado (ou texto do template) das páginas
+        workers: Número de processos; 1 renderiza no próprio processo e
+            None usa todos os núcleos
+        chunksize: Quantidade de páginas enviadas a um worker por vez
+        cache_size: Tamanho do InlineCache de cada worker (0 desativa)
+        cache_path: Arquivo do InlineCache persistido entre builds. Os workers
+            de um pool apenas o leem; ele só é gravado no modo em série
+        profiler: BuildProfiler opcional; com ele as páginas são renderizadas
+            em série, no próprio processo, para que cada uma seja medida
+        assets: AssetPipeline opcional que pós-processa o HTML de cada página
+        collect: O que recolher de cada página na renderização ("links",
+            "terms"); ver PageCollector
+    
+    Returns:
+        Uma lista de tuplas (source, html, erro, recolhido) na mesma ordem
+        de jobs, independente da ordem em que os workers terminam
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if profiler is not None:
+        _init_worker(template, cache_size, cache_path, assets, collect=collect)
+        results = []
+        with profiler.instrument():
+            for job in jobs:
+                with profiler.page(job[0]) as stats:
+                    results.append(render_job(job))
+                if results[-1][1] is not None:
+                    stats.bytes = len(results[-1][1].encode("utf-8"))
+        return results
+    if workers <= 1 or len(jobs) <= 1:
+        _init_worker(template, cache_size, cache_path, assets, collect=collect)
+        results = [render_job(job) for job in jobs]
+        if _worker_cache is not None and cache_path and jobs:
+            _worker_cache.save(cache_path)
+        return results
+    # Importado só aqui: multiprocessing pesa no início de comandos rápidos
+    from concurrent.futures import ProcessPoolExecutor
+
+    extension = inline_extension()
+    inline_rules = extension.names if extension is not None else ()
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(jobs)),
+        initializer=_init_worker,
+        initargs=(template, cache_size, cache_path, assets, inline_rules, tuple(collect)),
+    ) as executor:
+        return list(executor.map(render_job, jobs, chunksize=max(1, chunksize)))
+
+
+def update_indexes(links, search, source, markdown, entry, default_title, collected=None):
+    """
+    Atualiza os índices de links e de busca (cada um pode ser None) de uma
+    página. Sem o que foi recolhido na renderização (página pulada, vinda do
+    FragmentStore ou com erro), o Markdown só é lido se o índice da página
+    estiver desatualizado.
+    """
+    collected = collected or {}
+    if links is not None:
+        links.update(source, markdown, entry["hash"], collected.get("links"))
+    if search is not None:
+        search.update(
+            source, markdown, entry["hash"], f"/{entry['output']}", default_title,
+            collected.get("terms"),
+        )
+
+
+def build_site(content_dir, template_path, output_dir, manifest_path, force=False,
+               workers=1, chunksize=16, inline_cache_size=4096, inline_cache_path=None,
+               profiler=None, write_workers=4, assets=None, link_index_path=None,
+               check_links=False, fragment_store=None, search_index_path=None):
+    """
+    Gera o site de forma incremental.
+    
+    Args:
+        content_dir: Diretório com os arquivos Markdown
+        template_path: Caminho do template HTML (compilado uma vez e mantido
+            em cache enquanto ele e seus includes não mudarem)
+        output_dir: Diretório onde as páginas são gravadas
+        manifest_path: Caminho do manifesto JSON do build
+        force: Se True, renderiza todas as páginas e copia todos os assets; o
+            manifesto anterior ainda é lido para remover as saídas órfãs
+        workers: Número de processos de renderização (None usa todos os núcleos)
+        chunksize: Quantidade de páginas enviadas a um worker por vez
+        inline_cache_size: Tamanho do cache de parágrafos inline (0 desativa)
+        inline_cache_path: Arquivo opcional para persistir o cache entre builds
+        profiler: BuildProfiler opcional que mede cada página (força o modo em série)
+        write_workers: Threads que gravam os arquivos (0 grava na thread principal)
+        assets: AssetPipeline opcional com os assets e o pós-processamento do HTML
+        link_index_path: Arquivo do índice de links, atualizado apenas para as
+            páginas cujo hash mudou (None não mantém o índice)
+        check_links: Se True, verifica os links internos e as imagens de todas
+            as páginas e preenche result.broken_links
+        fragment_store: FragmentStore opcional; páginas já renderizadas com o
+            mesmo Markdown, template e versão do renderizador vêm dele
+        search_index_path: Arquivo com o estado do índice de busca; com ele, o
+            índice é atualizado para as páginas alteradas e gravado em
+            output_dir/search (None não gera o índice)
+    
+    Returns:
+        Um BuildResult com as páginas renderizadas, puladas, removidas e com erro
+    """
+    template = load_template(template_path)
+    # Com force o manifesto não decide o que pular, mas continua indicando
+    # as saídas de páginas e assets que deixaram de existir
+    old_manifest = load_manifest(manifest_path)
+    old_pages = old_manifest["pages"]
+    manifest = empty_manifest()
+    result = BuildResult()
+    
+    # Sem pipeline, as cópias com hash de um build anterior são removidas
+    if assets is None:
+        from assets import AssetPipeline
+
+        assets = AssetPipeline()
+    manifest["assets"], result.assets, result.deleted_assets = assets.process(
+        output_dir, old_manifest["assets"], force
+    )
+    template_hash = pages_key(template, assets)
+    template_changed = force or old_manifest["template"] != template_hash
+    manifest["template"] = template_hash
+    
+    links = None
+    if link_index_path:
+        links = LinkIndex.load(link_index_path)
+    elif check_links:
+        links = LinkIndex()
+    
+    search = None
+    if search_index_path:
+        from search import SearchIndex
+
+        search = SearchIndex.load(search_index_path)
+    # Os links e os termos das páginas renderizadas vêm da própria renderização
+    collect = tuple(
+        name for name, index in (("links", links), ("terms", search)) if index is not None
+    )
+    
+    sources = find_pages(content_dir)
+    jobs = []
+    cached = []
+    fragment_keys = {}
+    for source in sources:
+        with open(os.path.join(content_dir, source), encoding="utf-8") as fp:
+            markdown = fp.read()
+        entry = page_entry(source, markdown, assets)
+        manifest["pages"][source] = entry
+        default_title = os.path.splitext(os.path.basename(source))[0]
+        
+        if (
+            not template_changed
+            and old_pages.get(source) == entry
+            and os.path.exists(os.path.join(output_dir, entry["output"]))
+        ):
+            update_indexes(links, search, source, markdown, entry, default_title)
+            result.skipped.append(source)
+            continue
+        
+        if fragment_store is not None:
+            key = fragment_store.key(
+                RENDERER_VERSION, template_hash, default_title, markdown, entry.get("assets", ""),
+            )
+            html = fragment_store.get(key)
+            if html is not None:
+                update_indexes(links, search, source, markdown, entry, default_title)
+                cached.append((source, html, None, None))
+                result.cached.append(source)
+                continue
+            fragment_keys[source] = key
+        jobs.append((source, markdown, default_title))
+    
+    rendered = render_pages(
+        jobs, template, workers, chunksize, inline_cache_size, inline_cache_path, profiler,
+        assets, collect,
+    )
+    # render_pages mantém a ordem de jobs
+    for (source, markdown, default_title), (_, _, _, collected) in zip(jobs, rendered):
+        update_indexes(
+            links, search, source, markdown, manifest["pages"][source], default_title, collected,
+        )
+    if fragment_store is not None:
+        for source, html, error, _ in rendered:
+            if error is None:
+                fragment_store.put(fragment_keys[source], html)
+        rendered = sorted(rendered + cached, key=lambda item: item[0])
+    with OutputWriter(write_workers) as writer:
+        for source, html, error, _ in rendered:
+            if error is not None:
+                # Sem entrada no manifesto, a página é tentada de novo no próximo build
+                del manifest["pages"][source]
+                result.errors.append((source, error))
+                continue
+            output_path = os.path.join(output_dir, manifest["pages"][source]["output"])
+            writer.submit(output_path, html, source)
+            result.rendered.append(source)
+    for source, error in writer.errors:
+        del manifest["pages"][source]
+        result.rendered.remove(source)
+        result.errors.append((source, error))
+    result.written = writer.written
+    result.unchanged = writer.unchanged
+    
+    # Páginas que sumiram do conteúdo têm a saída removida
+    sources = set(sources)
+    for source, entry in old_pages.items():
+        if source not in sources:
+            remove_output(os.path.join(output_dir, entry["output"]), output_dir)
+            result.deleted.append(source)
+    
+    save_manifest(manifest_path, manifest)
+    if fragment_store is not None:
+        fragment_store.trim()
+    if search is not None:
+        from search import SEARCH_DIR
+
+        # Páginas com erro ficam fora do índice até renderizarem
+        search.prune(manifest["pages"])
+        search.write(os.path.join(output_dir, SEARCH_DIR))
+        search.save(search_index_path)
+    if links is not None:
+        links.prune(sources)
+        if link_index_path:
+            links.save(link_index_path)
+        if check_links:
+            outputs = [entry["output"] for entry in manifest["pages"].values()]
+            result.broken_links = links.check(output_dir, outputs, assets.mapping)
+    return result
+
+
+def update_pages(content_dir, template_path, output_dir, manifest_path, sources, cache=None,
+                 assets=None):
+    """
+    Re-renderiza apenas as páginas indicadas, sem ler nem hashear o restante
+    do conteúdo. Páginas que não existem mais têm a saída removida. Se o
+    template mudou desde o último build, faz um build incremental completo.
+    
+    Args:
+        sources: Caminhos relativos (com "/") das páginas alteradas ou removidas
+        cache: InlineCache opcional, reaproveitado entre chamadas
+        assets: AssetPipeline opcional; os assets não são reprocessados, apenas
+            as referências do último build são aplicadas às páginas
+    
+    Returns:
+        Um BuildResult com as páginas renderizadas, removidas e com erro
+    """
+    template = load_template(template_path)
+    manifest = load_manifest(manifest_path)
+    if assets is None:
+        from assets import AssetPipeline
+
+        assets = AssetPipeline()
+    assets.load(manifest["assets"])
+    if manifest["template"] != pages_key(template, assets):
+        return build_site(content_dir, template_path, output_dir, manifest_path, assets=assets)
+    
+    result = BuildResult()
+    for source in sorted(set(sources)):
+        source_path = os.path.join(content_dir, source)
+        if not os.path.exists(source_path):
+            entry = manifest["pages"].pop(source, None)
+            if entry is not None:
+                remove_output(os.path.join(output_dir, entry["output"]), output_dir)
+                result.deleted.append(source)
+            continue
+        with open(source_path, encoding="utf-8") as fp:
+            markdown = fp.read()
+        default_title = os.path.splitext(os.path.basename(source))[0]
+        try:
+            html = assets.finish_page(render_page(markdown, template, default_title, cache))
+        except Exception as error:
+            manifest["pages"].pop(source, None)
+            result.errors.append((source, f"{type(error).__name__}: {error}"))
+            continue
+        entry = page_entry(source, markdown, assets)
+        if write_if_changed(os.path.join(output_dir, entry["output"]), html):
+            result.written.append(source)
+        else:
+            result.unchanged.append(source)
+        manifest["pages"][source] = entry
+        result.rendered.append(source)
+    
+    save_manifest(manifest_path, manifest)
+    return result
@@ -0,0 +1,243 @@
+"""
+Modo de desenvolvimento: observa o diretório de conteúdo, re-renderiza só as
+páginas alteradas e serve o diretório de saída com recarga automática no
+navegador (Server-Sent Events).
+
+A observação é feita por polling de mtime/tamanho com os.scandir, que não
+depende de bibliotecas externas e custa poucos milissegundos por varredura
+mesmo em sites grandes.
+"""
+import functools
+import os
+import sys
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from build import build_site, update_pages
+from inline_cache import InlineCache
+from templates import load_template
+
+RELOAD_PATH = "/__reload"
+RELOAD_SCRIPT = (
+    f'<script>new EventSource("{RELOAD_PATH}").onmessage = '
+    "function () { location.reload(); };</script>"
+)
+
+
+def snapshot(content_dir):
+    """
+    Retorna {caminho relativo: (mtime_ns, tamanho)} de todos os arquivos .md.
+    """
+    files = {}
+    stack = [(content_dir, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            # Links simbólicos para diretórios não são seguidos: um ciclo
+            # faria a varredura nunca terminar
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((entry.path, f"{prefix}{entry.name}/"))
+            elif entry.name.endswith(".md"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Link quebrado ou arquivo removido durante a varredura
+                    continue
+                files[prefix + entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def changed_sources(old, new):
+    """
+    Retorna, em ordem, as páginas criadas, alteradas ou removidas entre dois snapshots.
+    """
+    changed = [source for source, stat in new.items() if old.get(source) != stat]
+    removed = [source for source in old if source not in new]
+    return sorted(changed + removed)
+
+
+class ReloadNotifier:
+    """
+    Contador de versões do site; os clientes de recarga esperam a versão mudar.
+    """
+    def __init__(self):
+        self.version = 0
+        self.condition = threading.Condition()
+
+    def notify(self):
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    def wait(self, version, timeout=None):
+        """
+        Bloqueia até a versão ser diferente de version (ou até o timeout) e
+        retorna a versão atual.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+def inject_reload_script(html):
+    """
+    Insere o script de recarga antes de </body>, ou no fim se não houver </body>.
+    """
+    index = html.rfind("</body>")
+    if index == -1:
+        return html + RELOAD_SCRIPT
+    return html[:index] + RELOAD_SCRIPT + html[index:]
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, notifier=None, **kwargs):
+        self.notifier = notifier
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        if self.path == RELOAD_PATH:
+            self.send_reload_events()
+            return
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            path = os.path.join(path, "index.html")
+        if path.endswith(".html") and os.path.isfile(path):
+            self.send_html(path)
+            return
+        super().do_GET()
+
+    def send_html(self, path):
+        with open(path, encoding="utf-8") as fp:
+            body = inject_reload_script(fp.read()).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_reload_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        version = self.notifier.version
+        try:
+            while True:
+                current = self.notifier.wait(version, timeout=15)
+                if current == version:
+                    # Comentário SSE apenas para detectar conexões fechadas
+                    self.wfile.write(b": ping\n\n")
+                else:
+                    version = current
+                    self.wfile.write(b"data: reload\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(output_dir, notifier, host="127.0.0.1", port=8000):
+    handler = functools.partial(DevRequestHandler, directory=output_dir, notifier=notifier)
+    return ThreadingHTTPServer((host, port), handler)
+
+
+class Watcher:
+    """
+    Compara snapshots do conteúdo e do template a cada poll e re-renderiza
+    apenas o que mudou.
+    """
+    def __init__(self, content_dir, template_path, output_dir, manifest_path, notifier=None,
+                 assets=None):
+        self.content_dir = content_dir
+        self.template_path = template_path
+        self.output_dir = output_dir
+        self.manifest_path = manifest_path
+        self.notifier = notifier
+        self.assets = assets
+        self.cache = InlineCache()
+        self.files = snapshot(content_dir)
+        self.template = load_template(template_path)
+
+    def poll(self):
+        """
+        Verifica mudanças uma vez.
+        
+        Returns:
+            Um BuildResult se algo foi re-renderizado, ou None se nada mudou
+        """
+        files = snapshot(self.content_dir)
+        # O loader só recompila se o template ou um include mudou de mtime
+        template = load_template(self.template_path)
+        sources = changed_sources(self.files, files)
+        template_changed = template is not self.template
+        self.files = files
+        self.template = template
+        if template_changed:
+            # Com o template alterado, todas as páginas precisam ser montadas de novo
+            result = build_site(
+                self.content_dir, self.template_path, self.output_dir, self.manifest_path,
+                assets=self.assets,
+            )
+        elif sources:
+            result = update_pages(
+                self.content_dir, self.template_path, self.output_dir,
+                self.manifest_path, sources, self.cache, self.assets,
+            )
+        else:
+            return None
+        if self.notifier is not None:
+            self.notifier.notify()
+        return result
+
+    def run(self, interval=0.05):
+        """
+        Chama poll a cada interval segundos. Um erro (por exemplo, um include
+        ausente no template salvo) é mostrado uma vez e a observação continua,
+        até o arquivo ser corrigido.
+        """
+        last_error = None
+        while True:
+            started = time.perf_counter()
+            try:
+                result = self.poll()
+            except Exception as error:
+                message = f"{type(error).__name__}: {error}"
+                if message != last_error:
+                    print(f"Erro ao atualizar o site: {message}", file=sys.stderr, flush=True)
+                    last_error = message
+            else:
+                last_error = None
+                if result is not None:
+                    elapsed = (time.perf_counter() - started) * 1000
+                    print(f"{result} em {elapsed:.0f} ms", flush=True)
+            time.sleep(interval)
+
+
+def serve(content_dir, template_path, output_dir, manifest_path,
+          host="127.0.0.1", port=8000, interval=0.05, assets=None):
+    """
+    Faz um build incremental, serve output_dir e observa o conteúdo até Ctrl+C.
+    """
+    result = build_site(content_dir, template_path, output_dir, manifest_path, assets=assets)
+    print(result, flush=True)
+    notifier = ReloadNotifier()
+    server = make_server(output_dir, notifier, host, port)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    print(f"Servindo {output_dir} em http://{host}:{server.server_address[1]}/", flush=True)
+    watcher = Watcher(content_dir, template_path, output_dir, manifest_path, notifier, assets)
+    try:
+        watcher.run(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,209 @@
+"""
+Armazenamento de páginas renderizadas endereçado por conteúdo.
+
+Cada página é guardada em um arquivo cujo nome é o hash de tudo o que
+determina o HTML: a versão do renderizador, o template (com os assets) e o
+Markdown. O diretório pode ser compartilhado por vários processos de build
+e exportado/importado como tarball, para que um runner de CI novo comece
+com as páginas já renderizadas.
+
+A evicção é LRU por tamanho total: cada leitura atualiza o mtime do arquivo,
+e os arquivos usados há mais tempo são removidos primeiro.
+"""
+import hashlib
+import os
+import re
+import tarfile
+import time
+
+from writer import write_if_changed
+
+try:
+    import fcntl
+except ImportError:  # Windows: a evicção roda sem trava entre processos
+    fcntl = None
+
+OBJECT_NAME = re.compile(r"objects/[0-9a-f]{2}/[0-9a-f]{62}\.html")
+# Arquivos temporários de gravações interrompidas são removidos depois disso
+STALE_TEMP_SECONDS = 3600
+
+
+class FragmentStore:
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            directory: Diretório do armazenamento (criado se não existir)
+            max_bytes: Tamanho total máximo; trim() remove os menos usados
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        # Gravações que falharam (armazenamento somente leitura ou cheio)
+        self.failed_writes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(*parts):
+        """
+        Retorna o hash SHA-256 (hexadecimal) das partes, separadas sem ambiguidade.
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            data = str(part).encode("utf-8")
+            digest.update(b"%d:" % len(data))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def object_path(self, key):
+        return os.path.join(self.directory, "objects", key[:2], f"{key[2:]}.html")
+
+    def get(self, key):
+        """
+        Retorna o HTML guardado para key, ou None.
+        """
+        path = self.object_path(key)
+        try:
+            with open(path, encoding="utf-8") as fp:
+                html = fp.read()
+        except FileNotFoundError:
+            # Ausente ou removido por uma evicção concorrente
+            self.misses += 1
+            return None
+        try:
+            # O mtime marca o último uso, para a evicção LRU
+            os.utime(path)
+        except OSError:
+            # Em um armazenamento somente leitura (cache compartilhado, CI)
+            # o HTML continua válido; só a ordem da evicção fica sem atualizar
+            pass
+        self.hits += 1
+        return html
+
+    def put(self, key, html):
+        """
+        Guarda o HTML de key. A gravação é atômica, então outro processo
+        nunca lê um arquivo pela metade; duas gravações da mesma chave têm o
+        mesmo conteúdo. Uma falha de gravação não interrompe o build: a
+        página só deixa de ser guardada.
+        """
+        try:
+            if write_if_changed(self.object_path(key), html):
+                self.writes += 1
+        except OSError:
+            self.failed_writes += 1
+
+    def objects(self):
+        """
+        Gera tuplas (caminho relativo, caminho, stat) dos arquivos guardados,
+        removendo os temporários abandonados.
+        """
+        root = os.path.join(self.directory, "objects")
+        now = time.time()
+        try:
+            prefixes = sorted(os.listdir(root))
+        except FileNotFoundError:
+            return
+        for prefix in prefixes:
+            try:
+                entries = list(os.scandir(os.path.join(root, prefix)))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.endswith(".tmp"):
+                    if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                        remove_file(entry.path)
+                    continue
+                yield f"objects/{prefix}/{entry.name}", entry.path, stat
+
+    def size(self):
+        return sum(stat.st_size for _, _, stat in self.objects())
+
+    def trim(self):
+        """
+        Remove os arquivos usados há mais tempo até o total caber em
+        max_bytes. Se outro processo já está fazendo a evicção, ou se a trava
+        não pode ser criada (armazenamento somente leitura), não faz nada.
+
+        Returns:
+            O número de arquivos removidos
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            lock = open(os.path.join(self.directory, "trim.lock"), "w")
+        except OSError:
+            return 0
+        with lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return 0
+            objects = sorted(self.objects(), key=lambda item: item[2].st_mtime)
+            total = sum(stat.st_size for _, _, stat in objects)
+            removed = 0
+            for _, path, stat in objects:
+                if total <= self.max_bytes:
+                    break
+                remove_file(path)
+                total -= stat.st_size
+                removed += 1
+        self.evictions += removed
+        return removed
+
+    def export_tarball(self, path):
+        """
+        Grava todos os arquivos guardados em um tarball .tar.gz.
+
+        Returns:
+            O número de arquivos exportados
+        """
+        count = 0
+        with tarfile.open(path, "w:gz") as tar:
+            for name, object_path, _ in self.objects():
+                try:
+                    tar.add(object_path, arcname=name, recursive=False)
+                except FileNotFoundError:
+                    continue
+                count += 1
+        return count
+
+    def import_tarball(self, path):
+        """
+        Importa os arquivos de um tarball criado por export_tarball. Entradas
+        com outros nomes (ou que não são arquivos) são ignoradas, então o
+        tarball nunca grava fora do armazenamento.
+
+        Returns:
+            O número de arquivos importados
+        """
+        count = 0
+        with tarfile.open(path, "r:*") as tar:
+            for member in tar:
+                if not member.isfile() or not OBJECT_NAME.fullmatch(member.name):
+                    continue
+                data = tar.extractfile(member).read()
+                write_if_changed(os.path.join(self.directory, *member.name.split("/")), data)
+                count += 1
+        return count
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "failed_writes": self.failed_writes,
+            "evictions": self.evictions,
+        }
+
+
+def remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,353 @@
+"""
+Fuzzing e testes de escala do parser Markdown com entradas patológicas.
+
+Gera entradas aleatórias (com semente) e famílias de entradas patológicas
+(milhares de "[" ou "**" sem fechamento, links aninhados, etc.) e verifica
+para cada uma:
+
+- que nenhuma etapa lança exceções inesperadas nem passa do limite de tempo;
+- que o tokenizador de passagem única e o pipeline antigo dão o mesmo resultado;
+- que extract_markdown_spans concorda com extract_markdown_images/links;
+- que o tempo cresce linearmente com o tamanho da entrada.
+
+Casos que falham são reduzidos e gravados como fixtures JSON, repetidas a
+cada execução e pelos testes (test_fuzz.py).
+
+Uso:
+    python3 src/fuzz.py [--seed 0] [--iterations 2000] [--max-size 400]
+                        [--scale 4000] [--fixtures DIR] [--no-scaling]
+
+Usa apenas a biblioteca padrão.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+
+from blocks import markdown_to_html_node
+from textnode import TextNode, TextType
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FIXTURES = os.path.join(SRC_DIR, "fixtures", "fuzz")
+FIXTURE_VERSION = 1
+
+# Limite de tempo de uma verificação: uma base fixa mais um custo por caractere
+TIME_BASE = 0.1
+TIME_PER_CHAR = 10e-6
+# Crescimento máximo do tempo por unidade de tamanho entre as duas medições
+# de escala (1.0 é perfeitamente linear)
+MAX_SCALING_RATIO = 2.5
+# O pipeline antigo é quadrático em algumas entradas; a paridade só é
+# verificada até este tamanho
+PARITY_MAX_LENGTH = 20_000
+
+# Pedaços usados pelas entradas aleatórias, com peso maior para a sintaxe
+FRAGMENTS = (
+    ["[", "]", "(", ")", "![", "](", "*", "**", "`", "\\"] * 3
+    + ["a", "b", "url", " ", " ", "\n", "\n\n", "# ", "- ", "1. ", "> ", "```"]
+)
+
+# Famílias de entradas patológicas: nome -> função(n) que gera a entrada com n repetições
+PATHOLOGICAL = {
+    "unclosed-bracket": lambda n: "[" * n,
+    "unclosed-image": lambda n: "![" * n,
+    "unclosed-link-url": lambda n: "[a](" * n,
+    "unclosed-bold": lambda n: "**" * n + "*",
+    "unclosed-code": lambda n: "`a " * (2 * n + 1),
+    "nested-brackets": lambda n: "[" * n + "a" + "]" * n + "(" * n + "b" + ")" * n,
+    "bracket-runs": lambda n: "[a" * n + "](" + "b" * n,
+    "mixed-delimiters": lambda n: "*`**" * n,
+    "many-links": lambda n: "x [a](b) ![c](d)" * n,
+    "bold-words": lambda n: "**a** *b* `c` " * n,
+}
+
+
+def random_markdown(rng, max_size):
+    """
+    Gera um texto com até max_size pedaços de FRAGMENTS.
+    """
+    return "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, max_size)))
+
+
+def check_parity(text):
+    if len(text) > PARITY_MAX_LENGTH:
+        return
+    new = TextNode.tokenize_inline(text)
+    old = TextNode.text_to_textnodes_legacy(text)
+    if new != old:
+        raise AssertionError(f"tokenize_inline {new!r} != legacy {old!r}")
+
+
+def check_spans(text):
+    spans = TextNode.extract_markdown_spans(text)
+    images = [(label, url) for kind, _, _, label, url in spans if kind is TextType.IMAGE]
+    if images != TextNode.extract_markdown_images(text):
+        raise AssertionError(f"spans {images!r} != extract_markdown_images")
+    # extract_markdown_links também devolve links sobrepostos a imagens; a
+    # referência é a separação do pipeline antigo (imagens primeiro)
+    nodes = TextNode.split_nodes_link(TextNode.split_nodes_image([TextNode(text, TextType.TEXT)]))
+    expected = [(node.text_type, node.text, node.url) for node in nodes
+                if node.text_type is not TextType.TEXT]
+    found = [(kind, label, url) for kind, _, _, label, url in spans]
+    if found != expected:
+        raise AssertionError(f"spans {found!r} != split_nodes_image/link {expected!r}")
+    for _, start, end, label, url in spans:
+        if not text[start:end].endswith(f"[{label}]({url})"):
+            raise AssertionError(f"posição errada: {text[start:end]!r}")
+
+
+def check_delimiter(text):
+    # O único erro esperado de split_nodes_delimiter é ValueError (delimitador ímpar)
+    for delimiter, text_type in (("**", TextType.BOLD), ("*", TextType.ITALIC), ("`", TextType.CODE)):
+        try:
+            TextNode.split_nodes_delimiter([TextNode(text, TextType.TEXT)], delimiter, text_type)
+        except ValueError:
+            pass
+
+
+def check_render(text):
+    markdown_to_html_node(text).to_html()
+
+
+CHECKS = {
+    "parity": check_parity,
+    "spans": check_spans,
+    "delimiter": check_delimiter,
+    "render": check_render,
+}
+
+# Funções medidas no teste de escala
+SCALING_FUNCTIONS = {
+    "tokenize_inline": TextNode.tokenize_inline,
+    "extract_markdown_spans": TextNode.extract_markdown_spans,
+    "markdown_to_html": lambda text: markdown_to_html_node(text).to_html(),
+}
+
+
+class Failure:
+    def __init__(self, check, source, text, error):
+        """
+        Args:
+            check: Nome da verificação (chave de CHECKS, ou "scaling")
+            source: Origem da entrada ("random", nome da família patológica, fixture)
+            text: Entrada que falhou
+            error: Descrição do erro
+        """
+        self.check = check
+        self.source = source
+        self.text = text
+        self.error = error
+
+    def __repr__(self):
+        return f"Failure({self.check!r}, {self.source!r}, {len(self.text)} chars, {self.error!r})"
+
+
+def time_limit(text):
+    return TIME_BASE + TIME_PER_CHAR * len(text)
+
+
+def run_check(name, text, source):
+    """
+    Executa uma verificação e retorna uma Failure, ou None se ela passou
+    dentro do limite de tempo.
+    """
+    start = time.perf_counter()
+    try:
+        CHECKS[name](text)
+    except Exception as error:
+        return Failure(name, source, text, f"{type(error).__name__}: {error}"[:500])
+    elapsed = time.perf_counter() - start
+    if elapsed > time_limit(text):
+        return Failure(name, source, text, f"slow: {elapsed:.3f} s > {time_limit(text):.3f} s")
+    return None
+
+
+def run_checks(text, source):
+    return [failure for name in CHECKS if (failure := run_check(name, text, source))]
+
+
+def fuzz(seed=0, iterations=2000, max_size=400):
+    """
+    Executa todas as verificações em iterations entradas aleatórias.
+
+    Returns:
+        A lista de Failure encontradas
+    """
+    rng = random.Random(seed)
+    failures = []
+    for _ in range(iterations):
+        failures.extend(run_checks(random_markdown(rng, max_size), "random"))
+    return failures
+
+
+def pathological(scale=4000):
+    """
+    Executa todas as verificações nas entradas patológicas com scale repetições.
+    """
+    failures = []
+    for name, make_input in PATHOLOGICAL.items():
+        failures.extend(run_checks(make_input(scale), name))
+    return failures
+
+
+def best_time(func, text, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scaling_ratio(func, make_input, scale=1000, factor=8):
+    """
+    Mede func com entradas de scale e scale * factor repetições e retorna o
+    crescimento do tempo por caractere (1.0 é linear, factor é quadrático).
+    """
+    small = make_input(scale)
+    large = make_input(scale * factor)
+    small_time = best_time(func, small) / len(small)
+    large_time = best_time(func, large) / len(large)
+    return large_time / max(small_time, 1e-12)
+
+
+def check_scaling(scale=1000, factor=8, max_ratio=MAX_SCALING_RATIO):
+    """
+    Verifica se cada função de SCALING_FUNCTIONS escala linearmente em cada
+    família patológica.
+
+    Returns:
+        Uma tupla (resultados, falhas), com resultados {(função, família): razão}
+    """
+    results = {}
+    failures = []
+    for function_name, func in SCALING_FUNCTIONS.items():
+        for name, make_input in PATHOLOGICAL.items():
+            ratio = scaling_ratio(func, make_input, scale, factor)
+            results[(function_name, name)] = ratio
+            if ratio > max_ratio:
+                failures.append(Failure(
+                    "scaling", name, make_input(scale * factor),
+                    f"{function_name}: {ratio:.2f}x por caractere com {factor}x a entrada",
+                ))
+    return results, failures
+
+
+def shrink(failure, max_steps=2000):
+    """
+    Reduz a entrada de uma falha removendo trechos enquanto a mesma
+    verificação continua falhando (delta debugging simples).
+
+    Returns:
+        Uma nova Failure com a menor entrada encontrada
+    """
+    if failure.check not in CHECKS:
+        return failure
+    text = failure.text
+    current = failure
+    chunk = max(len(text) // 2, 1)
+    steps = 0
+    while steps < max_steps:
+        i = 0
+        reduced = False
+        while i < len(text) and steps < max_steps:
+            steps += 1
+            candidate = text[:i] + text[i + chunk:]
+            result = run_check(failure.check, candidate, failure.source)
+            if result is not None:
+                text, current, reduced = candidate, result, True
+            else:
+                i += chunk
+        if chunk == 1 and not reduced:
+            break
+        chunk = max(chunk // 2, 1)
+    return current
+
+
+def save_fixture(directory, failure):
+    """
+    Grava uma falha como fixture JSON, com nome derivado da verificação e da entrada.
+
+    Returns:
+        O caminho do arquivo gravado
+    """
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.sha256(failure.text.encode("utf-8")).hexdigest()[:12]
+    path = os.path.join(directory, f"{failure.check}-{digest}.json")
+    data = {
+        "version": FIXTURE_VERSION,
+        "check": failure.check,
+        "source": failure.source,
+        "error": failure.error,
+        "input": failure.text,
+    }
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(data, fp, ensure_ascii=False, indent=1, sort_keys=True)
+    return path
+
+
+def load_fixtures(directory):
+    """
+    Retorna as fixtures (dicts) gravadas em directory, em ordem de nome.
+    """
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+    except FileNotFoundError:
+        return []
+    fixtures = []
+    for name in names:
+        with open(os.path.join(directory, name), encoding="utf-8") as fp:
+            fixture = json.load(fp)
+        fixture["name"] = name
+        fixtures.append(fixture)
+    return fixtures
+
+
+def replay_fixtures(directory):
+    """
+    Repete todas as verificações em cada fixture gravada.
+
+    Returns:
+        A lista de Failure que ainda ocorrem
+    """
+    failures = []
+    for fixture in load_fixtures(directory):
+        failures.extend(run_checks(fixture["input"], fixture["name"]))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fuzzing e escala do parser Markdown.")
+    parser.add_argument("--seed", type=int, default=0, help="semente das entradas aleatórias")
+    parser.add_argument("--iterations", type=int, default=2000, help="entradas aleatórias")
+    parser.add_argument("--max-size", type=int, default=400,
+                        help="pedaços por entrada aleatória, no máximo")
+    parser.add_argument("--scale", type=int, default=4000,
+                        help="repetições das entradas patológicas")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES,
+                        help="diretório onde as falhas são gravadas")
+    parser.add_argument("--no-scaling", action="store_true", help="pula o teste de escala")
+    args = parser.parse_args(argv)
+
+    failures = replay_fixtures(args.fixtures)
+    failures += fuzz(args.seed, args.iterations, args.max_size)
+    failures += pathological(args.scale)
+    if not args.no_scaling:
+        results, scaling_failures = check_scaling()
+        for (function_name, name), ratio in sorted(results.items()):
+            print(f"escala {function_name:<24} {name:<18} {ratio:5.2f}x")
+        failures += scaling_failures
+
+    for failure in failures:
+        failure = shrink(failure)
+        print(f"FALHA {failure!r} -> {save_fixture(args.fixtures, failure)}")
+    print(f"{args.iterations} entradas aleatórias, {len(PATHOLOGICAL)} patológicas: "
+          f"{len(failures)} falhas")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
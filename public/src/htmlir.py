@@ -0,0 +1,271 @@
+"""
+Representação intermediária compacta para árvores HTML.
+
+Os nós ficam em arrays paralelos (tipo, tag, pai, primeiro filho, próximo
+irmão, valor, atributos) com índices para tabelas compartilhadas de tags,
+strings e conjuntos de atributos. Os nós são guardados em ordem de
+documento (pré-ordem), então a renderização é uma varredura linear dos
+arrays, sem recursão e sem percorrer ponteiros entre objetos.
+
+HTMLTree.from_blocks monta a árvore de um documento Markdown direto dos
+blocos, sem criar a árvore de HTMLNode; é o caminho opcional de
+renderização de páginas enormes (render_page(html_ir=True), "main.py
+render --html-ir").
+"""
+from array import array
+
+from blocks import BlockType, block_inline_texts, heading_level, iter_blocks, text_to_html
+from htmlnode import (
+    FrozenNode,
+    FrozenProps,
+    LeafNode,
+    ParentNode,
+    RawHTMLNode,
+    escape_html,
+    serialize_props,
+)
+
+LEAF = 0
+PARENT = 1
+RAW = 2
+NONE = -1
+
+
+class HTMLTree:
+    __slots__ = (
+        "kinds", "tags", "parents", "first_child", "next_sibling", "last_child",
+        "values", "props", "tag_table", "tag_ids", "strings", "string_ids",
+        "props_table", "props_ids", "open_path",
+    )
+
+    def __init__(self):
+        self.kinds = array("b")
+        self.tags = array("i")
+        self.parents = array("i")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.last_child = array("i")
+        self.values = array("i")
+        self.props = array("i")
+        self.tag_table = []
+        self.tag_ids = {}
+        self.strings = []
+        self.string_ids = {}
+        # Cada entrada é (itens dos atributos, FrozenProps?)
+        self.props_table = []
+        self.props_ids = {}
+        # Caminho da raiz até o último nó adicionado, para manter a pré-ordem
+        self.open_path = []
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def intern(self, table, ids, value):
+        if value is None:
+            return NONE
+        index = ids.get(value)
+        if index is None:
+            index = ids[value] = len(table)
+            table.append(value)
+        return index
+
+    def intern_props(self, props):
+        if not props:
+            return NONE
+        key = (tuple(props.items()), type(props) is FrozenProps)
+        return self.intern(self.props_table, self.props_ids, key)
+
+    def add(self, kind, tag, value, props, parent):
+        """
+        Adiciona um nó como último filho de parent (None para a raiz).
+        
+        Returns:
+            O índice do novo nó
+        
+        Raises:
+            ValueError: Se a ordem de documento não for respeitada
+        """
+        index = len(self.kinds)
+        open_path = self.open_path
+        if parent is None:
+            if index:
+                raise ValueError("HTMLTree already has a root node")
+            parent = NONE
+        else:
+            while open_path and open_path[-1] != parent:
+                open_path.pop()
+            if not open_path:
+                raise ValueError("Nodes must be added in document order")
+            if self.last_child[parent] == NONE:
+                self.first_child[parent] = index
+            else:
+                self.next_sibling[self.last_child[parent]] = index
+            self.last_child[parent] = index
+        self.kinds.append(kind)
+        self.tags.append(self.intern(self.tag_table, self.tag_ids, tag))
+        self.parents.append(parent)
+        self.first_child.append(NONE)
+        self.next_sibling.append(NONE)
+        self.last_child.append(NONE)
+        self.values.append(self.intern(self.strings, self.string_ids, value))
+        self.props.append(self.intern_props(props))
+        open_path.append(index)
+        return index
+
+    def add_parent(self, tag, props=None, parent=None):
+        return self.add(PARENT, tag, None, props, parent)
+
+    def add_leaf(self, tag, value, props=None, parent=None):
+        return self.add(LEAF, tag, value, props, parent)
+
+    def add_raw(self, html, parent=None):
+        return self.add(RAW, None, html, None, parent)
+
+    def children(self, index):
+        child = self.first_child[index]
+        while child != NONE:
+            yield child
+            child = self.next_sibling[child]
+
+    @classmethod
+    def from_node(cls, node):
+        """
+        Converte uma árvore de LeafNode, ParentNode e RawHTMLNode em um HTMLTree.
+        """
+        tree = cls()
+        stack = [(node, None)]
+        while stack:
+            node, parent = stack.pop()
+            if isinstance(node, ParentNode):
+                index = tree.add_parent(node.tag, node.props, parent)
+                stack.extend((child, index) for child in reversed(node.children))
+            elif isinstance(node, RawHTMLNode):
+                tree.add_raw(node.value, parent)
+            elif isinstance(node, FrozenNode):
+                # Mantém o fragmento já serializado da subárvore congelada
+                tree.add_raw(node.to_html(), parent)
+            elif isinstance(node, LeafNode):
+                tree.add_leaf(node.tag, node.value, node.props, parent)
+            else:
+                raise TypeError(f"Unsupported node type: {type(node).__name__}")
+        return tree
+
+    @classmethod
+    def from_blocks(cls, lines, cache=None, collect=None):
+        """
+        Monta o HTMLTree de um documento Markdown a partir dos blocos de
+        iter_blocks, com o mesmo HTML de markdown_to_html_node. Nenhum
+        HTMLNode é criado: cada texto inline vira um único nó RAW com o HTML
+        já renderizado.
+
+        Args:
+            lines: Iterável de linhas, por exemplo um arquivo aberto
+            cache: InlineCache opcional usado para o texto inline dos blocos
+            collect: Função opcional chamada com os TextNode de cada texto
+                inline (ver blocks.text_to_children)
+        """
+        tree = cls()
+        root = None
+        for block_type, block_lines in iter_blocks(lines):
+            if root is None:
+                root = tree.add_parent("div")
+            if block_type is BlockType.CODE:
+                pre = tree.add_parent("pre", parent=root)
+                tree.add_leaf("code", "".join(line + "\n" for line in block_lines), parent=pre)
+                continue
+            texts = block_inline_texts(block_type, block_lines)
+            if block_type is BlockType.UNORDERED_LIST or block_type is BlockType.ORDERED_LIST:
+                block = tree.add_parent(
+                    "ul" if block_type is BlockType.UNORDERED_LIST else "ol", parent=root
+                )
+                for text in texts:
+                    item = tree.add_parent("li", parent=block)
+                    tree.add_raw(text_to_html(text, cache, collect), item)
+                continue
+            if block_type is BlockType.HEADING:
+                tag = f"h{heading_level(block_lines[0])}"
+            elif block_type is BlockType.QUOTE:
+                tag = "blockquote"
+            else:
+                tag = "p"
+            block = tree.add_parent(tag, parent=root)
+            tree.add_raw(text_to_html(texts[0], cache, collect), block)
+        if root is None:
+            tree.add_leaf("div", "")
+        return tree
+
+    def node_props(self, index):
+        props_index = self.props[index]
+        if props_index == NONE:
+            return None
+        items, frozen = self.props_table[props_index]
+        return FrozenProps(items) if frozen else dict(items)
+
+    def to_node(self):
+        """
+        Reconstrói a árvore de HTMLNode equivalente.
+        """
+        if not self.kinds:
+            raise ValueError("HTMLTree is empty")
+        nodes = [None] * len(self.kinds)
+        # Em pré-ordem reversa, todos os filhos são criados antes do pai
+        for index in range(len(self.kinds) - 1, -1, -1):
+            kind = self.kinds[index]
+            tag = self.tag_table[self.tags[index]] if self.tags[index] != NONE else None
+            value = self.strings[self.values[index]] if self.values[index] != NONE else None
+            if kind == PARENT:
+                children = [nodes[child] for child in self.children(index)]
+                nodes[index] = ParentNode(tag, children, self.node_props(index))
+            elif kind == RAW:
+                nodes[index] = RawHTMLNode(value)
+            else:
+                nodes[index] = LeafNode(tag, value, self.node_props(index))
+        return nodes[0]
+
+    def iter_html(self):
+        """
+        Gera o HTML em pedaços com uma varredura linear dos arrays. O HTML dos
+        atributos e das tags de abertura é calculado uma vez por combinação distinta.
+        """
+        tag_table, strings = self.tag_table, self.strings
+        props_html = [serialize_props(dict(items)) for items, _ in self.props_table]
+        close_tags = [f"</{tag}>" for tag in tag_table]
+        open_tags = {}
+        stack = []
+        columns = zip(
+            self.kinds, self.tags, self.parents, self.values, self.props, self.first_child
+        )
+        for index, (kind, tag, parent, value, props, first_child) in enumerate(columns):
+            while stack and stack[-1][0] != parent:
+                yield stack.pop()[1]
+            if kind == LEAF and tag == NONE:
+                if value == NONE:
+                    raise ValueError("LeafNode must have a value")
+                yield escape_html(strings[value])
+                continue
+            if kind == RAW:
+                yield strings[value]
+                continue
+            open_tag = open_tags.get((tag, props))
+            if open_tag is None:
+                if tag == NONE:
+                    raise ValueError("All parent nodes must have a tag")
+                attributes = props_html[props] if props != NONE else ""
+                open_tag = open_tags[(tag, props)] = f"<{tag_table[tag]}{attributes}>"
+            if kind == PARENT:
+                if first_child == NONE:
+                    raise ValueError("All parent nodes must have children")
+                yield open_tag
+                stack.append((index, close_tags[tag]))
+            else:
+                if value == NONE:
+                    raise ValueError("LeafNode must have a value")
+                yield f"{open_tag}{escape_html(strings[value])}{close_tags[tag]}"
+        while stack:
+            yield stack.pop()[1]
+
+    def to_html(self):
+        return "".join(self.iter_html())
+
+    def write_html(self, fp):
+        fp.writelines(self.iter_html())
@@ -1,64 +1,324 @@
-from textnode import *
+from textnode import TextNode, TextType
+
+
+def escape_html(text):
+    """
+    Escapa &, < e > para uso em texto HTML. Cada replace é uma busca em C que
+    devolve a própria string quando o caractere não aparece.
+    """
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def escape_attribute(value):
+    """
+    Escapa um valor de atributo HTML delimitado por aspas duplas.
+    """
+    if not isinstance(value, str):
+        value = str(value)
+    return escape_html(value).replace('"', "&quot;")
+
+
+def serialize_props(props):
+    """
+    Serializa um dict de atributos como ' chave="valor"' com os valores escapados.
+    """
+    return "".join([f' {key}="{escape_attribute(value)}"' for key, value in props.items()])
+
+
+class FrozenProps(dict):
+    """
+    Dict de atributos imutável cujo HTML é serializado uma única vez. Útil para
+    conjuntos de atributos compartilhados entre muitos nós (classes CSS, etc.).
+    """
+    __slots__ = ("html",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.html = serialize_props(self)
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("FrozenProps is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        # O pickle padrão de dict preenche o objeto com __setitem__; assim o
+        # dict é recriado pelo construtor (pickle, deepcopy, process pool)
+        return (FrozenProps, (dict(self),))
+
+
+# Padrões imutáveis compartilhados por todos os nós sem filhos ou sem atributos
+EMPTY_CHILDREN = ()
+EMPTY_PROPS = FrozenProps()
 
 class HTMLNode:
+    __slots__ = ("tag", "value", "children", "props")
+
     def __init__(self, tag=None, value=None, children=None, props=None):
         self.tag = tag
         self.value = value
-        self.children = children if children is not None else []
-        self.props = props if props is not None else {}
+        self.children = children if children is not None else EMPTY_CHILDREN
+        self.props = props if props is not None else EMPTY_PROPS
 
     def to_html(self):
         raise NotImplementedError("Subclasses must implement this method")
+
+    def iter_html(self):
+        """
+        Gera o HTML da árvore em pedaços, percorrendo os nós com uma pilha
+        explícita em vez de recursão. Árvores profundas não atingem o limite de
+        recursão e nenhuma string intermediária é criada por nível.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if type(node) is str:
+                yield node
+            elif isinstance(node, ParentNode):
+                if node.tag is None:
+                    raise ValueError("All parent nodes must have a tag")
+                if not node.children:
+                    raise ValueError("All parent nodes must have children")
+                yield f"<{node.tag}{node.props_to_html()}>"
+                stack.append(f"</{node.tag}>")
+                stack.extend(reversed(node.children))
+            else:
+                yield node.to_html()
+
+    def write_html(self, fp):
+        """
+        Escreve o HTML da árvore diretamente em um arquivo ou buffer de texto.
+        """
+        fp.writelines(self.iter_html())
     
     def props_to_html(self):
-        if not self.props:
+        props = self.props
+        if not props:
             return ""
-        attributes = []
-        for key, value in self.props.items():
-            attributes.append(f'{key}="{value}"')
-        return " " + " ".join(attributes)
+        if type(props) is FrozenProps:
+            return props.html
+        return serialize_props(props)
     
     def __repr__(self):
         value_repr = 'None' if self.value is None else f"'{self.value}'"
-        return f"HTMLNode('{self.tag}', {value_repr}, {self.children}, {self.props})"
+        return f"HTMLNode('{self.tag}', {value_repr}, {list(self.children)}, {dict(self.props)})"
     
 class LeafNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, value, props=None):
-        super().__init__(tag, value, [], props)
+        super().__init__(tag, value, None, props)
 
     def to_html(self):
         if self.value is None:
             raise ValueError("LeafNode must have a value")
         if self.tag is None:
-            return self.value
-        return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+            return escape_html(self.value)
+        return f"<{self.tag}{self.props_to_html()}>{escape_html(self.value)}</{self.tag}>"
     
         
 
+class RawHTMLNode(HTMLNode):
+    """
+    Nó com HTML já pronto (e já escapado), emitido sem alterações.
+    """
+    __slots__ = ()
+
+    def __init__(self, html):
+        super().__init__(None, html)
+
+    def to_html(self):
+        return self.value
+
+
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, children, props=None):
         super().__init__(tag, None, children, props)
 
     def to_html(self):
-        if self.tag is None:
-            raise ValueError("All parent nodes must have a tag")
-        if not self.children:
-            raise ValueError("All parent nodes must have children")
-        return f"<{self.tag}{self.props_to_html()}>{''.join([child.to_html() for child in self.children])}</{self.tag}>"
+        return "".join(self.iter_html())
+
+
+class FrozenNode(HTMLNode):
+    """
+    Subárvore congelada cujo HTML é calculado no primeiro to_html() e
+    reaproveitado nas chamadas seguintes. Útil para trechos repetidos em
+    todas as páginas (menu, rodapé), serializados uma vez por build.
+    
+    Os filhos são guardados em tupla e os atributos em FrozenProps, então a
+    única forma de alterar a subárvore é reatribuir tag, value, children ou
+    props. Como uma subárvore pode ser compartilhada por vários pais, qualquer
+    reatribuição invalida os fragmentos de todos os FrozenNode (contador
+    global de gerações).
+    """
+    __slots__ = ("kind", "html", "generation")
+
+    # Incrementado a cada alteração de qualquer FrozenNode
+    mutations = 0
+
+    def __init__(self, kind, tag=None, value=None, children=None, props=None):
+        # Atribuições diretas para que criar um nó não conte como alteração
+        setattr_ = object.__setattr__
+        setattr_(self, "kind", kind)
+        setattr_(self, "tag", tag)
+        setattr_(self, "value", value)
+        setattr_(self, "children", freeze_children(children))
+        setattr_(self, "props", freeze_props(props))
+        setattr_(self, "html", None)
+        setattr_(self, "generation", -1)
+
+    def __setattr__(self, name, value):
+        if name == "children":
+            value = freeze_children(value)
+        elif name == "props":
+            value = freeze_props(value)
+        object.__setattr__(self, name, value)
+        if name != "html" and name != "generation":
+            FrozenNode.mutations += 1
+
+    def to_html(self):
+        mutations = FrozenNode.mutations
+        if self.generation == mutations:
+            return self.html
+        # Pós-ordem com pilha explícita, como iter_html: cada nó congelado é
+        # montado a partir dos fragmentos dos filhos e guardado em cache
+        stack = [(self, False)]
+        fragments = []
+        while stack:
+            node, expanded = stack.pop()
+            if node.generation == mutations:
+                fragments.append(node.html)
+                continue
+            kind = node.kind
+            if kind is ParentNode:
+                children = node.children
+                if not expanded:
+                    if node.tag is None:
+                        raise ValueError("All parent nodes must have a tag")
+                    if not children:
+                        raise ValueError("All parent nodes must have children")
+                    stack.append((node, True))
+                    stack.extend([(child, False) for child in reversed(children)])
+                    continue
+                start = len(fragments) - len(children)
+                html = "".join([
+                    f"<{node.tag}{node.props_to_html()}>", *fragments[start:], f"</{node.tag}>",
+                ])
+                del fragments[start:]
+            elif kind is RawHTMLNode:
+                html = node.value
+            else:
+                html = LeafNode.to_html(node)
+            object.__setattr__(node, "html", html)
+            object.__setattr__(node, "generation", mutations)
+            fragments.append(html)
+        return fragments[0]
+
+    def __repr__(self):
+        return f"FrozenNode({self.kind.__name__}, {super().__repr__()})"
+
+
+def freeze_children(children):
+    if not children:
+        return EMPTY_CHILDREN
+    return tuple([freeze(child) for child in children])
+
+
+def freeze_props(props):
+    if not props:
+        return EMPTY_PROPS
+    if type(props) is FrozenProps:
+        return props
+    return FrozenProps(props)
+
+
+def freeze(node):
+    """
+    Retorna uma cópia congelada (FrozenNode) de uma árvore de LeafNode,
+    ParentNode e RawHTMLNode. Nós já congelados são devolvidos sem cópia.
+    A árvore é percorrida com uma pilha explícita, sem recursão.
+    """
+    if type(node) is FrozenNode:
+        return node
+    stack = [(node, False)]
+    frozen = []
+    while stack:
+        current, expanded = stack.pop()
+        if type(current) is FrozenNode:
+            frozen.append(current)
+        elif isinstance(current, ParentNode):
+            if not expanded:
+                stack.append((current, True))
+                stack.extend([(child, False) for child in reversed(current.children)])
+                continue
+            start = len(frozen) - len(current.children)
+            # Os filhos já estão congelados; freeze_children só monta a tupla
+            children = frozen[start:]
+            del frozen[start:]
+            frozen.append(FrozenNode(ParentNode, current.tag, None, children, current.props))
+        elif isinstance(current, RawHTMLNode):
+            frozen.append(FrozenNode(RawHTMLNode, None, current.value))
+        elif isinstance(current, LeafNode):
+            frozen.append(FrozenNode(LeafNode, current.tag, current.value, None, current.props))
+        else:
+            raise TypeError(f"Unsupported node type: {type(current).__name__}")
+    return frozen[0]
+
+
+# Conversão de cada TextType em LeafNode
+TEXT_NODE_CONVERTERS = {
+    TextType.TEXT: lambda node: LeafNode(None, node.text),
+    TextType.BOLD: lambda node: LeafNode("b", node.text),
+    TextType.ITALIC: lambda node: LeafNode("i", node.text),
+    TextType.CODE: lambda node: LeafNode("code", node.text),
+    TextType.LINK: lambda node: LeafNode("a", node.text, {"href": node.url}),
+    TextType.IMAGE: lambda node: LeafNode("img", "", {"src": node.url, "alt": node.text}),
+}
+
+# Renderização direta de cada TextType em HTML, com a mesma saída de
+# TEXT_NODE_CONVERTERS[...](node).to_html() mas sem criar o LeafNode
+TEXT_NODE_RENDERERS = {
+    TextType.TEXT: lambda node: escape_html(node.text),
+    TextType.BOLD: lambda node: f"<b>{escape_html(node.text)}</b>",
+    TextType.ITALIC: lambda node: f"<i>{escape_html(node.text)}</i>",
+    TextType.CODE: lambda node: f"<code>{escape_html(node.text)}</code>",
+    TextType.LINK: lambda node: (
+        f'<a href="{escape_attribute(node.url)}">{escape_html(node.text)}</a>'
+    ),
+    TextType.IMAGE: lambda node: (
+        f'<img src="{escape_attribute(node.url)}" alt="{escape_attribute(node.text)}"></img>'
+    ),
+}
 
 
 def text_node_to_html_node(text_node):
-    if text_node.text_type == TextType.TEXT:
-        return LeafNode(None, text_node.text)
-    elif text_node.text_type == TextType.BOLD:
-        return LeafNode("b", text_node.text)
-    elif text_node.text_type == TextType.ITALIC:
-        return LeafNode("i", text_node.text)
-    elif text_node.text_type == TextType.CODE:
-        return LeafNode("code", text_node.text)
-    elif text_node.text_type == TextType.LINK:
-        return LeafNode("a", text_node.text, {"href": text_node.url})
-    elif text_node.text_type == TextType.IMAGE:
-        return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
-    else:
+    converter = TEXT_NODE_CONVERTERS.get(text_node.text_type)
+    if converter is None:
         raise ValueError(f"Invalid TextType: {text_node.text_type}")
+    return converter(text_node)
+
+
+def text_nodes_to_html_nodes(text_nodes):
+    """
+    Converte uma lista de TextNode em uma lista de LeafNode.
+    """
+    converters = TEXT_NODE_CONVERTERS
+    try:
+        return [converters[node.text_type](node) for node in text_nodes]
+    except KeyError as error:
+        raise ValueError(f"Invalid TextType: {error.args[0]}") from None
+
+
+def text_nodes_to_html(text_nodes):
+    """
+    Converte uma lista de TextNode diretamente na string HTML, sem criar os
+    LeafNode intermediários.
+    """
+    renderers = TEXT_NODE_RENDERERS
+    try:
+        return "".join([renderers[node.text_type](node) for node in text_nodes])
+    except KeyError as error:
+        raise ValueError(f"Invalid TextType: {error.args[0]}") from None
@@ -0,0 +1,138 @@
+"""
+Cache LRU na frente do parser inline.
+
+Páginas repetem os mesmos parágrafos (rodapés, listas de links, avisos), e
+cada cópia passaria de novo por TextNode.text_to_textnodes. O InlineCache
+guarda, por texto do parágrafo, a sequência de nós (como tupla) ou o
+fragmento HTML já renderizado.
+"""
+import json
+import os
+from collections import OrderedDict
+
+import textnode
+from htmlnode import text_nodes_to_html
+from textnode import TextNode, TextType
+
+CACHE_FILE_VERSION = 1
+
+
+class InlineCache:
+    def __init__(self, maxsize=4096):
+        """
+        Args:
+            maxsize: Número máximo de entradas; as menos usadas recentemente
+                são descartadas quando o limite é atingido
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, key):
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        return None
+
+    def store(self, key, value):
+        entries = self.entries
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def text_to_textnodes(self, text):
+        """
+        Versão com cache de TextNode.text_to_textnodes.
+        
+        Returns:
+            Uma tupla de TextNode compartilhada entre as chamadas; os nós não
+            devem ser alterados
+        """
+        key = ("nodes", text)
+        nodes = self.lookup(key)
+        if nodes is None:
+            nodes = self.store(key, tuple(TextNode.text_to_textnodes(text)))
+        return nodes
+
+    def text_to_html(self, text):
+        """
+        Retorna o HTML inline do texto, renderizado uma única vez por texto distinto.
+        """
+        key = ("html", text)
+        html = self.lookup(key)
+        if html is None:
+            html = self.store(key, text_nodes_to_html(TextNode.text_to_textnodes(text)))
+        return html
+
+    def stats(self):
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        self.entries.clear()
+
+    def save(self, path):
+        """
+        Grava as entradas em JSON (da menos para a mais usada), de forma atômica.
+        """
+        entries = []
+        for (kind, text), value in self.entries.items():
+            if kind == "nodes":
+                value = [[node.text, node.text_type.value, node.url] for node in value]
+            entries.append([kind, text, value])
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as fp:
+            json.dump({"version": CACHE_FILE_VERSION, "rules": rules_key(), "entries": entries}, fp)
+        os.replace(temp_path, path)
+
+    def load(self, path):
+        """
+        Carrega entradas gravadas por save. Um arquivo ausente, corrompido ou de
+        outra versão é ignorado.
+        
+        Returns:
+            O número de entradas carregadas
+        """
+        try:
+            with open(path, encoding="utf-8") as fp:
+                data = json.load(fp)
+            # Entradas gravadas com outras regras inline ativas têm outro HTML
+            if data["version"] != CACHE_FILE_VERSION or data.get("rules", "") != rules_key():
+                return 0
+            types = {text_type.value: text_type for text_type in TextType}
+            extension = textnode.inline_extension()
+            if extension is not None:
+                types.update(extension.types)
+            loaded = 0
+            for kind, text, value in data["entries"]:
+                if kind == "nodes":
+                    value = tuple(TextNode(t, types[tt], url) for t, tt, url in value)
+                elif kind != "html":
+                    continue
+                self.store((kind, text), value)
+                loaded += 1
+            return loaded
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+
+
+def rules_key():
+    extension = textnode.inline_extension()
+    return extension.key if extension is not None else ""
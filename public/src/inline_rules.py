@@ -0,0 +1,231 @@
+"""
+Registro de regras inline opcionais (tachado, destaque, referências de nota).
+
+Cada regra declara o trecho que toda ocorrência contém (o gatilho), a regex
+de uma ocorrência, como extrair o texto e a URL do nó e a tag HTML gerada.
+enable_rules compila as regras ativas em uma única regex com uma alternativa
+por regra e instala o resultado em textnode e nas tabelas de conversão de
+htmlnode:
+
+- o tokenizador continua com uma única passada extra, só nos nós TEXT que
+  contêm algum gatilho, não importa quantas regras estejam ativas;
+- regras desativadas não entram na regex nem nas tabelas, e sem nenhuma
+  regra ativa o custo é um teste "is None" por texto.
+
+Limites de aninhamento: as regras rodam depois do tokenizador, só sobre o
+texto dos nós TEXT, e o modelo de TextNode é plano (um nó não tem filhos).
+Por isso:
+
+- o conteúdo de uma ocorrência não é Markdown, e uma ocorrência que contém
+  negrito, itálico, código ou links fica literal: em "~~a *b* c~~" e
+  "==ver [x](y)==" o tokenizador já separou o itálico e o link, e nenhum nó
+  TEXT contém a ocorrência inteira;
+- uma ocorrência dentro de negrito, itálico, código ou links ("**~~a~~**")
+  é texto do nó externo;
+- regras não se aninham entre si: a ocorrência mais à esquerda vence.
+
+Como as regras são unidas em uma única regex, os grupos de cada padrão são
+renumerados; padrões com grupos nomeados ou referências a grupos (\\1,
+(?P=nome), (?(1)...)) são recusados por InlineRule.
+"""
+import re
+
+import htmlnode
+import textnode
+from htmlnode import LeafNode, escape_html, serialize_props
+from textnode import TextNode, TextType
+
+
+class RuleType:
+    """
+    Tipo dos TextNode gerados por uma regra; como TextType, comparado com "is".
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return f"RuleType({self.value!r})"
+
+
+# Referência a um grupo fora de uma sequência de escape: \1, (?P=nome) ou (?(1)...)
+GROUP_REFERENCE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?P=|\(\?\()")
+
+
+class InlineRule:
+    __slots__ = ("name", "trigger", "pattern", "tag", "parse", "props", "text_type", "groups")
+
+    def __init__(self, name, trigger, pattern, tag, parse=None, props=None):
+        """
+        Args:
+            name: Nome usado para ativar a regra
+            trigger: Trecho presente em toda ocorrência ("~~"); textos sem ele
+                não passam pela regex
+            pattern: Regex (texto) de uma ocorrência, sem grupos nomeados nem
+                referências a grupos
+            tag: Tag HTML do nó gerado
+            parse: Função(grupos) -> (texto, url) do nó; por padrão, o primeiro
+                grupo da regex e nenhuma URL
+            props: Função(nó) -> dict de atributos HTML; por padrão, nenhum
+
+        Raises:
+            ValueError: Se o padrão tem grupos nomeados ou referências a grupos,
+                que deixariam de funcionar na regex combinada de InlineRuleSet
+        """
+        compiled = re.compile(pattern)
+        if compiled.groupindex or GROUP_REFERENCE.search(pattern):
+            raise ValueError(
+                f"Inline rule {name!r}: pattern must not use named groups or group references"
+            )
+        self.groups = compiled.groups
+        self.name = name
+        self.trigger = trigger
+        self.pattern = pattern
+        self.tag = tag
+        self.parse = parse or (lambda groups: (groups[0], None))
+        self.props = props
+        self.text_type = RuleType(name)
+
+    def convert(self, node):
+        props = self.props(node) if self.props is not None else None
+        return LeafNode(self.tag, node.text, props)
+
+    def render(self, node):
+        props = serialize_props(self.props(node)) if self.props is not None else ""
+        return f"<{self.tag}{props}>{escape_html(node.text)}</{self.tag}>"
+
+    def __repr__(self):
+        return f"InlineRule({self.name!r}, {self.pattern!r}, {self.tag!r})"
+
+
+def footnote_props(node):
+    return {"href": node.url, "id": f"fnref-{node.text}", "class": "footnote-ref"}
+
+
+# Regras disponíveis, por nome. Os padrões não cruzam o próprio delimitador,
+# então cada tentativa termina no próximo "~", "=" ou "]" e a busca é linear
+RULES = {}
+
+
+def register_rule(rule):
+    """
+    Torna uma regra disponível para enable_rules. Uma regra com o mesmo nome
+    é substituída.
+    """
+    RULES[rule.name] = rule
+    return rule
+
+
+register_rule(InlineRule("strikethrough", "~~", r"~~([^~]+)~~", "del"))
+register_rule(InlineRule("highlight", "==", r"==([^=]+)==", "mark"))
+register_rule(InlineRule(
+    "footnote-ref", "[^", r"\[\^([^\[\]\s]+)\]", "a",
+    parse=lambda groups: (groups[0], f"#fn-{groups[0]}"),
+    props=footnote_props,
+))
+
+
+class InlineRuleSet:
+    """
+    Regras ativas compiladas em uma tabela de despacho: uma regex com um grupo
+    nomeado por regra e, para cada grupo, a regra e a posição dos seus grupos.
+    """
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        self.names = tuple(rule.name for rule in self.rules)
+        # Identifica as regras ativas nos hashes do build e no cache inline
+        self.key = ",".join(self.names)
+        self.types = {rule.text_type.value: rule.text_type for rule in self.rules}
+        self.triggers = tuple(dict.fromkeys(rule.trigger for rule in self.rules))
+        alternatives = []
+        self.dispatch = {}
+        group = 1
+        for i, rule in enumerate(self.rules):
+            alternatives.append(f"(?P<r{i}>{rule.pattern})")
+            # Os grupos da regra vêm logo depois do grupo nomeado dela
+            self.dispatch[f"r{i}"] = (rule, group + 1, group + 1 + rule.groups)
+            group += 1 + rule.groups
+        self.pattern = re.compile("|".join(alternatives))
+
+    def split(self, text, nodes):
+        """
+        Adiciona a nodes os nós de um texto, separando as ocorrências das regras.
+        """
+        start = 0
+        dispatch = self.dispatch
+        for match in self.pattern.finditer(text):
+            rule, first, last = dispatch[match.lastgroup]
+            label, url = rule.parse(match.groups()[first - 1:last - 1])
+            if match.start() > start:
+                nodes.append(TextNode(text[start:match.start()], TextType.TEXT))
+            nodes.append(TextNode(label, rule.text_type, url))
+            start = match.end()
+        if start == 0:
+            return False
+        if start < len(text):
+            nodes.append(TextNode(text[start:], TextType.TEXT))
+        return True
+
+    def apply(self, text, nodes):
+        """
+        Aplica as regras aos nós TEXT gerados para text. Retorna a própria
+        lista se nenhum nó tem ocorrências.
+        """
+        triggers = self.triggers
+        # Um texto sem nenhum gatilho volta sem percorrer os nós
+        for trigger in triggers:
+            if trigger in text:
+                break
+        else:
+            return nodes
+        result = None
+        for i, node in enumerate(nodes):
+            text = node.text
+            if node.text_type is TextType.TEXT and any(trigger in text for trigger in triggers):
+                if result is None:
+                    result = nodes[:i]
+                if self.split(text, result):
+                    continue
+            if result is not None:
+                result.append(node)
+        return nodes if result is None else result
+
+
+# Tipos instalados nas tabelas de htmlnode pelo último enable_rules
+_installed_types = ()
+
+
+def enable_rules(names):
+    """
+    Ativa apenas as regras indicadas, desativando as demais.
+
+    Returns:
+        O InlineRuleSet instalado, ou None se names é vazio
+
+    Raises:
+        ValueError: Se alguma regra não existe
+    """
+    global _installed_types
+    unknown = [name for name in names if name not in RULES]
+    if unknown:
+        raise ValueError(f"Unknown inline rule: {', '.join(unknown)}")
+    for text_type in _installed_types:
+        htmlnode.TEXT_NODE_CONVERTERS.pop(text_type, None)
+        htmlnode.TEXT_NODE_RENDERERS.pop(text_type, None)
+    rules = [RULES[name] for name in dict.fromkeys(names)]
+    for rule in rules:
+        htmlnode.TEXT_NODE_CONVERTERS[rule.text_type] = rule.convert
+        htmlnode.TEXT_NODE_RENDERERS[rule.text_type] = rule.render
+    _installed_types = tuple(rule.text_type for rule in rules)
+    rule_set = InlineRuleSet(rules) if rules else None
+    textnode.set_inline_extension(rule_set)
+    return rule_set
+
+
+def active_rules():
+    """
+    Retorna os nomes das regras ativas.
+    """
+    extension = textnode.inline_extension()
+    return extension.names if extension is not None else ()
@@ -0,0 +1,213 @@
+"""
+Índice de links do site inteiro.
+
+O build registra, por página de origem, a URL de cada TextNode LINK e IMAGE,
+recolhida na renderização da página; extract_page_links só lê o Markdown das
+páginas que não foram renderizadas. O índice é persistido entre builds com o
+hash de cada página, então apenas as páginas alteradas são lidas de novo. O
+verificador resolve os alvos internos contra as páginas geradas, os assets
+com hash e os arquivos da saída em uma única passada, com cada alvo
+consultado uma vez.
+"""
+import json
+import os
+import posixpath
+
+from blocks import BlockType, block_inline_texts, iter_blocks
+from textnode import TextNode, TextType
+
+LINK_INDEX_VERSION = 1
+# Prefixos de URLs que não apontam para arquivos do site
+EXTERNAL_PREFIXES = ("//", "mailto:", "tel:", "data:", "javascript:")
+
+
+def extract_page_links(markdown):
+    """
+    Retorna as tuplas (tipo, url) dos links e imagens de um documento, na
+    ordem em que aparecem, com tipo igual a "link" ou "image". Blocos de
+    código e código inline são ignorados, como na renderização.
+
+    Raises:
+        ValueError: Se o Markdown inline de algum bloco for inválido
+    """
+    links = []
+    for block_type, lines in iter_blocks(markdown.split("\n")):
+        if block_type is BlockType.CODE:
+            continue
+        for text in block_inline_texts(block_type, lines):
+            # Sem "](" não há link nem imagem; evita tokenizar o texto
+            if "](" not in text:
+                continue
+            for node in TextNode.text_to_textnodes(text):
+                if node.text_type is TextType.LINK or node.text_type is TextType.IMAGE:
+                    links.append((node.text_type.value, node.url))
+    return links
+
+
+def is_internal(url):
+    """
+    Indica se a URL aponta para um arquivo do próprio site.
+    """
+    if not url or url.startswith("#") or url.startswith(EXTERNAL_PREFIXES):
+        return False
+    return "://" not in url
+
+
+def resolve_target(source, url):
+    """
+    Resolve uma URL interna para um caminho relativo à raiz do site, sem
+    âncora nem query string. URLs relativas partem do diretório da página.
+    """
+    path = url.split("#", 1)[0].split("?", 1)[0]
+    if path.startswith("/"):
+        path = path[1:]
+    else:
+        path = posixpath.join(posixpath.dirname(source), path)
+    directory = path == "" or path.endswith("/")
+    path = posixpath.normpath(path) if path else "."
+    if path == ".":
+        return ""
+    return f"{path}/" if directory else path
+
+
+class LinkIndex:
+    def __init__(self):
+        # source -> {"hash": hash do Markdown, "links": [[tipo, url], ...]}
+        self.pages = {}
+
+    @classmethod
+    def load(cls, path):
+        """
+        Lê um índice salvo. Um arquivo ausente, corrompido ou de outra versão
+        resulta em um índice vazio, que é reconstruído no próximo build.
+        """
+        index = cls()
+        try:
+            with open(path, encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return index
+        if (
+            isinstance(data, dict)
+            and data.get("version") == LINK_INDEX_VERSION
+            and isinstance(data.get("pages"), dict)
+        ):
+            index.pages = data["pages"]
+        return index
+
+    def save(self, path):
+        """
+        Grava o índice de forma atômica (arquivo temporário + rename).
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.tmp"
+        data = {"version": LINK_INDEX_VERSION, "pages": self.pages}
+        with open(temp_path, "w", encoding="utf-8") as fp:
+            fp.write(json.dumps(data, sort_keys=True, separators=(",", ":")))
+        os.replace(temp_path, path)
+
+    def update(self, source, markdown, digest, links=None):
+        """
+        Registra os links de uma página, lendo o Markdown apenas se o hash
+        mudou desde a última atualização.
+
+        Args:
+            links: Listas [tipo, url] já recolhidas na renderização; com
+                elas, o Markdown não é lido
+
+        Returns:
+            True se a página foi lida de novo, False se o índice já estava em dia
+        """
+        entry = self.pages.get(source)
+        if (
+            entry is not None
+            and entry["hash"] == digest
+            and (links is None or entry["links"] == links)
+        ):
+            return False
+        if links is None:
+            try:
+                links = [list(link) for link in extract_page_links(markdown)]
+            except ValueError:
+                # A página não renderiza; seus links não entram no índice
+                links = []
+        self.pages[source] = {"hash": digest, "links": links}
+        return True
+
+    def prune(self, sources):
+        """
+        Remove as páginas que não estão em sources.
+
+        Returns:
+            A lista das páginas removidas
+        """
+        removed = [source for source in self.pages if source not in sources]
+        for source in removed:
+            del self.pages[source]
+        return removed
+
+    def links(self):
+        """
+        Gera tuplas (source, tipo, url) de todos os links do índice.
+        """
+        for source, entry in self.pages.items():
+            for kind, url in entry["links"]:
+                yield source, kind, url
+
+    def targets(self):
+        """
+        Retorna o índice reverso {alvo interno: [páginas que apontam para ele]}.
+        """
+        targets = {}
+        for source, kind, url in self.links():
+            if is_internal(url):
+                sources = targets.setdefault(resolve_target(source, url), [])
+                if not sources or sources[-1] != source:
+                    sources.append(source)
+        return targets
+
+    def check(self, output_dir, outputs, assets=None):
+        """
+        Procura links internos para páginas inexistentes e imagens ausentes.
+
+        Args:
+            output_dir: Diretório de saída, onde ficam imagens e outros arquivos
+            outputs: Caminhos relativos (com "/") das páginas geradas
+            assets: Referências dos assets {"/styles.css": "/styles.<hash>.css"}
+                (AssetPipeline.mapping); um alvo que é um asset é procurado
+                pelo nome com hash, que é o arquivo gravado na saída
+
+        Returns:
+            Uma lista ordenada de tuplas (source, tipo, url) quebradas
+        """
+        outputs = set(outputs)
+        assets = assets or {}
+        found = {}
+
+        def exists(target):
+            if target == ".." or target.startswith("../"):
+                return False
+            hashed = assets.get(f"/{target}")
+            if hashed is not None:
+                target = hashed[1:]
+            if target in outputs:
+                return True
+            if target == "" or target.endswith("/"):
+                return f"{target}index.html" in outputs
+            if target.endswith(".md") and f"{target[:-3]}.html" in outputs:
+                return True
+            if f"{target}.html" in outputs or f"{target}/index.html" in outputs:
+                return True
+            return os.path.isfile(os.path.join(output_dir, target))
+
+        broken = []
+        for source, kind, url in self.links():
+            if not is_internal(url):
+                continue
+            target = resolve_target(source, url)
+            ok = found.get(target)
+            if ok is None:
+                ok = found[target] = exists(target)
+            if not ok:
+                broken.append((source, kind, url))
+        return sorted(broken)
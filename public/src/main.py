@@ -1,14 +1,230 @@
-from textnode import TextNode
-from enum import Enum
+import argparse
+import os
+import sys
 
-class TextType(Enum):
-    TEXT = "text"
-    BOLD = "bold"
-    ITALIC = "italic"
+# Os módulos do pipeline são importados dentro de cada comando, para que
+# comandos rápidos (--version, render) não paguem pelo grafo de imports inteiro
+__version__ = "0.1.0"
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(os.path.dirname(SRC_DIR))
+FRAGMENT_STORE_DIR = os.path.join(ROOT_DIR, ".cache", "fragments")
+COMMANDS = ("build", "serve", "render", "fragments")
+
+
+def make_parser():
+    paths = argparse.ArgumentParser(add_help=False)
+    paths.add_argument("--content", default=os.path.join(ROOT_DIR, "content"),
+                       help="diretório com os arquivos Markdown")
+    paths.add_argument("--template", default=os.path.join(ROOT_DIR, "template.html"),
+                       help="template HTML das páginas")
+    paths.add_argument("--output", default=os.path.join(ROOT_DIR, "public"),
+                       help="diretório de saída")
+    paths.add_argument("--manifest", default=os.path.join(ROOT_DIR, ".cache", "manifest.json"),
+                       help="manifesto do build incremental")
+    paths.add_argument("--assets", default=os.path.join(ROOT_DIR, "public"),
+                       help="diretório com CSS, JS e imagens copiados com hash no nome")
+    paths.add_argument("--no-assets", action="store_true",
+                       help="não processa os assets nem reescreve as referências")
+    paths.add_argument("--no-minify-html", action="store_true",
+                       help="mantém os espaços do HTML gerado")
+    paths.add_argument("--gzip", action="store_true",
+                       help="grava também cópias .gz dos assets de texto")
+
+    inline = argparse.ArgumentParser(add_help=False)
+    inline.add_argument("--inline-rule", action="append", default=[], metavar="NAME",
+                        help="ativa uma regra inline opcional (strikethrough, highlight, "
+                             "footnote-ref); pode ser repetido")
+
+    parser = argparse.ArgumentParser(description="Gera o site estático a partir do Markdown.")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    commands = parser.add_subparsers(dest="command")
+
+    build = commands.add_parser("build", parents=[paths, inline], help="gera o site (padrão)")
+    build.add_argument("--force", action="store_true",
+                       help="renderiza todas as páginas, ignorando o manifesto")
+    build.add_argument("-j", "--workers", type=int, default=1,
+                       help="processos de renderização (0 usa todos os núcleos)")
+    build.add_argument("--chunksize", type=int, default=16,
+                       help="páginas enviadas a cada processo por vez")
+    build.add_argument("--inline-cache-size", type=int, default=4096,
+                       help="parágrafos guardados no cache inline (0 desativa)")
+    build.add_argument("--inline-cache-file", default=None,
+                       help="arquivo para persistir o cache inline entre builds")
+    build.add_argument("--write-workers", type=int, default=4,
+                       help="threads que gravam os arquivos gerados (0 grava em série)")
+    build.add_argument("--link-index", default=os.path.join(ROOT_DIR, ".cache", "links.json"),
+                       help="índice de links do site, atualizado a cada build")
+    build.add_argument("--check-links", action="store_true",
+                       help="lista links internos e imagens que não existem no site")
+    build.add_argument("--search-index", default=os.path.join(ROOT_DIR, ".cache", "search.json"),
+                       help="estado do índice de busca gravado em OUTPUT/search")
+    build.add_argument("--no-search", action="store_true", help="não gera o índice de busca")
+    build.add_argument("--fragment-store", default=FRAGMENT_STORE_DIR,
+                       help="diretório de páginas renderizadas compartilhado entre builds")
+    build.add_argument("--fragment-store-size", type=int, default=256,
+                       help="tamanho máximo do armazenamento de páginas, em MB (0 desativa)")
+    build.add_argument("--profile", metavar="DIR", default=None,
+                       help="mede cada página e etapa e grava o relatório em DIR")
+    build.add_argument("--cprofile", action="store_true",
+                       help="com --profile, grava também um cProfile do build (build.prof)")
+
+    serve = commands.add_parser("serve", parents=[paths, inline],
+                                help="serve o site e re-renderiza as páginas alteradas")
+    serve.add_argument("--host", default="127.0.0.1", help="endereço do servidor")
+    serve.add_argument("--port", type=int, default=8000, help="porta do servidor")
+    serve.add_argument("--interval", type=float, default=0.05,
+                       help="intervalo de verificação do conteúdo, em segundos")
+
+    render = commands.add_parser("render", parents=[inline],
+                                 help="renderiza um único arquivo Markdown")
+    render.add_argument("file", help="arquivo Markdown")
+    render.add_argument("--template", default=None,
+                        help="template HTML da página (sem ele, só o conteúdo)")
+    render.add_argument("-o", "--output", default=None,
+                        help="arquivo de saída (padrão: saída padrão)")
+    render.add_argument("--html-ir", action="store_true",
+                        help="monta a página na representação compacta (htmlir), com "
+                             "menos alocações em páginas enormes")
+
+    fragments = commands.add_parser("fragments",
+                                    help="exporta ou importa o armazenamento de páginas")
+    fragments.add_argument("action", choices=("export", "import"))
+    fragments.add_argument("tarball", help="arquivo .tar.gz")
+    fragments.add_argument("--fragment-store", default=FRAGMENT_STORE_DIR,
+                           help="diretório do armazenamento de páginas")
+    return parser
+
+
+def make_assets(args):
+    from assets import AssetPipeline
+
+    return AssetPipeline(
+        None if args.no_assets else args.assets,
+        minify_html=not args.no_minify_html,
+        precompress=args.gzip,
+    )
+
+
+def run_build(args):
+    from build import build_site
+
+    fragment_store = None
+    if args.fragment_store_size > 0:
+        from fragments import FragmentStore
+
+        fragment_store = FragmentStore(args.fragment_store, args.fragment_store_size * 1024 * 1024)
+    profiler = None
+    if args.profile:
+        from profiling import BuildProfiler
+
+        profiler = BuildProfiler(cprofile=args.cprofile)
+    result = build_site(
+        args.content, args.template, args.output, args.manifest,
+        force=args.force, workers=args.workers or None, chunksize=args.chunksize,
+        inline_cache_size=args.inline_cache_size, inline_cache_path=args.inline_cache_file,
+        profiler=profiler, write_workers=args.write_workers, assets=make_assets(args),
+        link_index_path=args.link_index, check_links=args.check_links,
+        fragment_store=fragment_store,
+        search_index_path=None if args.no_search else args.search_index,
+    )
+    print(result)
+    if profiler is not None:
+        for path in profiler.write_reports(args.profile):
+            print(f"Relatório de profiling: {path}")
+    for source, error in result.errors:
+        print(f"{source}: {error}", file=sys.stderr)
+    for source, kind, url in result.broken_links:
+        label = "imagem ausente" if kind == "image" else "link quebrado"
+        print(f"{source}: {label}: {url}", file=sys.stderr)
+    return 1 if result.errors or result.broken_links else 0
+
+
+def run_serve(args):
+    from devserver import serve
+
+    serve(args.content, args.template, args.output, args.manifest,
+          host=args.host, port=args.port, interval=args.interval, assets=make_assets(args))
+    return 0
+
+
+def run_render(args):
+    if args.template is None:
+        # Sem template, o HTML é escrito bloco a bloco enquanto o arquivo é lido
+        if args.html_ir:
+            from htmlir import HTMLTree
+
+            def render_markdown_file(source_path, fp):
+                with open(source_path, encoding="utf-8") as source:
+                    HTMLTree.from_blocks(source).write_html(fp)
+        else:
+            from blocks import render_markdown_file
+
+        if args.output is None:
+            render_markdown_file(args.file, sys.stdout)
+            sys.stdout.write("\n")
+        else:
+            with open(args.output, "w", encoding="utf-8") as fp:
+                render_markdown_file(args.file, fp)
+        return 0
+
+    from build import render_page
+    from templates import load_template
+
+    with open(args.file, encoding="utf-8") as fp:
+        markdown = fp.read()
+    default_title = os.path.splitext(os.path.basename(args.file))[0]
+    html = render_page(markdown, load_template(args.template), default_title,
+                       html_ir=args.html_ir)
+    if args.output is None:
+        sys.stdout.write(html + "\n")
+    else:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(html)
+    return 0
+
+
+def run_fragments(args):
+    from fragments import FragmentStore
+
+    store = FragmentStore(args.fragment_store)
+    if args.action == "export":
+        count = store.export_tarball(args.tarball)
+        print(f"{count} páginas exportadas para {args.tarball}")
+    else:
+        count = store.import_tarball(args.tarball)
+        print(f"{count} páginas importadas de {args.tarball}")
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # Sem subcomando, o padrão é "build" (compatível com main.sh)
+    if not argv or argv[0] not in COMMANDS + ("-h", "--help", "--version"):
+        argv.insert(0, "build")
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "inline_rule", None):
+        from inline_rules import enable_rules
+
+        try:
+            enable_rules(args.inline_rule)
+        except ValueError as error:
+            parser.error(str(error))
+
+    if args.command == "render":
+        return run_render(args)
+    if args.command == "fragments":
+        return run_fragments(args)
+
+    if not os.path.isdir(args.content):
+        print(f"Diretório de conteúdo não encontrado: {args.content}", file=sys.stderr)
+        return 1
+
+    if args.command == "serve":
+        return run_serve(args)
+    return run_build(args)
 
-def main():
-    node = TextNode("Hello, World!", TextType.BOLD, "https://example.com")
-    print(node)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main())
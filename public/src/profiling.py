@@ -0,0 +1,217 @@
+"""
+Instrumentação opcional do pipeline e relatório de profiling por página.
+
+Os ganchos são instalados substituindo as funções do caminho crítico por
+versões cronometradas apenas dentro de BuildProfiler.instrument(); fora
+dele as funções originais ficam intactas e o custo é zero. As funções de
+conversão de htmlnode são substituídas em todo módulo carregado que as
+importou pelo nome, então um novo "from htmlnode import ..." não escapa do
+profiler.
+
+Os tempos de cada etapa são inclusivos: text_to_textnodes inclui o tempo
+de tokenize_inline (ou dos split_nodes_* no modo legacy).
+"""
+import contextlib
+import cProfile
+import json
+import os
+import sys
+import time
+
+import htmlnode
+from htmlnode import ParentNode
+from textnode import TextNode
+
+# Métodos estáticos de TextNode cronometrados
+TEXTNODE_STAGES = (
+    "text_to_textnodes",
+    "tokenize_inline",
+    "split_nodes_delimiter",
+    "split_nodes_image",
+    "split_nodes_link",
+)
+
+# Funções de conversão de htmlnode cronometradas
+FUNCTION_STAGES = (
+    "text_node_to_html_node",
+    "text_nodes_to_html_nodes",
+    "text_nodes_to_html",
+)
+
+
+def modules_with(name, function):
+    """
+    Retorna os módulos carregados em que name é a própria function (o
+    módulo que a define e os que a importaram pelo nome).
+    """
+    return [
+        module for module in list(sys.modules.values())
+        if getattr(module, "__dict__", {}).get(name) is function
+    ]
+
+
+class PageStats:
+    def __init__(self, source):
+        self.source = source
+        self.seconds = 0.0
+        self.bytes = 0
+        # etapa -> [chamadas, segundos, nós produzidos, caracteres produzidos]
+        self.stages = {}
+
+    def to_dict(self):
+        return {
+            "source": self.source,
+            "seconds": self.seconds,
+            "bytes": self.bytes,
+            "stages": {
+                stage: {"calls": calls, "seconds": seconds, "nodes": nodes, "chars": chars}
+                for stage, (calls, seconds, nodes, chars) in self.stages.items()
+            },
+        }
+
+
+class BuildProfiler:
+    def __init__(self, cprofile=False):
+        """
+        Args:
+            cprofile: Se True, também coleta um cProfile de todo o período instrumentado
+        """
+        self.pages = []
+        self.current = None
+        self.other = PageStats(None)
+        self.cprofile = cProfile.Profile() if cprofile else None
+
+    def record(self, stage, seconds, result):
+        stats = self.current if self.current is not None else self.other
+        entry = stats.stages.get(stage)
+        if entry is None:
+            entry = stats.stages[stage] = [0, 0.0, 0, 0]
+        entry[0] += 1
+        entry[1] += seconds
+        if isinstance(result, str):
+            entry[3] += len(result)
+        elif isinstance(result, (list, tuple)):
+            entry[2] += len(result)
+        elif result is not None:
+            entry[2] += 1
+
+    def timed(self, stage, func):
+        perf_counter = time.perf_counter
+        record = self.record
+
+        def wrapper(*args, **kwargs):
+            # Chamadas que lançam exceção também são contadas (o pipeline
+            # antigo usa ValueError como controle de fluxo)
+            result = None
+            start = perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                return result
+            finally:
+                record(stage, perf_counter() - start, result)
+
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    @contextlib.contextmanager
+    def instrument(self):
+        """
+        Instala os ganchos de tempo no pipeline enquanto o bloco executa.
+        """
+        patches = []
+        for stage in TEXTNODE_STAGES:
+            original = TextNode.__dict__[stage]
+            patches.append((TextNode, stage, original))
+            setattr(TextNode, stage, staticmethod(self.timed(stage, getattr(TextNode, stage))))
+        for stage in FUNCTION_STAGES:
+            original = getattr(htmlnode, stage)
+            wrapper = self.timed(stage, original)
+            for module in modules_with(stage, original):
+                patches.append((module, stage, original))
+                setattr(module, stage, wrapper)
+        patches.append((ParentNode, "to_html", ParentNode.__dict__["to_html"]))
+        ParentNode.to_html = self.timed("to_html", ParentNode.to_html)
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        try:
+            yield self
+        finally:
+            if self.cprofile is not None:
+                self.cprofile.disable()
+            for target, name, original in reversed(patches):
+                setattr(target, name, original)
+
+    @contextlib.contextmanager
+    def page(self, source):
+        """
+        Atribui as etapas executadas dentro do bloco à página source.
+        """
+        stats = PageStats(source)
+        self.current = stats
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.seconds = time.perf_counter() - start
+            self.current = None
+            self.pages.append(stats)
+
+    def stage_totals(self):
+        """
+        Soma as etapas de todas as páginas, da mais lenta para a mais rápida.
+        """
+        totals = {}
+        for stats in self.pages + [self.other]:
+            for stage, values in stats.stages.items():
+                total = totals.setdefault(stage, [0, 0.0, 0, 0])
+                for i, value in enumerate(values):
+                    total[i] += value
+        return sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+
+    def slowest_pages(self, top=20):
+        return sorted(self.pages, key=lambda stats: stats.seconds, reverse=True)[:top]
+
+    def to_dict(self, top=20):
+        return {
+            "pages": len(self.pages),
+            "seconds": sum(stats.seconds for stats in self.pages),
+            "bytes": sum(stats.bytes for stats in self.pages),
+            "stages": {
+                stage: {"calls": calls, "seconds": seconds, "nodes": nodes, "chars": chars}
+                for stage, (calls, seconds, nodes, chars) in self.stage_totals()
+            },
+            "slowest_pages": [stats.to_dict() for stats in self.slowest_pages(top)],
+        }
+
+    def format_report(self, top=20):
+        lines = [f"{len(self.pages)} páginas", "", "Etapas (tempo inclusivo):"]
+        for stage, (calls, seconds, nodes, chars) in self.stage_totals():
+            lines.append(
+                f"  {stage:<26} {seconds * 1000:10.2f} ms  {calls:>9} chamadas"
+                f"  {nodes:>10} nós  {chars:>12} caracteres"
+            )
+        lines += ["", f"Páginas mais lentas (top {top}):"]
+        for stats in self.slowest_pages(top):
+            lines.append(f"  {stats.seconds * 1000:10.2f} ms  {stats.bytes:>10} bytes  {stats.source}")
+        return "\n".join(lines) + "\n"
+
+    def write_reports(self, directory, top=20):
+        """
+        Grava profile-report.txt, profile-report.json e, se coletado, build.prof.
+        
+        Returns:
+            A lista de arquivos gravados
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = [
+            os.path.join(directory, "profile-report.txt"),
+            os.path.join(directory, "profile-report.json"),
+        ]
+        with open(paths[0], "w", encoding="utf-8") as fp:
+            fp.write(self.format_report(top))
+        with open(paths[1], "w", encoding="utf-8") as fp:
+            json.dump(self.to_dict(top), fp, indent=1)
+        if self.cprofile is not None:
+            paths.append(os.path.join(directory, "build.prof"))
+            self.cprofile.dump_stats(paths[-1])
+        return paths
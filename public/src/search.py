@@ -0,0 +1,252 @@
+"""
+Índice de busca gerado durante o build.
+
+O texto de cada página é dividido em termos (minúsculos, sem acentos e sem
+stop words) e contado. O índice invertido é gravado em arquivos JSON
+pequenos, um por prefixo de dois caracteres, para que a busca no navegador
+baixe apenas o shard do termo procurado:
+
+    search/docs.json  {"id": ["/url.html", "título"], ...}
+    search/ca.json    {"casa": [id, frequência, id, frequência, ...], ...}
+
+Os termos das páginas renderizadas vêm dos TextNode gerados na própria
+renderização (count_terms); page_terms só lê o Markdown das páginas que não
+foram renderizadas. O estado (termos de cada página e o hash do Markdown) é
+persistido entre builds, então apenas as páginas alteradas são lidas de novo
+e apenas os shards dos termos afetados são regravados.
+"""
+import json
+import os
+import re
+import unicodedata
+from collections import Counter
+
+from blocks import BlockType, block_inline_texts, extract_title, iter_blocks, plain_text
+from textnode import INLINE_LINK_PATTERN
+from writer import remove_output, write_if_changed
+
+# 2: títulos sem a marcação inline
+SEARCH_INDEX_VERSION = 2
+# Subdiretório da saída com docs.json e os shards
+SEARCH_DIR = "search"
+PREFIX_LENGTH = 2
+MIN_TERM_LENGTH = 2
+MAX_TERM_LENGTH = 40
+TERM_PATTERN = re.compile(r"[^\W_]+")
+
+STOP_WORDS = frozenset("""
+a ao aos as com como da das de do dos e em entre era essa esse esta este eu
+foi for ha isso isto ja la lhe mais mas me mesmo muito na nao nas no nos o os
+ou para pela pelas pelo pelos por quando que se sem ser seu sua suas seus so
+tambem te tem um uma umas uns voce
+an and are as at be but by for from has have in is it its not of on or that
+the this to was were will with you your
+""".split())
+
+
+def fold(text):
+    """
+    Passa o texto para minúsculas e remove os acentos ("Ação" -> "acao").
+    """
+    text = text.lower()
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def is_term(term):
+    return MIN_TERM_LENGTH <= len(term) <= MAX_TERM_LENGTH and term not in STOP_WORDS
+
+
+def tokenize(text):
+    """
+    Retorna os termos indexáveis de um texto, na ordem, sem stop words.
+    """
+    return [term for term in TERM_PATTERN.findall(fold(text)) if is_term(term)]
+
+
+def link_label(match):
+    # Mantém o texto do link (ou o alt da imagem) e descarta a URL
+    return f" {match.group(2)} "
+
+
+def count_terms(texts):
+    """
+    Conta os termos de uma lista de textos, como se fossem separados por
+    espaços.
+    """
+    # Uma única passada de regex na página inteira; os filtros rodam
+    # depois, só uma vez por termo distinto
+    counts = Counter(TERM_PATTERN.findall(fold("\n".join(texts))))
+    for term in [term for term in counts if not is_term(term)]:
+        del counts[term]
+    return counts
+
+
+def page_terms(markdown):
+    """
+    Conta os termos do texto de uma página. Os delimitadores inline (*, `)
+    não são caracteres de palavra e somem na tokenização; de links e imagens
+    fica só o texto, sem a URL. Blocos de código não são indexados.
+    """
+    texts = []
+    for block_type, lines in iter_blocks(markdown.split("\n")):
+        if block_type is BlockType.CODE:
+            continue
+        for text in block_inline_texts(block_type, lines):
+            if "](" in text:
+                text = INLINE_LINK_PATTERN.sub(link_label, text)
+            texts.append(text)
+    return count_terms(texts)
+
+
+def term_prefix(term):
+    return term[:PREFIX_LENGTH]
+
+
+class SearchIndex:
+    def __init__(self):
+        # source -> {"hash", "id", "url", "title", "terms": {termo: frequência}}
+        self.pages = {}
+        self.next_id = 0
+        # Prefixos cujos shards precisam ser regravados
+        self.dirty = set()
+        self.docs_dirty = True
+
+    @classmethod
+    def load(cls, path):
+        """
+        Lê o estado salvo. Um arquivo ausente, corrompido ou de outra versão
+        resulta em um índice vazio, reconstruído no próximo build.
+        """
+        index = cls()
+        try:
+            with open(path, encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return index
+        if (
+            isinstance(data, dict)
+            and data.get("version") == SEARCH_INDEX_VERSION
+            and isinstance(data.get("pages"), dict)
+        ):
+            index.pages = data["pages"]
+            index.next_id = data.get("next_id", 0)
+            index.docs_dirty = False
+        return index
+
+    def save(self, path):
+        """
+        Grava o estado de forma atômica (arquivo temporário + rename).
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.tmp"
+        data = {"version": SEARCH_INDEX_VERSION, "next_id": self.next_id, "pages": self.pages}
+        with open(temp_path, "w", encoding="utf-8") as fp:
+            fp.write(json.dumps(data, sort_keys=True, separators=(",", ":")))
+        os.replace(temp_path, path)
+
+    def update(self, source, markdown, digest, url, default_title="", terms=None):
+        """
+        Indexa uma página, lendo o Markdown apenas se o hash mudou.
+
+        Args:
+            terms: Termos já contados na renderização ({termo: frequência});
+                com eles, o texto do Markdown não é lido
+
+        Returns:
+            True se a página foi indexada de novo, False se já estava em dia
+        """
+        entry = self.pages.get(source)
+        if (
+            entry is not None
+            and entry["hash"] == digest
+            and entry["url"] == url
+            and (terms is None or entry["terms"] == terms)
+        ):
+            return False
+        if terms is None:
+            terms = dict(page_terms(markdown))
+        # O mesmo texto do <title> da página, sem a marcação inline
+        title = plain_text(extract_title(markdown) or default_title)
+        if entry is None:
+            entry = {"id": self.next_id}
+            self.next_id += 1
+        else:
+            self.dirty.update(term_prefix(term) for term in entry["terms"])
+        self.dirty.update(term_prefix(term) for term in terms)
+        entry.update(hash=digest, url=url, title=title, terms=terms)
+        self.pages[source] = entry
+        self.docs_dirty = True
+        return True
+
+    def prune(self, sources):
+        """
+        Remove as páginas que não estão em sources.
+
+        Returns:
+            A lista das páginas removidas
+        """
+        removed = [source for source in self.pages if source not in sources]
+        for source in removed:
+            entry = self.pages.pop(source)
+            self.dirty.update(term_prefix(term) for term in entry["terms"])
+            self.docs_dirty = True
+        return removed
+
+    def shards(self, prefixes=None):
+        """
+        Monta o índice invertido {prefixo: {termo: [id, frequência, ...]}},
+        apenas para os prefixos indicados (None monta todos).
+        """
+        shards = {}
+        for entry in sorted(self.pages.values(), key=lambda entry: entry["id"]):
+            doc_id = entry["id"]
+            for term, count in entry["terms"].items():
+                prefix = term_prefix(term)
+                if prefixes is not None and prefix not in prefixes:
+                    continue
+                shards.setdefault(prefix, {}).setdefault(term, []).extend((doc_id, count))
+        return shards
+
+    def write(self, directory):
+        """
+        Grava docs.json e os shards alterados em directory; shards sem termos
+        são removidos.
+
+        Returns:
+            A lista dos nomes de arquivos gravados
+        """
+        try:
+            existing = {name[:-len(".json")] for name in os.listdir(directory)
+                        if name.endswith(".json")}
+        except FileNotFoundError:
+            existing = set()
+        has_docs = "docs" in existing
+        existing.discard("docs")
+        all_prefixes = {term_prefix(term) for entry in self.pages.values() for term in entry["terms"]}
+        # Shards ausentes no disco (saída apagada, build novo) também são gravados
+        dirty = self.dirty | (all_prefixes - existing)
+        written = []
+        if self.docs_dirty or not has_docs:
+            docs = {entry["id"]: [entry["url"], entry["title"]] for entry in self.pages.values()}
+            if write_if_changed(os.path.join(directory, "docs.json"), dump(docs)):
+                written.append("docs.json")
+        shards = self.shards(dirty)
+        for prefix in sorted(dirty):
+            path = os.path.join(directory, f"{prefix}.json")
+            if prefix in shards:
+                if write_if_changed(path, dump(shards[prefix])):
+                    written.append(f"{prefix}.json")
+            elif prefix in existing:
+                remove_output(path, directory)
+        for prefix in existing - all_prefixes - dirty:
+            remove_output(os.path.join(directory, f"{prefix}.json"), directory)
+        self.dirty = set()
+        self.docs_dirty = False
+        return written
+
+
+def dump(data):
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
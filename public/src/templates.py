@@ -0,0 +1,146 @@
+"""
+Templates de página com marcadores {{ nome }} e includes {% include "arquivo" %}.
+
+Cada template é lido e analisado uma única vez: os includes são expandidos
+e o texto vira uma lista de segmentos literais e marcadores. Montar uma
+página é preencher os marcadores e fazer um único join. Os templates
+compilados ficam em cache até o mtime de algum dos arquivos mudar.
+"""
+import hashlib
+import os
+import re
+
+TOKEN_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}|\{%\s*include\s+"([^"]+)"\s*%\}')
+MAX_INCLUDE_DEPTH = 16
+
+
+class Template:
+    __slots__ = ("segments", "slots", "dependencies", "digest")
+
+    def __init__(self, segments, dependencies=()):
+        """
+        Args:
+            segments: Lista de segmentos; strings são literais e tuplas (nome,)
+                são marcadores
+            dependencies: Caminhos dos arquivos usados (template e includes)
+        """
+        self.segments = []
+        self.slots = []
+        literal = False
+        for segment in segments:
+            if isinstance(segment, tuple):
+                self.slots.append((len(self.segments), segment[0]))
+                self.segments.append("")
+                literal = False
+            elif literal:
+                self.segments[-1] += segment
+            else:
+                self.segments.append(segment)
+                literal = True
+        self.dependencies = tuple(dependencies)
+        self.digest = hashlib.sha256(self.source().encode("utf-8")).hexdigest()
+
+    def source(self):
+        """
+        Retorna o texto do template com os includes expandidos.
+        """
+        parts = list(self.segments)
+        for index, name in self.slots:
+            parts[index] = f"{{{{ {name} }}}}"
+        return "".join(parts)
+
+    def slot_names(self):
+        return {name for _, name in self.slots}
+
+    def render(self, values):
+        """
+        Preenche os marcadores com values (dict nome -> string) em um único join.
+        
+        Raises:
+            KeyError: Se um marcador do template não tiver valor
+        """
+        parts = self.segments.copy()
+        for index, name in self.slots:
+            parts[index] = values[name]
+        return "".join(parts)
+
+
+def parse_template(text, base_dir=".", dependencies=None, depth=0):
+    """
+    Divide o texto em segmentos literais e marcadores, expandindo os includes
+    (caminhos relativos a base_dir).
+    
+    Raises:
+        ValueError: Se os includes passarem de MAX_INCLUDE_DEPTH níveis
+            (por exemplo, um include circular)
+    """
+    if depth > MAX_INCLUDE_DEPTH:
+        raise ValueError("Template includes nested too deeply (circular include?)")
+    segments = []
+    start = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        if match.start() > start:
+            segments.append(text[start:match.start()])
+        name, include = match.groups()
+        if name is not None:
+            segments.append((name,))
+        else:
+            path = os.path.join(base_dir, include)
+            with open(path, encoding="utf-8") as fp:
+                included = fp.read()
+            if dependencies is not None:
+                dependencies.append(path)
+            segments.extend(parse_template(included, os.path.dirname(path), dependencies, depth + 1))
+        start = match.end()
+    if start < len(text):
+        segments.append(text[start:])
+    return segments
+
+
+def compile_template(text, base_dir="."):
+    dependencies = []
+    return Template(parse_template(text, base_dir, dependencies), dependencies)
+
+
+def file_stat(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class TemplateLoader:
+    """
+    Cache de templates compilados, invalidado pelo mtime e tamanho do
+    template e de todos os seus includes.
+    """
+    def __init__(self):
+        self.cache = {}
+
+    def load(self, path):
+        path = os.path.abspath(path)
+        cached = self.cache.get(path)
+        if cached is not None:
+            template, stats = cached
+            try:
+                if all(file_stat(dependency) == stat for dependency, stat in stats):
+                    return template
+            except OSError:
+                pass
+        with open(path, encoding="utf-8") as fp:
+            text = fp.read()
+        dependencies = [path]
+        template = Template(
+            parse_template(text, os.path.dirname(path), dependencies), dependencies
+        )
+        stats = [(dependency, file_stat(dependency)) for dependency in dependencies]
+        self.cache[path] = (template, stats)
+        return template
+
+
+default_loader = TemplateLoader()
+
+
+def load_template(path):
+    """
+    Carrega um template pelo cache padrão do processo.
+    """
+    return default_loader.load(path)
@@ -0,0 +1,111 @@
+import gzip
+import hashlib
+import os
+import unittest
+
+from assets import AssetPipeline, collapse_html, find_assets, hashed_name, minify_css
+from build import build_site
+from testutil import TempDirTestCase
+
+
+class TestAssets(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.static = os.path.join(self.root, "static")
+        self.output = os.path.join(self.root, "public")
+        os.makedirs(os.path.join(self.static, "img"))
+        self.write(os.path.join(self.static, "styles.css"), "p {\n  color : red;\n}\n")
+        self.write(os.path.join(self.static, "img", "logo.png"), "png")
+
+    def test_minify_css(self):
+        css = '/* tema */\na > b ,\ni {\n  content: "x  ;  y" ;\n  margin: 0 auto;\n}\n'
+        self.assertEqual(minify_css(css), 'a>b,i{content:"x  ;  y";margin:0 auto}')
+        self.assertEqual(minify_css("p { width: calc(1px + 2px); }"), "p{width:calc(1px + 2px)}")
+
+    def test_collapse_html(self):
+        html = "<div>\n  <p>a   b</p>\n  <pre><code>x\n    y</code></pre>\n</div>"
+        self.assertEqual(
+            collapse_html(html), "<div> <p>a b</p> <pre><code>x\n    y</code></pre> </div>"
+        )
+
+    def test_find_assets_skips_hashed_names(self):
+        self.write(os.path.join(self.static, hashed_name("styles.css", "0123456789abcdef")), "")
+        self.write(os.path.join(self.static, "notes.txt"), "")
+        self.assertEqual(find_assets(self.static), ["img/logo.png", "styles.css"])
+
+    def test_process_only_changed_assets(self):
+        pipeline = AssetPipeline(self.static, precompress=True)
+        assets, changed, removed = pipeline.process(self.output, {})
+        self.assertEqual(changed, ["img/logo.png", "styles.css"])
+        css_output = os.path.join(self.output, assets["styles.css"]["output"])
+        self.assertEqual(self.read(css_output), "p{color :red}")
+        self.assertEqual(gzip.decompress(self.read(css_output + ".gz", "rb")), b"p{color :red}")
+        self.assertFalse(os.path.exists(os.path.join(self.output, assets["img/logo.png"]["output"] + ".gz")))
+
+        self.assertEqual(pipeline.process(self.output, assets)[1], [])
+
+        self.write(os.path.join(self.static, "styles.css"), "p { color: blue }")
+        os.remove(os.path.join(self.static, "img", "logo.png"))
+        new_assets, changed, removed = pipeline.process(self.output, assets)
+        self.assertEqual(changed, ["styles.css"])
+        self.assertEqual(removed, ["img/logo.png"])
+        self.assertFalse(os.path.exists(css_output))
+        self.assertFalse(os.path.exists(css_output + ".gz"))
+        self.assertEqual(
+            pipeline.mapping, {"/styles.css": "/" + new_assets["styles.css"]["output"]}
+        )
+
+    def test_rewrite_references(self):
+        pipeline = AssetPipeline()
+        pipeline.mapping = {"/styles.css": "/styles.abc.css"}
+        html = '<link href="/styles.css"><a href="/other.css">/styles.css</a><img src="/styles.css">'
+        self.assertEqual(
+            pipeline.finish_page(html),
+            '<link href="/styles.abc.css"><a href="/other.css">/styles.css</a><img src="/styles.abc.css">',
+        )
+
+    def test_build_with_assets(self):
+        content = os.path.join(self.root, "content")
+        template = os.path.join(self.root, "template.html")
+        manifest = os.path.join(self.root, "manifest.json")
+        self.write(os.path.join(content, "index.md"), "# Home\n\nText")
+        self.write(template, '<link href="/styles.css">\n  {{ content }}')
+
+        def build():
+            return build_site(content, template, self.output, manifest,
+                              assets=AssetPipeline(self.static, minify_html=True))
+
+        result = build()
+        css = hashed_name("styles.css", result_hash(self.static, "styles.css"))
+        page = os.path.join(self.output, "index.html")
+        self.assertEqual(self.read(page), f'<link href="/{css}"> <div><h1>Home</h1><p>Text</p></div>')
+        self.assertEqual(build().rendered, [])
+        # Um asset alterado muda as referências, então todas as páginas são refeitas
+        self.write(os.path.join(self.static, "styles.css"), "p{}")
+        result = build()
+        self.assertEqual((result.rendered, result.assets), (["index.md"], ["styles.css"]))
+        self.assertNotIn(css, self.read(page))
+        # Uma imagem usada por uma única página só refaz essa página
+        self.write(os.path.join(content, "about.md"), "![Logo](/img/logo.png)")
+        self.assertEqual(build().rendered, ["about.md"])
+        self.write(os.path.join(self.static, "img", "logo.png"), "png2")
+        result = build()
+        self.assertEqual((result.rendered, result.assets), (["about.md"], ["img/logo.png"]))
+        logo = hashed_name("img/logo.png", result_hash(self.static, "img/logo.png"))
+        self.assertIn(f'src="/{logo}"', self.read(os.path.join(self.output, "about.html")))
+        # Com force todos os assets são processados de novo
+        result = build_site(content, template, self.output, manifest, force=True,
+                            assets=AssetPipeline(self.static, minify_html=True))
+        self.assertEqual(result.assets, ["img/logo.png", "styles.css"])
+        # Sem pipeline, as cópias com hash são removidas, mesmo com force
+        build_site(content, template, self.output, manifest, force=True)
+        self.assertEqual(sorted(os.listdir(self.output)), ["about.html", "index.html"])
+
+
+def result_hash(directory, source):
+    with open(os.path.join(directory, source), "rb") as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import json
+import unittest
+
+from benchsuite import DEFAULT_BASELINE, Corpus, compare_results, make_corpora, run_suite
+
+
+class TestBenchSuite(unittest.TestCase):
+    def test_corpora_are_reproducible(self):
+        first = make_corpora(seed=3)
+        second = make_corpora(seed=3)
+        for name in first:
+            self.assertEqual(first[name].paragraphs, second[name].paragraphs)
+
+    def test_nested_tree_renders(self):
+        corpus = Corpus("tiny", ["a **b**", "c", "[d](e)"], nested=True)
+        self.assertEqual(
+            corpus.build_tree().to_html(),
+            "<section><p>a <b>b</b></p><section><p>c</p>"
+            '<section><p><a href="e">d</a></p></section></section></section>',
+        )
+
+    def test_run_suite_times_every_stage(self):
+        results = run_suite({"tiny": Corpus("tiny", ["x *y* [z](w)"])}, repeat=1)
+        stages = results["results"]["tiny"]
+        self.assertIn("text_to_textnodes", stages)
+        self.assertIn("to_html", stages)
+        self.assertGreaterEqual(stages["to_html"]["best"], 0)
+
+    def test_compare_results(self):
+        baseline = {"results": {"small": {"to_html": {"best": 1.0}, "old": {"best": 1.0}}}}
+        current = {"results": {"small": {"to_html": {"best": 1.5}, "new": {"best": 1.0}}}}
+        self.assertEqual(
+            compare_results(current, baseline, threshold=0.25),
+            [("small", "to_html", 1.5, True)],
+        )
+        self.assertFalse(compare_results(current, baseline, threshold=0.6)[0][3])
+
+    def test_compare_skips_zero_baseline(self):
+        baseline = {"results": {"small": {"to_html": {"best": 0.0}}}}
+        current = {"results": {"small": {"to_html": {"best": 1.0}}}}
+        self.assertEqual(compare_results(current, baseline), [])
+
+    def test_default_baseline_is_versioned(self):
+        with open(DEFAULT_BASELINE, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+        self.assertIn("to_html", baseline["results"]["small"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import io
+import os
+import tempfile
+import unittest
+
+from blocks import (
+    BlockType,
+    extract_title,
+    iter_blocks,
+    markdown_to_html_node,
+    plain_text,
+    render_markdown_file,
+    write_markdown_html,
+)
+from inline_cache import InlineCache
+
+
+class TestBlocks(unittest.TestCase):
+    def test_markdown_to_html_node(self):
+        markdown = "## Heading with `code`\n\nThis is **bold**\nand [a link](https://example.com)."
+        node = markdown_to_html_node(markdown)
+        self.assertEqual(
+            node.to_html(),
+            "<div><h2>Heading with <code>code</code></h2>"
+            '<p>This is <b>bold</b> and <a href="https://example.com">a link</a>.</p></div>',
+        )
+
+    def test_markdown_to_html_node_with_cache(self):
+        markdown = "Footer with [home](/)\n\n## Title\n\nFooter with [home](/)"
+        cache = InlineCache()
+        self.assertEqual(
+            markdown_to_html_node(markdown, cache).to_html(),
+            markdown_to_html_node(markdown).to_html(),
+        )
+        self.assertEqual(cache.hits, 1)
+
+    def test_markdown_to_html_node_empty(self):
+        self.assertEqual(markdown_to_html_node("").to_html(), "<div></div>")
+
+    def test_hashes_without_space_are_paragraphs(self):
+        self.assertEqual(markdown_to_html_node("#tag").to_html(), "<div><p>#tag</p></div>")
+
+    def test_iter_blocks(self):
+        lines = [
+            "# Title\n",
+            "Intro line\n",
+            "continues\n",
+            "\n",
+            "- one\n",
+            "* two\n",
+            "1. first\n",
+            "2. second\n",
+            "> quoted\n",
+            ">more\n",
+            "```\n",
+            "code *not* parsed\n",
+            "\n",
+            "```\n",
+            "After",
+        ]
+        self.assertEqual(
+            list(iter_blocks(lines)),
+            [
+                (BlockType.HEADING, ["# Title"]),
+                (BlockType.PARAGRAPH, ["Intro line", "continues"]),
+                (BlockType.UNORDERED_LIST, ["- one", "* two"]),
+                (BlockType.ORDERED_LIST, ["1. first", "2. second"]),
+                (BlockType.QUOTE, ["> quoted", ">more"]),
+                (BlockType.CODE, ["code *not* parsed", ""]),
+                (BlockType.PARAGRAPH, ["After"]),
+            ],
+        )
+
+    def test_iter_blocks_is_lazy(self):
+        def lines():
+            yield "first paragraph"
+            yield ""
+            raise AssertionError("read past the first block")
+
+        blocks = iter_blocks(lines())
+        self.assertEqual(next(blocks), (BlockType.PARAGRAPH, ["first paragraph"]))
+
+    def test_unclosed_code_fence(self):
+        self.assertEqual(list(iter_blocks(["```", "x"])), [(BlockType.CODE, ["x"])])
+
+    def test_block_html(self):
+        markdown = (
+            "- a **b**\n- c\n\n1. one\n2. two\n\n> quote `x`\n> more\n\n"
+            "```\n<tag> & *x*\n```"
+        )
+        self.assertEqual(
+            markdown_to_html_node(markdown).to_html(),
+            "<div><ul><li>a <b>b</b></li><li>c</li></ul>"
+            "<ol><li>one</li><li>two</li></ol>"
+            "<blockquote>quote <code>x</code> more</blockquote>"
+            "<pre><code>&lt;tag&gt; &amp; *x*\n</code></pre></div>",
+        )
+
+    def test_empty_inline_content(self):
+        self.assertEqual(markdown_to_html_node("****").to_html(), "<div><p></p></div>")
+
+    def test_write_markdown_html(self):
+        markdown = "# Title\n\nSome *text*\n"
+        buffer = io.StringIO()
+        write_markdown_html(io.StringIO(markdown), buffer)
+        self.assertEqual(buffer.getvalue(), markdown_to_html_node(markdown).to_html())
+
+    def test_render_markdown_file(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "page.md")
+            with open(path, "w", encoding="utf-8") as fp:
+                fp.write("## Sub\r\n\r\ntext\r\n")
+            buffer = io.StringIO()
+            render_markdown_file(path, buffer)
+        self.assertEqual(buffer.getvalue(), "<div><h2>Sub</h2><p>text</p></div>")
+
+    def test_plain_text(self):
+        self.assertEqual(plain_text("a **b** `c` [d](e) ![f](g)"), "a b c d f")
+
+    def test_extract_title(self):
+        self.assertEqual(extract_title("Intro\n# Hello  \n## Sub"), "Hello")
+        self.assertIsNone(extract_title("## Only a subtitle"))
+        self.assertEqual(extract_title("```py\n# not title\n```\n# Real"), "Real")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+import multiprocessing
+import os
+import unittest
+from unittest import mock
+
+import build
+from build import build_site, render_pages, update_pages
+from testutil import TempDirTestCase
+
+
+class TestBuild(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        root = self.root
+        self.content = os.path.join(root, "content")
+        self.output = os.path.join(root, "public")
+        self.template = os.path.join(root, "template.html")
+        self.manifest = os.path.join(root, ".cache", "manifest.json")
+        os.makedirs(os.path.join(self.content, "blog"))
+        self.write(self.template, "<title>{{ title }}</title>{{ content }}")
+        self.write(os.path.join(self.content, "index.md"), "# Home\n\nWelcome")
+        self.write(os.path.join(self.content, "blog", "post.md"), "# Post\n\nText")
+
+    def build(self, **kwargs):
+        return build_site(self.content, self.template, self.output, self.manifest, **kwargs)
+
+    def test_first_build_renders_everything(self):
+        result = self.build()
+        self.assertEqual(result.rendered, ["blog/post.md", "index.md"])
+        self.assertEqual(
+            self.read(os.path.join(self.output, "index.html")),
+            "<title>Home</title><div><h1>Home</h1><p>Welcome</p></div>",
+        )
+
+    def test_title_is_plain_escaped_text(self):
+        self.write(os.path.join(self.content, "index.md"), "# a **b** </title><script>x</script>")
+        self.build()
+        self.assertTrue(
+            self.read(os.path.join(self.output, "index.html")).startswith(
+                "<title>a b &lt;/title&gt;&lt;script&gt;x&lt;/script&gt;</title>"
+            )
+        )
+
+    def test_title_skips_code_blocks(self):
+        self.write(os.path.join(self.content, "index.md"), "```py\n# not title\n```\n# Real")
+        self.build()
+        self.assertTrue(self.read(os.path.join(self.output, "index.html")).startswith("<title>Real</title>"))
+
+    def test_unchanged_pages_are_skipped(self):
+        self.build()
+        self.write(os.path.join(self.content, "index.md"), "# Home\n\nChanged")
+        result = self.build()
+        self.assertEqual(result.rendered, ["index.md"])
+        self.assertEqual(result.skipped, ["blog/post.md"])
+
+    def test_template_change_rebuilds_everything(self):
+        self.build()
+        self.write(self.template, "<h1>{{ title }}</h1>{{ content }}")
+        result = self.build()
+        self.assertEqual(len(result.rendered), 2)
+
+    def test_include_change_rebuilds_everything(self):
+        footer = os.path.join(os.path.dirname(self.template), "footer.html")
+        self.write(footer, "<footer></footer>")
+        self.write(self.template, '{{ content }}{% include "footer.html" %}')
+        self.build()
+        self.write(footer, "<footer>novo</footer>")
+        result = self.build()
+        self.assertEqual(len(result.rendered), 2)
+        self.assertTrue(self.read(os.path.join(self.output, "index.html")).endswith("novo</footer>"))
+
+    def test_inline_rules_change_rebuilds_everything(self):
+        from inline_rules import enable_rules
+
+        self.build()
+        self.write(os.path.join(self.content, "index.md"), "# Home\n\n~~old~~")
+        self.build()
+        enable_rules(["strikethrough"])
+        try:
+            result = self.build()
+        finally:
+            enable_rules([])
+        self.assertEqual(len(result.rendered), 2)
+        self.assertIn("<del>old</del>", self.read(os.path.join(self.output, "index.html")))
+
+    def test_missing_output_is_rendered_again(self):
+        self.build()
+        os.remove(os.path.join(self.output, "index.html"))
+        result = self.build()
+        self.assertEqual(result.rendered, ["index.md"])
+
+    def test_force(self):
+        self.build()
+        result = self.build(force=True)
+        self.assertEqual(len(result.rendered), 2)
+
+    def test_force_removes_orphans(self):
+        self.build()
+        os.remove(os.path.join(self.content, "blog", "post.md"))
+        result = self.build(force=True)
+        self.assertEqual((result.rendered, result.deleted), (["index.md"], ["blog/post.md"]))
+        self.assertFalse(os.path.exists(os.path.join(self.output, "blog", "post.html")))
+
+    def test_identical_output_is_not_rewritten(self):
+        first = self.build()
+        self.assertEqual(first.written, ["blog/post.md", "index.md"])
+        index = os.path.join(self.output, "index.html")
+        mtime = os.stat(index).st_mtime_ns
+        self.write(os.path.join(self.content, "blog", "post.md"), "# Post\n\nNew text")
+        result = self.build(force=True)
+        self.assertEqual(result.written, ["blog/post.md"])
+        self.assertEqual(result.unchanged, ["index.md"])
+        self.assertEqual(os.stat(index).st_mtime_ns, mtime)
+
+    def test_orphaned_outputs_are_deleted(self):
+        self.build()
+        os.remove(os.path.join(self.content, "blog", "post.md"))
+        result = self.build()
+        self.assertEqual(result.deleted, ["blog/post.md"])
+        self.assertFalse(os.path.exists(os.path.join(self.output, "blog")))
+        self.assertTrue(os.path.exists(os.path.join(self.output, "index.html")))
+
+    def test_corrupt_manifest_triggers_full_build(self):
+        self.build()
+        self.write(self.manifest, "not json")
+        result = self.build()
+        self.assertEqual(len(result.rendered), 2)
+
+    def test_parallel_build_matches_serial(self):
+        for i in range(10):
+            self.write(os.path.join(self.content, f"page{i}.md"), f"# Page {i}\n\n**{i}**")
+        self.build(workers=1)
+        serial = {
+            name: self.read(os.path.join(self.output, name))
+            for name in os.listdir(self.output) if name.endswith(".html")
+        }
+        result = self.build(force=True, workers=3, chunksize=2)
+        self.assertEqual(result.rendered, sorted(result.rendered))
+        self.assertEqual(len(result.rendered), 12)
+        for name, html in serial.items():
+            self.assertEqual(self.read(os.path.join(self.output, name)), html)
+
+    def test_render_pages_keeps_job_order(self):
+        jobs = [(f"p{i}.md", f"# T{i}", f"p{i}") for i in range(20)]
+        results = render_pages(jobs, "{{ title }}", workers=4, chunksize=3)
+        self.assertEqual([result[0] for result in results], [job[0] for job in jobs])
+        self.assertEqual(results[7][1], "T7")
+
+    def check_failing_page(self, **kwargs):
+        original = build.render_page
+
+        def render_page(markdown, template, default_title="", cache=None, collect=None):
+            if default_title == "post":
+                raise ValueError("boom")
+            return original(markdown, template, default_title, cache, collect)
+
+        with mock.patch("build.render_page", render_page):
+            result = self.build(**kwargs)
+        self.assertEqual(result.rendered, ["index.md"])
+        self.assertEqual(result.errors, [("blog/post.md", "ValueError: boom")])
+        self.assertTrue(os.path.exists(os.path.join(self.output, "index.html")))
+        # A página com erro é renderizada de novo no build seguinte
+        result = self.build(**kwargs)
+        self.assertEqual(result.rendered, ["blog/post.md"])
+
+    def test_failing_page_does_not_abort_build(self):
+        self.check_failing_page()
+
+    # O mock só chega aos workers criados com fork
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "requer fork")
+    def test_failing_page_does_not_abort_process_pool(self):
+        self.check_failing_page(workers=2)
+
+    def test_inline_cache_does_not_change_output(self):
+        self.build(inline_cache_size=0)
+        uncached = self.read(os.path.join(self.output, "index.html"))
+        cache_path = self.path(".cache", "inline.json")
+        self.build(force=True, inline_cache_path=cache_path)
+        self.assertEqual(self.read(os.path.join(self.output, "index.html")), uncached)
+        self.assertTrue(os.path.exists(cache_path))
+
+    def test_update_pages(self):
+        self.build()
+        self.write(os.path.join(self.content, "index.md"), "# Home\n\nUpdated")
+        os.remove(os.path.join(self.content, "blog", "post.md"))
+        result = update_pages(
+            self.content, self.template, self.output, self.manifest,
+            ["index.md", "blog/post.md"],
+        )
+        self.assertEqual(result.rendered, ["index.md"])
+        self.assertEqual(result.deleted, ["blog/post.md"])
+        self.assertIn("Updated", self.read(os.path.join(self.output, "index.html")))
+        # O manifesto atualizado faz o build seguinte pular tudo
+        result = self.build()
+        self.assertEqual(result.rendered, [])
+        self.assertEqual(result.deleted, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import contextlib
+import io
+import os
+import threading
+import unittest
+import urllib.request
+from unittest import mock
+
+from build import build_site
+from devserver import (
+    RELOAD_SCRIPT,
+    ReloadNotifier,
+    Watcher,
+    changed_sources,
+    inject_reload_script,
+    make_server,
+    snapshot,
+)
+from testutil import TempDirTestCase
+
+
+class TestDevServer(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        root = self.root
+        self.content = os.path.join(root, "content")
+        self.output = os.path.join(root, "public")
+        self.template = os.path.join(root, "template.html")
+        self.manifest = os.path.join(root, "manifest.json")
+        os.makedirs(os.path.join(self.content, "docs"))
+        self.write(self.template, "<body>{{ content }}</body>")
+        self.write(os.path.join(self.content, "index.md"), "Home")
+        self.write(os.path.join(self.content, "docs", "a.md"), "A")
+        build_site(self.content, self.template, self.output, self.manifest)
+
+    def test_snapshot_and_changed_sources(self):
+        old = snapshot(self.content)
+        self.assertEqual(sorted(old), ["docs/a.md", "index.md"])
+        new = dict(old)
+        new["docs/a.md"] = (0, 0)
+        new["docs/b.md"] = (0, 0)
+        del new["index.md"]
+        self.assertEqual(changed_sources(old, new), ["docs/a.md", "docs/b.md", "index.md"])
+
+    def test_watcher_renders_only_changed_page(self):
+        notifier = ReloadNotifier()
+        watcher = Watcher(self.content, self.template, self.output, self.manifest, notifier)
+        self.assertIsNone(watcher.poll())
+        self.write(os.path.join(self.content, "docs", "a.md"), "Changed **A**, longer")
+        result = watcher.poll()
+        self.assertEqual(result.rendered, ["docs/a.md"])
+        self.assertEqual(notifier.version, 1)
+        self.assertEqual(
+            self.read(os.path.join(self.output, "docs", "a.html")),
+            "<body><div><p>Changed <b>A</b>, longer</p></div></body>",
+        )
+
+    def test_watcher_removes_deleted_page(self):
+        watcher = Watcher(self.content, self.template, self.output, self.manifest)
+        os.remove(os.path.join(self.content, "index.md"))
+        result = watcher.poll()
+        self.assertEqual(result.deleted, ["index.md"])
+        self.assertFalse(os.path.exists(os.path.join(self.output, "index.html")))
+
+    def test_watcher_template_change_rebuilds(self):
+        watcher = Watcher(self.content, self.template, self.output, self.manifest)
+        self.write(self.template, "<main>{{ content }}</main>, changed")
+        result = watcher.poll()
+        self.assertEqual(len(result.rendered), 2)
+
+    def test_snapshot_does_not_follow_directory_symlinks(self):
+        os.symlink(self.content, os.path.join(self.content, "docs", "loop"))
+        self.assertEqual(sorted(snapshot(self.content)), ["docs/a.md", "index.md"])
+
+    def test_watcher_survives_poll_errors(self):
+        watcher = Watcher(self.content, self.template, self.output, self.manifest)
+        self.write(self.template, '{% include "missing.html" %}{{ content }}')
+        sleeps = []
+
+        def sleep(interval):
+            sleeps.append(interval)
+            if len(sleeps) == 2:
+                # Template corrigido: o próximo poll volta a funcionar
+                self.write(self.template, "<main>{{ content }}</main>, fixed")
+            if len(sleeps) == 3:
+                raise KeyboardInterrupt
+
+        stderr = io.StringIO()
+        with mock.patch("devserver.time.sleep", sleep), contextlib.redirect_stderr(stderr), \
+                contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(KeyboardInterrupt):
+                watcher.run()
+        self.assertEqual(stderr.getvalue().count("FileNotFoundError"), 1)
+        self.assertTrue(self.read(os.path.join(self.output, "index.html")).startswith("<main>"))
+
+    def test_inject_reload_script(self):
+        self.assertEqual(
+            inject_reload_script("<body>x</body>"), f"<body>x{RELOAD_SCRIPT}</body>"
+        )
+        self.assertEqual(inject_reload_script("x"), f"x{RELOAD_SCRIPT}")
+
+    def test_notifier_wait(self):
+        notifier = ReloadNotifier()
+        self.assertEqual(notifier.wait(0, timeout=0.01), 0)
+        threading.Timer(0.01, notifier.notify).start()
+        self.assertEqual(notifier.wait(0, timeout=5), 1)
+
+    def test_server_injects_reload_script(self):
+        server = make_server(self.output, ReloadNotifier(), port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/"
+            with urllib.request.urlopen(url) as response:
+                body = response.read().decode("utf-8")
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn("<p>Home</p>", body)
+        self.assertIn(RELOAD_SCRIPT, body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import io
+import os
+import tarfile
+import unittest
+from unittest import mock
+
+from build import build_site
+from fragments import FragmentStore
+from testutil import TempDirTestCase
+
+
+class TestFragmentStore(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.store = FragmentStore(os.path.join(self.root, "store"), max_bytes=25)
+
+    def test_get_and_put(self):
+        key = FragmentStore.key(1, "template", "# Home")
+        self.assertNotEqual(key, FragmentStore.key(1, "templ", "ate# Home"))
+        self.assertIsNone(self.store.get(key))
+        self.store.put(key, "<h1>Home</h1>")
+        self.store.put(key, "<h1>Home</h1>")
+        self.assertEqual(self.store.get(key), "<h1>Home</h1>")
+        self.assertEqual(self.store.stats(), {
+            "hits": 1, "misses": 1, "writes": 1, "failed_writes": 0, "evictions": 0,
+        })
+
+    def test_get_from_read_only_store(self):
+        key = FragmentStore.key("page")
+        self.store.put(key, "<p>x</p>")
+        with mock.patch("fragments.os.utime", side_effect=PermissionError):
+            self.assertEqual(self.store.get(key), "<p>x</p>")
+        self.assertEqual(self.store.hits, 1)
+
+    def test_put_and_trim_on_read_only_store(self):
+        key = FragmentStore.key("page")
+        with mock.patch("fragments.write_if_changed", side_effect=PermissionError):
+            self.store.put(key, "<p>x</p>")
+        self.assertEqual((self.store.writes, self.store.failed_writes), (0, 1))
+        self.assertIsNone(self.store.get(key))
+        with mock.patch("fragments.open", side_effect=PermissionError, create=True):
+            self.assertEqual(self.store.trim(), 0)
+
+    def test_trim_removes_least_recently_used(self):
+        keys = [FragmentStore.key(i) for i in range(3)]
+        for i, key in enumerate(keys):
+            self.store.put(key, "x" * 10)
+            os.utime(self.store.object_path(key), (i, i))
+        # Ler a primeira chave a torna a mais recente
+        self.store.get(keys[0])
+        self.assertEqual(self.store.trim(), 1)
+        self.assertIsNone(self.store.get(keys[1]))
+        self.assertEqual(self.store.size(), 20)
+
+    def test_tarball_round_trip(self):
+        key = FragmentStore.key("page")
+        self.store.put(key, "<p>x</p>")
+        tarball = os.path.join(self.root, "fragments.tar.gz")
+        self.assertEqual(self.store.export_tarball(tarball), 1)
+        # Entradas com outros nomes não são extraídas
+        with tarfile.open(tarball, "r:gz") as tar:
+            members = [(member, tar.extractfile(member).read()) for member in tar]
+        evil = tarfile.TarInfo("../evil.html")
+        evil.size = 1
+        with tarfile.open(tarball, "w:gz") as tar:
+            for member, data in members:
+                tar.addfile(member, io.BytesIO(data))
+            tar.addfile(evil, io.BytesIO(b"x"))
+        other = FragmentStore(os.path.join(self.root, "other"))
+        self.assertEqual(other.import_tarball(tarball), 1)
+        self.assertEqual(other.get(key), "<p>x</p>")
+        self.assertFalse(os.path.exists(os.path.join(self.root, "evil.html")))
+
+
+class TestBuildWithFragmentStore(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        root = self.root
+        self.content = os.path.join(root, "content")
+        self.template = os.path.join(root, "template.html")
+        os.makedirs(self.content)
+        self.write(self.template, "<title>{{ title }}</title>{{ content }}")
+        for name in ("a", "b"):
+            self.write(os.path.join(self.content, f"{name}.md"), f"# {name}\n\nText")
+        self.store = FragmentStore(os.path.join(root, "store"))
+
+    def build(self, runner):
+        return build_site(
+            self.content, self.template, os.path.join(self.root, runner, "public"),
+            os.path.join(self.root, runner, "manifest.json"), fragment_store=self.store,
+        )
+
+    def test_fresh_runner_uses_stored_pages(self):
+        first = self.build("runner1")
+        self.assertEqual((first.rendered, first.cached), (["a.md", "b.md"], []))
+        with mock.patch("build.render_page", side_effect=AssertionError("rendered")):
+            second = self.build("runner2")
+        self.assertEqual(second.errors, [])
+        self.assertEqual((second.rendered, second.cached), (["a.md", "b.md"], ["a.md", "b.md"]))
+        self.assertEqual(
+            self.read(self.path("runner2", "public", "a.html")),
+            "<title>a</title><div><h1>a</h1><p>Text</p></div>",
+        )
+
+    def test_read_only_store_does_not_abort_build(self):
+        def read_only_open(path, mode="r", **kwargs):
+            if "w" in mode:
+                raise PermissionError(path)
+            return open(path, mode, **kwargs)
+
+        with mock.patch("fragments.write_if_changed", side_effect=PermissionError), \
+                mock.patch("fragments.open", read_only_open, create=True):
+            result = self.build("runner1")
+        self.assertEqual((result.rendered, result.errors), (["a.md", "b.md"], []))
+        self.assertEqual(self.store.failed_writes, 2)
+        self.assertTrue(os.path.exists(self.path("runner1", "manifest.json")))
+        self.assertEqual(self.build("runner1").skipped, ["a.md", "b.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from fuzz import (
+    CHECKS,
+    DEFAULT_FIXTURES,
+    PATHOLOGICAL,
+    Failure,
+    check_scaling,
+    fuzz,
+    load_fixtures,
+    pathological,
+    replay_fixtures,
+    run_check,
+    save_fixture,
+    shrink,
+)
+
+
+class TestFuzz(unittest.TestCase):
+    def test_random_inputs_pass(self):
+        self.assertListEqual([], fuzz(seed=1, iterations=300, max_size=120))
+
+    def test_pathological_inputs_pass(self):
+        self.assertListEqual([], pathological(scale=1000))
+
+    def test_saved_fixtures_pass(self):
+        # As fixtures são regressões reais encontradas pelo fuzzer
+        self.assertTrue(load_fixtures(DEFAULT_FIXTURES))
+        self.assertListEqual([], replay_fixtures(DEFAULT_FIXTURES))
+
+    def test_crash_is_reported(self):
+        CHECKS["boom"] = lambda text: 1 / 0 if "!" in text else None
+        try:
+            failure = run_check("boom", "ab!cd", "test")
+            self.assertIn("ZeroDivisionError", failure.error)
+            self.assertEqual("!", shrink(failure).text)
+        finally:
+            del CHECKS["boom"]
+
+    def test_fixture_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = save_fixture(directory, Failure("render", "test", "**[x](", "erro"))
+            self.assertTrue(os.path.basename(path).startswith("render-"))
+            fixtures = load_fixtures(directory)
+            self.assertEqual("**[x](", fixtures[0]["input"])
+            self.assertListEqual([], replay_fixtures(directory))
+
+    def test_missing_fixture_directory(self):
+        self.assertListEqual([], load_fixtures("/nonexistent/fuzz"))
+
+    def test_scaling_is_linear(self):
+        # Limite folgado: um algoritmo quadrático fica perto de 8x
+        results, failures = check_scaling(scale=200, factor=8, max_ratio=4.0)
+        self.assertEqual(3 * len(PATHOLOGICAL), len(results))
+        self.assertListEqual([], failures)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import io
+import sys
+import unittest
+from unittest import mock
+
+from blocks import markdown_to_html_node
+from htmlir import HTMLTree
+from htmlnode import FrozenProps, LeafNode, ParentNode, RawHTMLNode, freeze
+from inline_cache import InlineCache
+from textnode import TextNode, TextType
+
+
+class TestHTMLTree(unittest.TestCase):
+    def sample(self):
+        shared = FrozenProps({"class": "item"})
+        return ParentNode("div", [
+            ParentNode("ul", [
+                ParentNode("li", [LeafNode("a", "one & two", {"href": "/1?a=1&b=2"})], shared),
+                ParentNode("li", [LeafNode(None, "plain <text>")], shared),
+            ]),
+            RawHTMLNode("<hr>"),
+            LeafNode("img", "", {"src": "x.png", "alt": "x"}),
+        ], {"id": "main"})
+
+    def test_render_matches_html_nodes(self):
+        node = self.sample()
+        self.assertEqual(HTMLTree.from_node(node).to_html(), node.to_html())
+
+    def test_frozen_subtree(self):
+        node = ParentNode("body", [freeze(self.sample()), LeafNode("p", "x")])
+        tree = HTMLTree.from_node(node)
+        self.assertEqual(tree.to_html(), node.to_html())
+        self.assertEqual(len(tree), 3)
+
+    def test_round_trip(self):
+        node = self.sample()
+        restored = HTMLTree.from_node(node).to_node()
+        self.assertEqual(repr(restored), repr(node))
+        self.assertEqual(restored.to_html(), node.to_html())
+        shared = restored.children[0].children[0].props
+        self.assertIsInstance(shared, FrozenProps)
+        self.assertIsInstance(restored.children[1], RawHTMLNode)
+
+    def test_shared_tables(self):
+        tree = HTMLTree.from_node(self.sample())
+        self.assertEqual(len(tree), 8)
+        self.assertEqual(tree.tag_table.count("li"), 1)
+        self.assertEqual(len(tree.props_table), 4)
+
+    def test_markdown_page(self):
+        node = markdown_to_html_node("# T\n\n- a *b*\n- [c](d)\n\n```\n<x>\n```")
+        self.assertEqual(HTMLTree.from_node(node).to_html(), node.to_html())
+
+    def test_from_blocks(self):
+        markdown = "# T & u\n\n- a *b*\n- [c](d)\n\n1. x\n\n> q\n\np `<y>`\n\n```\n<x>\n```"
+        expected = markdown_to_html_node(markdown).to_html()
+        # Sem a árvore de HTMLNode
+        with mock.patch("blocks.text_nodes_to_html_nodes") as html_nodes:
+            tree = HTMLTree.from_blocks(markdown.split("\n"))
+        html_nodes.assert_not_called()
+        self.assertEqual(tree.to_html(), expected)
+        collected = []
+        tree = HTMLTree.from_blocks(markdown.split("\n"), InlineCache(), collected.extend)
+        self.assertEqual(tree.to_html(), expected)
+        self.assertIn(TextNode("c", TextType.LINK, "d"), collected)
+        self.assertEqual(HTMLTree.from_blocks([]).to_html(), markdown_to_html_node("").to_html())
+
+    def test_builder(self):
+        tree = HTMLTree()
+        root = tree.add_parent("p")
+        tree.add_leaf(None, "a ", parent=root)
+        bold = tree.add_parent("b", parent=root)
+        tree.add_leaf(None, "b", parent=bold)
+        tree.add_raw("<br>", parent=root)
+        self.assertEqual(tree.to_html(), "<p>a <b>b</b><br></p>")
+        buffer = io.StringIO()
+        tree.write_html(buffer)
+        self.assertEqual(buffer.getvalue(), "<p>a <b>b</b><br></p>")
+        # Voltar a um nó já fechado quebraria a ordem de documento
+        with self.assertRaises(ValueError):
+            tree.add_leaf(None, "late", parent=bold)
+
+    def test_validation(self):
+        tree = HTMLTree()
+        tree.add_parent("div")
+        with self.assertRaises(ValueError):
+            tree.to_html()
+        with self.assertRaises(ValueError):
+            tree.add_parent("div")
+
+    def test_deep_tree(self):
+        node = LeafNode("b", "deep")
+        for _ in range(sys.getrecursionlimit() * 2):
+            node = ParentNode("span", [node])
+        tree = HTMLTree.from_node(node)
+        self.assertEqual(tree.to_html(), node.to_html())
+        self.assertEqual(tree.to_node().to_html(), node.to_html())
+
+
+if __name__ == "__main__":
+    unittest.main()
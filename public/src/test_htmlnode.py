@@ -1,3 +1,7 @@
+import copy
+import io
+import pickle
+import sys
 import unittest
 from htmlnode import *
 
@@ -46,6 +50,40 @@ class TestHTMLNode(unittest.TestCase):
             "<div><span><b>grandchild</b></span></div>",
         )
 
+    def test_iter_html_chunks(self):
+        parent_node = ParentNode("p", [LeafNode("b", "bold"), LeafNode(None, " text")])
+        self.assertEqual(
+            list(parent_node.iter_html()),
+            ["<p>", "<b>bold</b>", " text", "</p>"],
+        )
+
+    def test_write_html(self):
+        parent_node = ParentNode("div", [ParentNode("span", [LeafNode("b", "x")])], {"class": "c"})
+        buffer = io.StringIO()
+        parent_node.write_html(buffer)
+        self.assertEqual(buffer.getvalue(), '<div class="c"><span><b>x</b></span></div>')
+
+    def test_to_html_deep_nesting(self):
+        # Aninhamento maior que o limite de recursão
+        node = LeafNode("b", "deep")
+        for _ in range(sys.getrecursionlimit() * 2):
+            node = ParentNode("span", [node])
+        html = node.to_html()
+        self.assertTrue(html.startswith("<span><span>"))
+        self.assertTrue(html.endswith("</span></span>"))
+
+    def test_to_html_parent_without_children(self):
+        parent_node = ParentNode("div", [ParentNode("span", [])])
+        with self.assertRaises(ValueError):
+            parent_node.to_html()
+
+    def test_leaf_nodes_share_empty_defaults(self):
+        node1 = LeafNode("b", "one")
+        node2 = LeafNode("i", "two")
+        self.assertIs(node1.children, node2.children)
+        self.assertIs(node1.props, node2.props)
+        self.assertFalse(hasattr(node1, "__dict__"))
+
     def test_text(self):
         node = TextNode("This is a text node", TextType.TEXT)
         html_node = text_node_to_html_node(node)
@@ -71,13 +109,119 @@ class TestHTMLNode(unittest.TestCase):
         self.assertEqual(html_node.props["href"], "https://example.com")
     
     def test_code_with_html_characters(self):
-        # Teste com código que contém caracteres HTML que precisariam ser escapados
+        # Teste com código que contém caracteres HTML que precisam ser escapados
         code_text = "<div>This is HTML code & it has special chars</div>"
         node = TextNode(code_text, TextType.CODE)
         html_node = text_node_to_html_node(node)
         self.assertEqual(html_node.tag, "code")
         self.assertEqual(html_node.value, code_text)
-        self.assertEqual(html_node.to_html(), f"<code>{code_text}</code>")
+        self.assertEqual(
+            html_node.to_html(),
+            "<code>&lt;div&gt;This is HTML code &amp; it has special chars&lt;/div&gt;</code>",
+        )
+
+    def test_props_are_escaped(self):
+        node = LeafNode("a", "link", {"href": 'https://example.com/?a=1&b="2"'})
+        self.assertEqual(
+            node.to_html(),
+            '<a href="https://example.com/?a=1&amp;b=&quot;2&quot;">link</a>',
+        )
+
+    def test_frozen_props(self):
+        props = FrozenProps({"class": "nav item", "data-x": "<y>"})
+        node1 = LeafNode("span", "one", props)
+        node2 = LeafNode("span", "two", props)
+        self.assertEqual(node1.props_to_html(), ' class="nav item" data-x="&lt;y&gt;"')
+        self.assertIs(node1.props_to_html(), node2.props_to_html())
+        with self.assertRaises(TypeError):
+            props["class"] = "other"
+        with self.assertRaises(TypeError):
+            props.update({"id": "x"})
+
+    def test_frozen_props_pickle_and_deepcopy(self):
+        props = FrozenProps({"class": "nav"})
+        node = ParentNode("div", [LeafNode("span", "x", props)], props)
+        for copied in (pickle.loads(pickle.dumps(node)), copy.deepcopy(node)):
+            child_props = copied.children[0].props
+            self.assertIs(type(child_props), FrozenProps)
+            self.assertEqual(child_props.html, ' class="nav"')
+            self.assertEqual(copied.to_html(), node.to_html())
+            with self.assertRaises(TypeError):
+                child_props["id"] = "x"
+
+    def test_raw_html_node_is_not_escaped(self):
+        node = ParentNode("p", [RawHTMLNode("<b>x</b> &amp;")])
+        self.assertEqual(node.to_html(), "<p><b>x</b> &amp;</p>")
+    def test_invalid_text_type(self):
+        node = TextNode("text", "underline")
+        with self.assertRaises(ValueError):
+            text_node_to_html_node(node)
+        with self.assertRaises(ValueError):
+            text_nodes_to_html([node])
+
+    def test_text_nodes_to_html_nodes(self):
+        nodes = [
+            TextNode("plain ", TextType.TEXT),
+            TextNode("link", TextType.LINK, "https://example.com"),
+        ]
+        html_nodes = text_nodes_to_html_nodes(nodes)
+        self.assertEqual([node.tag for node in html_nodes], [None, "a"])
+        self.assertEqual(html_nodes[1].props["href"], "https://example.com")
+
+    def test_text_nodes_to_html_matches_leaf_nodes(self):
+        nodes = [
+            TextNode("plain & <simple>", TextType.TEXT),
+            TextNode("bold", TextType.BOLD),
+            TextNode("italic", TextType.ITALIC),
+            TextNode("code", TextType.CODE),
+            TextNode("link", TextType.LINK, "https://example.com"),
+            TextNode('"alt"', TextType.IMAGE, "https://example.com/img.png?a=1&b=2"),
+        ]
+        self.assertEqual(
+            text_nodes_to_html(nodes),
+            "".join(text_node_to_html_node(node).to_html() for node in nodes),
+        )
+
+    def test_frozen_node_caches_html(self):
+        nav = freeze(ParentNode("nav", [
+            ParentNode("a", [LeafNode(None, "Home")], {"href": "/"}),
+            RawHTMLNode("<hr>"),
+        ]))
+        html = nav.to_html()
+        self.assertEqual(html, '<nav><a href="/">Home</a><hr></nav>')
+        self.assertIs(nav.to_html(), html)
+        self.assertIsInstance(nav.children, tuple)
+        page = ParentNode("body", [nav, LeafNode("p", "x")])
+        self.assertEqual(page.to_html(), '<body><nav><a href="/">Home</a><hr></nav><p>x</p></body>')
+
+    def test_frozen_node_mutation_invalidates(self):
+        link = freeze(LeafNode("a", "Home", {"href": "/"}))
+        nav = freeze(ParentNode("nav", [link]))
+        self.assertEqual(nav.to_html(), '<nav><a href="/">Home</a></nav>')
+        link.value = "Start"
+        self.assertEqual(nav.to_html(), '<nav><a href="/">Start</a></nav>')
+        nav.children = [LeafNode("b", "x")]
+        self.assertEqual(nav.to_html(), "<nav><b>x</b></nav>")
+        with self.assertRaises(TypeError):
+            nav.props["class"] = "main"
+        nav.props = {"class": "main"}
+        self.assertEqual(nav.to_html(), '<nav class="main"><b>x</b></nav>')
+
+    def test_frozen_deep_nesting(self):
+        # Aninhamento maior que o limite de recursão, ao congelar e ao serializar
+        node = LeafNode("b", "deep")
+        for _ in range(sys.getrecursionlimit() * 2):
+            node = ParentNode("span", [node])
+        frozen = freeze(node)
+        html = frozen.to_html()
+        self.assertEqual(html, node.to_html())
+        self.assertIs(frozen.to_html(), html)
+        self.assertEqual(ParentNode("main", [frozen]).to_html(), f"<main>{html}</main>")
+
+    def test_freeze_validates_like_parent_node(self):
+        with self.assertRaises(ValueError):
+            freeze(ParentNode("div", [])).to_html()
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from inline_cache import InlineCache
+from textnode import TextNode, TextType
+
+
+class TestInlineCache(unittest.TestCase):
+    def test_text_to_textnodes(self):
+        cache = InlineCache()
+        text = "Some **bold** and a [link](https://example.com)"
+        nodes = cache.text_to_textnodes(text)
+        self.assertIsInstance(nodes, tuple)
+        self.assertEqual(list(nodes), TextNode.text_to_textnodes(text))
+        self.assertIs(cache.text_to_textnodes(text), nodes)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_text_to_html(self):
+        cache = InlineCache()
+        html = cache.text_to_html("a `b` ![c](d.png)")
+        self.assertEqual(html, 'a <code>b</code> <img src="d.png" alt="c"></img>')
+        self.assertEqual(cache.text_to_html("a `b` ![c](d.png)"), html)
+        self.assertEqual(cache.hits, 1)
+
+    def test_lru_eviction(self):
+        cache = InlineCache(maxsize=2)
+        cache.text_to_html("one")
+        cache.text_to_html("two")
+        cache.text_to_html("one")
+        cache.text_to_html("three")
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(cache), 2)
+        # "two" foi o menos usado recentemente
+        cache.text_to_html("two")
+        self.assertEqual(cache.misses, 4)
+
+    def test_save_and_load(self):
+        cache = InlineCache()
+        cache.text_to_textnodes("*x* [y](z)")
+        cache.text_to_html("**w**")
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "inline.json")
+            cache.save(path)
+            restored = InlineCache()
+            self.assertEqual(restored.load(path), 2)
+        self.assertEqual(
+            list(restored.text_to_textnodes("*x* [y](z)")),
+            [
+                TextNode("x", TextType.ITALIC),
+                TextNode(" ", TextType.TEXT),
+                TextNode("y", TextType.LINK, "z"),
+            ],
+        )
+        self.assertEqual(restored.text_to_html("**w**"), "<b>w</b>")
+        self.assertEqual(restored.hits, 2)
+
+    def test_load_missing_file(self):
+        self.assertEqual(InlineCache().load("/nonexistent/inline.json"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
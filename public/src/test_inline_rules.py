@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+
+from blocks import markdown_to_html_node
+from htmlnode import TEXT_NODE_CONVERTERS, TEXT_NODE_RENDERERS, text_nodes_to_html_nodes
+from inline_cache import InlineCache
+from inline_rules import RULES, InlineRule, active_rules, enable_rules, register_rule
+from textnode import TextNode, TextType, inline_extension
+
+
+class TestInlineRules(unittest.TestCase):
+    def tearDown(self):
+        enable_rules([])
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(inline_extension())
+        self.assertEqual(
+            markdown_to_html_node("a ~~b~~ ==c== [^1]").to_html(),
+            "<div><p>a ~~b~~ ==c== [^1]</p></div>",
+        )
+
+    def test_enabled_rules(self):
+        enable_rules(["strikethrough", "highlight", "footnote-ref"])
+        self.assertEqual(
+            markdown_to_html_node("a ~~b~~ **c** ==d== [^1] [e](f)").to_html(),
+            '<div><p>a <del>b</del> <b>c</b> <mark>d</mark> '
+            '<a href="#fn-1" id="fnref-1" class="footnote-ref">1</a> <a href="f">e</a></p></div>',
+        )
+
+    def test_only_enabled_rules_apply(self):
+        enable_rules(["highlight"])
+        self.assertEqual(active_rules(), ("highlight",))
+        self.assertEqual(
+            markdown_to_html_node("~~a~~ ==b==").to_html(),
+            "<div><p>~~a~~ <mark>b</mark></p></div>",
+        )
+
+    def test_disable_removes_html_mapping(self):
+        rule = RULES["strikethrough"]
+        enable_rules(["strikethrough"])
+        self.assertIn(rule.text_type, TEXT_NODE_RENDERERS)
+        enable_rules([])
+        self.assertNotIn(rule.text_type, TEXT_NODE_CONVERTERS)
+        self.assertNotIn(rule.text_type, TEXT_NODE_RENDERERS)
+        self.assertEqual(active_rules(), ())
+
+    def test_text_without_triggers_is_unchanged(self):
+        enable_rules(["strikethrough"])
+        self.assertListEqual(
+            TextNode.text_to_textnodes("a *b* ~c~"), TextNode.tokenize_inline("a *b* ~c~")
+        )
+
+    def test_unclosed_rule_is_text(self):
+        enable_rules(["strikethrough"])
+        self.assertListEqual(
+            TextNode.text_to_textnodes("~~a~~ b ~~c"),
+            [
+                TextNode("a", RULES["strikethrough"].text_type),
+                TextNode(" b ~~c", TextType.TEXT),
+            ],
+        )
+
+    def test_converter_matches_renderer(self):
+        enable_rules(["strikethrough", "footnote-ref"])
+        nodes = TextNode.text_to_textnodes("x ~~<y>~~ [^n]")
+        self.assertEqual(
+            "".join(node.to_html() for node in text_nodes_to_html_nodes(nodes)),
+            InlineCache().text_to_html("x ~~<y>~~ [^n]"),
+        )
+
+    def test_custom_rule(self):
+        register_rule(InlineRule("kbd", "[[", r"\[\[([^\[\]]+)\]\]", "kbd"))
+        try:
+            enable_rules(["kbd"])
+            self.assertEqual(
+                markdown_to_html_node("press [[Ctrl]]").to_html(),
+                "<div><p>press <kbd>Ctrl</kbd></p></div>",
+            )
+        finally:
+            del RULES["kbd"]
+
+    def test_rejects_named_groups_and_references(self):
+        for pattern in (r"(~)a\1", r"(?P<d>~)a(?P=d)", r"(~)?a(?(1)~)", r"(?P<d>~)a"):
+            with self.assertRaises(ValueError):
+                InlineRule("bad", "~", pattern, "span")
+        # Uma barra escapada seguida de um dígito não é uma referência
+        self.assertEqual(InlineRule("ok", "\\", r"\\1(x)", "span").groups, 1)
+
+    def test_nesting_limits(self):
+        # Os limites documentados em inline_rules: as regras não veem o
+        # conteúdo de outros nós nem tratam o próprio conteúdo como Markdown
+        enable_rules(["strikethrough", "highlight"])
+        self.assertEqual(
+            markdown_to_html_node("~~a *b* c~~").to_html(),
+            "<div><p>~~a <i>b</i> c~~</p></div>",
+        )
+        self.assertEqual(
+            markdown_to_html_node("==see [x](y)==").to_html(),
+            '<div><p>==see <a href="y">x</a>==</p></div>',
+        )
+        self.assertEqual(
+            markdown_to_html_node("**~~a~~**").to_html(), "<div><p><b>~~a~~</b></p></div>"
+        )
+
+    def test_unknown_rule(self):
+        with self.assertRaises(ValueError):
+            enable_rules(["nope"])
+
+    def test_inline_cache_file_depends_on_rules(self):
+        enable_rules(["strikethrough"])
+        cache = InlineCache()
+        cache.text_to_textnodes("~~a~~")
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "inline.json")
+            cache.save(path)
+            restored = InlineCache()
+            self.assertEqual(restored.load(path), 1)
+            self.assertEqual(
+                restored.text_to_textnodes("~~a~~"),
+                (TextNode("a", RULES["strikethrough"].text_type),),
+            )
+            enable_rules([])
+            self.assertEqual(InlineCache().load(path), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import unittest
+from unittest import mock
+
+from assets import AssetPipeline
+from build import build_site
+from linkgraph import LinkIndex, extract_page_links, resolve_target
+from testutil import TempDirTestCase
+
+
+class TestLinkGraph(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        root = self.root
+        self.content = os.path.join(root, "content")
+        self.output = os.path.join(root, "public")
+        self.template = os.path.join(root, "template.html")
+        self.manifest = os.path.join(root, "manifest.json")
+        self.index = os.path.join(root, "links.json")
+        os.makedirs(os.path.join(self.content, "blog"))
+        os.makedirs(os.path.join(self.output, "img"))
+        self.write(self.template, "{{ content }}")
+        self.write(os.path.join(self.output, "img", "logo.png"), "png")
+        self.write(os.path.join(self.content, "index.md"), (
+            "# Home\n\n[Post](/blog/post.html) [Blog](blog/) [Site](https://example.com)"
+            " ![Logo](/img/logo.png)"
+        ))
+        self.write(os.path.join(self.content, "blog", "index.md"), "- [Home](../index.md)")
+        self.write(os.path.join(self.content, "blog", "post.md"), (
+            "[Missing](/blog/nope) ![Gone](../img/gone.png) [Top](#top)\n\n"
+            "```\n[Code](/not/a/link)\n```"
+        ))
+
+    def build(self, **kwargs):
+        return build_site(self.content, self.template, self.output, self.manifest,
+                          link_index_path=self.index, check_links=True, **kwargs)
+
+    def test_extract_page_links(self):
+        markdown = "# [a](/x)\n\n`[b](y)` ![c](z.png)\n\n```\n[d](w)\n```\n\n1. [e](v)"
+        self.assertEqual(
+            extract_page_links(markdown),
+            [("link", "/x"), ("image", "z.png"), ("link", "v")],
+        )
+
+    def test_resolve_target(self):
+        self.assertEqual(resolve_target("blog/post.md", "../img/a.png?v=1"), "img/a.png")
+        self.assertEqual(resolve_target("blog/post.md", "other#part"), "blog/other")
+        self.assertEqual(resolve_target("blog/post.md", "/"), "")
+        self.assertEqual(resolve_target("index.md", "blog/"), "blog/")
+
+    def test_build_reports_broken_links(self):
+        result = self.build()
+        self.assertEqual(result.broken_links, [
+            ("blog/post.md", "image", "../img/gone.png"),
+            ("blog/post.md", "link", "/blog/nope"),
+        ])
+        self.assertEqual(LinkIndex.load(self.index).targets()["blog/post.html"], ["index.md"])
+
+    def test_links_come_from_rendering(self):
+        # As páginas renderizadas não são tokenizadas de novo para o índice
+        with mock.patch("linkgraph.extract_page_links", side_effect=AssertionError):
+            self.build(workers=2)
+        index = LinkIndex.load(self.index)
+        self.assertEqual(index.pages["blog/post.md"]["links"], [
+            list(link) for link in extract_page_links(self.read(os.path.join(self.content, "blog", "post.md")))
+        ])
+        # Páginas puladas com o índice perdido são lidas do Markdown
+        os.remove(self.index)
+        result = self.build()
+        self.assertEqual(result.rendered, [])
+        self.assertEqual(LinkIndex.load(self.index).pages, index.pages)
+
+    def test_hashed_assets_are_not_broken(self):
+        static = self.path("static")
+        self.write(os.path.join(static, "styles.css"), "a {}")
+        self.write(os.path.join(static, "img", "gone.png"), "png")
+        self.write(os.path.join(self.content, "about.md"), "![logo](/img/gone.png) [css](/styles.css)")
+        result = self.build(assets=AssetPipeline(static))
+        self.assertEqual(result.broken_links, [("blog/post.md", "link", "/blog/nope")])
+
+    def test_index_updates_incrementally(self):
+        self.build()
+        index = LinkIndex.load(self.index)
+        self.write(os.path.join(self.content, "blog", "post.md"), "[Home](/)")
+        os.remove(os.path.join(self.content, "blog", "index.md"))
+        # Sem blog/index.html, o link "blog/" da página inicial quebra
+        result = self.build()
+        self.assertEqual(result.broken_links, [("index.md", "link", "blog/")])
+        updated = LinkIndex.load(self.index)
+        self.assertEqual(sorted(updated.pages), ["blog/post.md", "index.md"])
+        self.assertEqual(updated.pages["index.md"], index.pages["index.md"])
+        self.assertFalse(updated.update("blog/post.md", "[Home](/)", updated.pages["blog/post.md"]["hash"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
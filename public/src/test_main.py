@@ -0,0 +1,91 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+from main import __version__, main
+from testutil import TempDirTestCase
+
+
+class TestMain(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        self.page = self.write("post.md", "Some **bold** text")
+
+    def run_main(self, *argv):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            code = main(argv)
+        return code, stdout.getvalue()
+
+    def test_version(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), self.assertRaises(SystemExit):
+            main(["--version"])
+        self.assertIn(__version__, stdout.getvalue())
+
+    def test_render(self):
+        self.assertEqual(
+            self.run_main("render", self.page), (0, "<div><p>Some <b>bold</b> text</p></div>\n")
+        )
+
+    def test_render_to_file_streams_blocks(self):
+        output = self.path("post.html")
+        with mock.patch("blocks.markdown_to_html_node") as whole_document:
+            self.assertEqual(self.run_main("render", self.page, "-o", output), (0, ""))
+        whole_document.assert_not_called()
+        self.assertEqual(self.read(output), "<div><p>Some <b>bold</b> text</p></div>")
+
+    def test_render_with_template(self):
+        template = self.write("template.html", "<title>{{ title }}</title>{{ content }}")
+        output = self.path("post.html")
+        self.assertEqual(self.run_main("render", self.page, "--template", template, "-o", output), (0, ""))
+        self.assertEqual(
+            self.read(output), "<title>post</title><div><p>Some <b>bold</b> text</p></div>"
+        )
+
+    def test_render_with_html_ir(self):
+        with mock.patch("blocks.markdown_to_html_node") as whole_document:
+            self.assertEqual(
+                self.run_main("render", self.page, "--html-ir"),
+                (0, "<div><p>Some <b>bold</b> text</p></div>\n"),
+            )
+            template = self.write("template.html", "<title>{{ title }}</title>{{ content }}")
+            output = self.path("post.html")
+            self.assertEqual(
+                self.run_main("render", self.page, "--html-ir", "--template", template, "-o", output),
+                (0, ""),
+            )
+        whole_document.assert_not_called()
+        self.assertEqual(
+            self.read(output), "<title>post</title><div><p>Some <b>bold</b> text</p></div>"
+        )
+
+    def test_render_with_inline_rule(self):
+        from inline_rules import enable_rules
+
+        self.write(self.page, "~~old~~ text")
+        try:
+            code, stdout = self.run_main("render", self.page, "--inline-rule", "strikethrough")
+        finally:
+            enable_rules([])
+        self.assertEqual((code, stdout), (0, "<div><p><del>old</del> text</p></div>\n"))
+
+    def test_quick_commands_skip_build_pipeline(self):
+        # Processo novo: os outros testes já importaram o pipeline neste processo
+        code = (
+            "import sys; import main; main.main(['render', sys.argv[1]]); "
+            "print(sorted({'build', 'assets', 'inline_cache'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, self.page], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        self.assertTrue(result.stdout.endswith("[]\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+import unittest
+
+import blocks
+import htmlnode
+from build import build_site
+from htmlnode import ParentNode
+from inline_cache import InlineCache
+from profiling import BuildProfiler
+from textnode import TextNode
+
+
+class TestProfiling(unittest.TestCase):
+    def test_instrument_restores_functions(self):
+        originals = (
+            TextNode.__dict__["text_to_textnodes"],
+            TextNode.__dict__["split_nodes_delimiter"],
+            ParentNode.__dict__["to_html"],
+            htmlnode.text_nodes_to_html_nodes,
+            blocks.text_nodes_to_html_nodes,
+        )
+        profiler = BuildProfiler()
+        with profiler.instrument():
+            self.assertIsNot(blocks.text_nodes_to_html_nodes, originals[4])
+        self.assertEqual(
+            originals,
+            (
+                TextNode.__dict__["text_to_textnodes"],
+                TextNode.__dict__["split_nodes_delimiter"],
+                ParentNode.__dict__["to_html"],
+                htmlnode.text_nodes_to_html_nodes,
+                blocks.text_nodes_to_html_nodes,
+            ),
+        )
+
+    def test_page_stats(self):
+        profiler = BuildProfiler()
+        with profiler.instrument():
+            with profiler.page("a.md"):
+                nodes = TextNode.text_to_textnodes("x **y** [z](w)", legacy=True)
+                ParentNode("p", htmlnode.text_nodes_to_html_nodes(nodes)).to_html()
+        stages = profiler.pages[0].stages
+        self.assertEqual(stages["text_to_textnodes"][0], 1)
+        self.assertEqual(stages["text_to_textnodes"][2], 4)
+        self.assertEqual(stages["split_nodes_delimiter"][0], 3)
+        self.assertEqual(stages["split_nodes_link"][0], 1)
+        self.assertEqual(stages["to_html"][3], len('<p>x <b>y</b> <a href="w">z</a></p>'))
+        self.assertEqual(profiler.pages[0].source, "a.md")
+
+    def test_hooks_follow_imported_names(self):
+        # blocks importa text_nodes_to_html ao recolher os nós das páginas
+        profiler = BuildProfiler()
+        with profiler.instrument():
+            with profiler.page("a.md"):
+                blocks.markdown_to_html_node("x **y**", collect=lambda nodes: None).to_html()
+        self.assertEqual(profiler.pages[0].stages["text_nodes_to_html_nodes"][0], 1)
+        self.assertIs(blocks.text_nodes_to_html, htmlnode.text_nodes_to_html)
+        with profiler.instrument():
+            with profiler.page("b.md"):
+                blocks.markdown_to_html_node("x", cache=InlineCache(), collect=lambda nodes: None)
+        self.assertEqual(profiler.pages[1].stages["text_nodes_to_html"][0], 1)
+
+    def test_build_with_profiler_writes_reports(self):
+        with tempfile.TemporaryDirectory() as root:
+            content = os.path.join(root, "content")
+            os.makedirs(content)
+            for name in ("a", "b"):
+                with open(os.path.join(content, f"{name}.md"), "w", encoding="utf-8") as fp:
+                    fp.write(f"# {name}\n\n*text* {name}")
+            template = os.path.join(root, "template.html")
+            with open(template, "w", encoding="utf-8") as fp:
+                fp.write("{{ content }}")
+            profiler = BuildProfiler(cprofile=True)
+            build_site(content, template, os.path.join(root, "out"),
+                       os.path.join(root, "manifest.json"), workers=4, profiler=profiler)
+            paths = profiler.write_reports(os.path.join(root, "report"))
+            with open(paths[1], encoding="utf-8") as fp:
+                report = json.load(fp)
+            self.assertEqual(len(paths), 3)
+            self.assertTrue(os.path.exists(paths[2]))
+        self.assertEqual(report["pages"], 2)
+        self.assertIn("text_to_textnodes", report["stages"])
+        self.assertEqual(
+            {page["source"] for page in report["slowest_pages"]}, {"a.md", "b.md"}
+        )
+        self.assertGreater(report["bytes"], 0)
+        self.assertIn("Páginas mais lentas", profiler.format_report())
+
+
+if __name__ == "__main__":
+    unittest.main()
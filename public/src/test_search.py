@@ -0,0 +1,81 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+from build import build_site
+from search import SearchIndex, page_terms, tokenize
+from testutil import TempDirTestCase
+
+
+class TestSearch(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        root = self.root
+        self.content = os.path.join(root, "content")
+        self.output = os.path.join(root, "public")
+        self.template = os.path.join(root, "template.html")
+        self.state = os.path.join(root, "search.json")
+        os.makedirs(self.content)
+        self.write(self.template, "{{ content }}")
+        self.write(os.path.join(self.content, "index.md"), "# Casa\n\nA casa e o **jardim**")
+        self.write(os.path.join(self.content, "post.md"), "Um [jardim](https://example.com/casa)")
+
+    def shard(self, name):
+        with open(os.path.join(self.output, "search", name), encoding="utf-8") as fp:
+            return json.load(fp)
+
+    def build(self):
+        return build_site(self.content, self.template, self.output,
+                          self.path("manifest.json"),
+                          search_index_path=self.state)
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("A Ação do snake_case, x 42!"), ["acao", "snake", "case", "42"])
+
+    def test_page_terms(self):
+        markdown = "# Título\n\n`código` e ![Gato](gato.png) [casa](/casa-url)\n\n```\nfora\n```"
+        self.assertEqual(page_terms(markdown), {"titulo": 1, "codigo": 1, "gato": 1, "casa": 1})
+
+    def test_terms_come_from_rendering(self):
+        self.write(os.path.join(self.content, "post.md"), self.read(os.path.join(self.content, "post.md"))
+                   + "\n\n- `código` e ![Gato](gato.png)\n\n```\nfora\n```")
+        with mock.patch("search.page_terms", side_effect=AssertionError):
+            self.build()
+        index = SearchIndex.load(self.state)
+        for source in ("index.md", "post.md"):
+            markdown = self.read(os.path.join(self.content, source))
+            self.assertEqual(index.pages[source]["terms"], page_terms(markdown))
+
+    def test_title_is_plain_text(self):
+        self.write(os.path.join(self.content, "index.md"), "# Home *page* <x> [y](/z)\n\nA casa")
+        self.build()
+        self.assertEqual(self.shard("docs.json")["0"], ["/index.html", "Home page <x> y"])
+
+    def test_build_writes_shards(self):
+        self.build()
+        self.assertEqual(self.shard("docs.json"), {"0": ["/index.html", "Casa"], "1": ["/post.html", "post"]})
+        self.assertEqual(self.shard("ca.json"), {"casa": [0, 2]})
+        self.assertEqual(self.shard("ja.json"), {"jardim": [0, 1, 1, 1]})
+
+    def test_incremental_update(self):
+        self.build()
+        ca_mtime = os.stat(os.path.join(self.output, "search", "ca.json")).st_mtime_ns
+        self.write(os.path.join(self.content, "post.md"), "Novo texto")
+        index = SearchIndex.load(self.state)
+        self.assertFalse(index.update("index.md", "", index.pages["index.md"]["hash"], "/index.html"))
+        self.build()
+        self.assertEqual(self.shard("ja.json"), {"jardim": [0, 1]})
+        self.assertEqual(self.shard("no.json"), {"novo": [1, 1]})
+        # Shards sem termos alterados não são regravados
+        self.assertEqual(os.stat(os.path.join(self.output, "search", "ca.json")).st_mtime_ns, ca_mtime)
+        os.remove(os.path.join(self.content, "index.md"))
+        self.build()
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.output, "search"))),
+            ["docs.json", "no.json", "te.json"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from templates import TemplateLoader, compile_template
+from testutil import TempDirTestCase
+
+
+class TestTemplates(TempDirTestCase):
+    def test_render(self):
+        template = compile_template("<title>{{title}}</title><main>{{ content }}</main>")
+        self.assertEqual(
+            template.render({"title": "Home", "content": "<p>{{ title }}</p>"}),
+            "<title>Home</title><main><p>{{ title }}</p></main>",
+        )
+        self.assertEqual(template.slot_names(), {"title", "content"})
+        self.assertEqual(template.segments, ["<title>", "", "</title><main>", "", "</main>"])
+
+    def test_missing_value(self):
+        with self.assertRaises(KeyError):
+            compile_template("{{ title }}").render({})
+
+    def test_include(self):
+        self.write("head.html", '<head>{% include "meta.html" %}</head>')
+        self.write("meta.html", "<title>{{ title }}</title>")
+        template = compile_template('{% include "head.html" %}{{ content }}', self.root)
+        self.assertEqual(
+            template.render({"title": "T", "content": "C"}), "<head><title>T</title></head>C"
+        )
+        self.assertEqual(template.source(), "<head><title>{{ title }}</title></head>{{ content }}")
+        self.assertEqual(len(template.segments), 4)
+
+    def test_circular_include(self):
+        self.write("a.html", '{% include "a.html" %}')
+        with self.assertRaises(ValueError):
+            compile_template('{% include "a.html" %}', self.root)
+
+    def test_loader_cache(self):
+        loader = TemplateLoader()
+        self.write("part.html", "<nav></nav>", mtime=1_000_000_000)
+        path = self.write("page.html", '{% include "part.html" %}{{ content }}', mtime=1_000_000_000)
+        template = loader.load(path)
+        self.assertIs(loader.load(path), template)
+        # Mudar apenas o include invalida o template que o usa
+        self.write("part.html", "<nav>x</nav>", mtime=2_000_000_000)
+        changed = loader.load(path)
+        self.assertIsNot(changed, template)
+        self.assertNotEqual(changed.digest, template.digest)
+        self.assertEqual(changed.render({"content": ""}), "<nav>x</nav>")
+
+
+if __name__ == "__main__":
+    unittest.main()
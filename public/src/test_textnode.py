@@ -24,6 +24,10 @@ class TestTextNode(unittest.TestCase):
         node2 = TextNode("This is a text node", TextType.BOLD, "https://example.com")
         self.assertNotEqual(node, node2)
 
+    def test_slots(self):
+        node = TextNode("This is a text node", TextType.BOLD)
+        self.assertFalse(hasattr(node, "__dict__"))
+
     # Testes para a função split_nodes_delimiter
     def test_split_nodes_delimiter_bold(self):
         # Teste para delimitador de negrito
@@ -120,6 +124,51 @@ class TestTextNode(unittest.TestCase):
         matches = TextNode.extract_markdown_links(text)
         self.assertListEqual([("link", "https://example.com")], matches)
 
+    def test_extract_markdown_links_image_only(self):
+        # Um texto com "[" apenas dentro de imagens não tem links
+        text = "Only an ![image](https://example.com/img.jpg) here"
+        self.assertListEqual([], TextNode.extract_markdown_links(text))
+
+    def test_extract_markdown_spans(self):
+        text = "![a](x.png) and [b](y.html)"
+        spans = TextNode.extract_markdown_spans(text)
+        self.assertListEqual(
+            [
+                (TextType.IMAGE, 0, 11, "a", "x.png"),
+                (TextType.LINK, 16, 27, "b", "y.html"),
+            ],
+            spans,
+        )
+        self.assertEqual(text[spans[1][1]:spans[1][2]], "[b](y.html)")
+
+    def test_extract_markdown_spans_image_wins_overlap(self):
+        # "[](![)" e "![)]()" se sobrepõem; como no pipeline antigo, vale a imagem
+        text = "[](![)]()"
+        self.assertListEqual(
+            [(TextType.IMAGE, 3, 9, ")", "")],
+            TextNode.extract_markdown_spans(text),
+        )
+        self.assertListEqual(
+            TextNode.text_to_textnodes_legacy(text), TextNode.tokenize_inline(text)
+        )
+
+    def test_extract_markdown_spans_adjacent(self):
+        text = "!![a](b)[c](d)![e](f)"
+        self.assertListEqual(
+            [
+                (TextType.IMAGE, 1, 8, "a", "b"),
+                (TextType.LINK, 8, 14, "c", "d"),
+                (TextType.IMAGE, 14, 21, "e", "f"),
+            ],
+            TextNode.extract_markdown_spans(text),
+        )
+        self.assertListEqual(
+            TextNode.text_to_textnodes_legacy(text), TextNode.tokenize_inline(text)
+        )
+
+    def test_extract_markdown_spans_plain_text(self):
+        self.assertListEqual([], TextNode.extract_markdown_spans("just prose (no links)"))
+
     # Testes para split_nodes_image
     def test_split_nodes_image_basic(self):
         # Teste básico para a função split_nodes_image
@@ -269,6 +318,19 @@ class TestTextNode(unittest.TestCase):
         
         self.assertEqual(nodes, expected)
 
+    def test_split_nodes_link_after_image_marker(self):
+        # O link repetido após uma imagem é separado na posição do match, não
+        # na primeira ocorrência do texto do marcador
+        node = TextNode("![x](https://example.com)[x](https://example.com)", TextType.TEXT)
+        nodes = TextNode.split_nodes_link([node])
+        
+        expected = [
+            TextNode("![x](https://example.com)", TextType.TEXT),
+            TextNode("x", TextType.LINK, "https://example.com")
+        ]
+        
+        self.assertEqual(nodes, expected)
+
     def test_text_to_textnodes_basic(self):
         # Teste básico com diferentes tipos de formatação
         text = "This is **bold** and *italic* text with `code`."
@@ -329,6 +391,43 @@ class TestTextNode(unittest.TestCase):
         
         self.assertEqual(nodes, expected)
 
+    def test_text_to_textnodes_legacy_flag(self):
+        # O pipeline antigo continua disponível pela flag legacy
+        text = "Check this **important** [link](https://example.com) and ![image](https://example.com/img.jpg)"
+        self.assertEqual(
+            TextNode.text_to_textnodes(text, legacy=True),
+            TextNode.text_to_textnodes(text),
+        )
+
+    def test_tokenize_inline_parity(self):
+        # Casos em que o pipeline antigo descarta uma passagem inteira
+        texts = [
+            "Odd **bold and *italic* text",
+            "***a***",
+            "a****b",
+            "`code` with *odd italic",
+            "[a*b*](https://example.com) and *c*",
+            "**bold `code`** then `code *x*`",
+            "*a* and **",
+            "**",
+            "plain text",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    TextNode.text_to_textnodes_legacy(text),
+                    TextNode.tokenize_inline(text),
+                )
+
+    def test_tokenize_inline_adjacent_text(self):
+        # Segmentos vazios são descartados sem juntar os nós de texto vizinhos
+        nodes = TextNode.tokenize_inline("a****b")
+        expected = [
+            TextNode("a", TextType.TEXT),
+            TextNode("b", TextType.TEXT),
+        ]
+        self.assertEqual(nodes, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from writer import OutputWriter, write_if_changed
+
+
+class TestWriter(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = self.tempdir.name
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def read(self, path):
+        with open(path, encoding="utf-8") as fp:
+            return fp.read()
+
+    def test_write_if_changed(self):
+        path = os.path.join(self.root, "a", "b.html")
+        self.assertTrue(write_if_changed(path, "<p>x</p>"))
+        mtime = os.stat(path).st_mtime_ns
+        self.assertFalse(write_if_changed(path, "<p>x</p>"))
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+        # Mesmo tamanho, conteúdo diferente
+        self.assertTrue(write_if_changed(path, b"<p>y</p>"))
+        self.assertEqual(self.read(path), "<p>y</p>")
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["b.html"])
+
+    def test_output_writer_reports(self):
+        existing = os.path.join(self.root, "same.html")
+        write_if_changed(existing, "same")
+        with OutputWriter(workers=3, max_pending=2) as writer:
+            for i in range(10):
+                writer.submit(os.path.join(self.root, f"p{i}.html"), f"page {i}", f"p{i}.md")
+            writer.submit(existing, "same", "same.md")
+        self.assertEqual(len(writer.written), 10)
+        self.assertEqual(writer.unchanged, ["same.md"])
+        self.assertEqual(self.read(os.path.join(self.root, "p7.html")), "page 7")
+
+    def test_output_writer_errors(self):
+        blocker = os.path.join(self.root, "file")
+        write_if_changed(blocker, "x")
+        with OutputWriter(workers=0) as writer:
+            writer.submit(os.path.join(blocker, "child.html"), "y", "child.md")
+        self.assertEqual([key for key, _ in writer.errors], ["child.md"])
+        self.assertEqual(writer.written, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
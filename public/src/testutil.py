@@ -0,0 +1,47 @@
+"""
+Utilitários compartilhados pelos testes que trabalham com arquivos.
+"""
+import os
+import tempfile
+import unittest
+
+
+class TempDirTestCase(unittest.TestCase):
+    """
+    TestCase com um diretório temporário (self.root), removido ao fim de
+    cada teste, e atalhos para gravar e ler arquivos dentro dele.
+    """
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.root = self.tempdir.name
+
+    def path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def write(self, path, text, mtime=None):
+        """
+        Grava text em path (relativo a self.root ou absoluto), criando os
+        diretórios necessários.
+
+        Args:
+            mtime: Se indicado, define o mtime do arquivo em nanossegundos
+
+        Returns:
+            O caminho absoluto do arquivo
+        """
+        path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write(text)
+        if mtime is not None:
+            os.utime(path, ns=(mtime, mtime))
+        return path
+
+    def read(self, path, mode="r"):
+        path = os.path.join(self.root, path)
+        if "b" in mode:
+            with open(path, mode) as fp:
+                return fp.read()
+        with open(path, mode, encoding="utf-8") as fp:
+            return fp.read()
@@ -10,7 +10,39 @@ class TextType(Enum):
     IMAGE = "image"
     # Adicione outros tipos conforme necessário
 
+# Delimitadores inline na ordem em que o pipeline antigo os processa
+DELIMITER_ORDER = ("**", "*", "`")
+DELIMITER_TYPES = {"**": TextType.BOLD, "*": TextType.ITALIC, "`": TextType.CODE}
+DELIMITER_PATTERN = re.compile(r"(\*\*|\*|`)")
+DELIMITER_PATTERN_NO_BOLD = re.compile(r"(\*|`)")
+
+# Imagens ![alt](url) e links [texto](url), compilados uma única vez
+IMAGE_PATTERN = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)")
+LINK_PATTERN = re.compile(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
+# Imagem (com "!") ou link, em uma única busca
+INLINE_LINK_PATTERN = re.compile(r"(!?)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+# Link ou imagem sem o "!": começa por um literal, então a busca salta
+# direto para cada "[" (com "(!?)" na frente ela testaria toda posição)
+BRACKET_LINK_PATTERN = re.compile(r"\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
+# Regras inline opcionais ativas (InlineRuleSet de inline_rules.py); None
+# quando nenhuma está ativa
+_inline_extension = None
+
+
+def set_inline_extension(extension):
+    global _inline_extension
+    _inline_extension = extension
+
+
+def inline_extension():
+    return _inline_extension
+
+
 class TextNode:
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(self, text, text_type, url=None):
         self.text = text
         self.text_type = text_type
@@ -43,7 +75,7 @@ class TextNode:
         
         for old_node in old_nodes:
             # Só processamos nós do tipo TEXT
-            if old_node.text_type != TextType.TEXT:
+            if old_node.text_type is not TextType.TEXT:
                 new_nodes.append(old_node)
                 continue
             
@@ -95,14 +127,12 @@ class TextNode:
             Para o texto "Veja esta ![imagem](https://example.com/img.jpg) e ![outra](https://example.com/img2.png)"
             Retorna: [("imagem", "https://example.com/img.jpg"), ("outra", "https://example.com/img2.png")]
         """
-        # Padrão regex para encontrar imagens no formato ![alt text](url)
-        pattern = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
-        
-        # Encontra todas as ocorrências do padrão no texto
-        matches = re.findall(pattern, text)
+        # Sem "![" no texto não há imagem possível; evitamos rodar a regex
+        if "![" not in text:
+            return []
         
         # Retorna a lista de tuplas (alt_text, url)
-        return matches
+        return IMAGE_PATTERN.findall(text)
     
     @staticmethod
     def extract_markdown_links(text):
@@ -117,15 +147,34 @@ class TextNode:
             Para o texto "Visite [Google](https://google.com) e [GitHub](https://github.com)"
             Retorna: [("Google", "https://google.com"), ("GitHub", "https://github.com")]
         """
-        # Padrão regex para encontrar links no formato [texto do link](url)
-        # Exclui links de imagem que começam com !
-        pattern = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
+        # Sem "[" no texto não há link possível; evitamos rodar a regex
+        if "[" not in text:
+            return []
+        
+        # Retorna a lista de tuplas (texto_do_link, url), excluindo imagens
+        return LINK_PATTERN.findall(text)
+    
+    @staticmethod
+    def extract_markdown_spans(text):
+        """
+        Encontra imagens e links em uma única busca e retorna as posições de
+        cada um. Como em split_nodes_image seguido de split_nodes_link, um
+        link sobreposto a uma imagem é descartado.
+        
+        Args:
+            text: String contendo o texto a ser analisado
         
-        # Encontra todas as ocorrências do padrão no texto
-        matches = re.findall(pattern, text)
+        Returns:
+            Uma lista de tuplas (TextType.IMAGE ou TextType.LINK, início, fim, texto, url),
+            na ordem em que aparecem no texto
         
-        # Retorna a lista de tuplas (texto_do_link, url)
-        return matches
+        Exemplo:
+            Para o texto "![a](x.png) e [b](y.html)"
+            Retorna: [(TextType.IMAGE, 0, 11, "a", "x.png"), (TextType.LINK, 14, 25, "b", "y.html")]
+        """
+        if "[" not in text:
+            return []
+        return list(_iter_links_and_images(text))
     
     @staticmethod
     def split_nodes_image(old_nodes):
@@ -143,39 +192,31 @@ class TextNode:
         
         for old_node in old_nodes:
             # Só processamos nós do tipo TEXT
-            if old_node.text_type != TextType.TEXT:
+            if old_node.text_type is not TextType.TEXT:
                 new_nodes.append(old_node)
                 continue
             
-            # Extraímos as imagens do texto
-            images = TextNode.extract_markdown_images(old_node.text)
+            text = old_node.text
             
-            # Se não há imagens, mantemos o nó original
-            if not images:
-                new_nodes.append(old_node)
-                continue
-            
-            # Processamos o texto para substituir as imagens por nós apropriados
-            remaining_text = old_node.text
-            
-            for alt_text, url in images:
-                # Encontramos a posição da imagem no texto
-                image_marker = f"![{alt_text}]({url})"
-                parts = remaining_text.split(image_marker, 1)
-                
+            # Percorremos as imagens pelas posições de cada match, sem copiar o
+            # restante do texto a cada imagem encontrada
+            start = 0
+            for match in IMAGE_PATTERN.finditer(text):
                 # Adicionamos o texto antes da imagem, se houver
-                if parts[0]:
-                    new_nodes.append(TextNode(parts[0], TextType.TEXT))
+                if match.start() > start:
+                    new_nodes.append(TextNode(text[start:match.start()], TextType.TEXT))
                 
                 # Adicionamos a imagem como um nó IMAGE
+                alt_text, url = match.groups()
                 new_nodes.append(TextNode(alt_text, TextType.IMAGE, url))
-                
-                # Atualizamos o texto restante
-                remaining_text = parts[1] if len(parts) > 1 else ""
+                start = match.end()
             
+            # Se não há imagens, mantemos o nó original
+            if start == 0:
+                new_nodes.append(old_node)
             # Adicionamos o texto restante, se houver
-            if remaining_text:
-                new_nodes.append(TextNode(remaining_text, TextType.TEXT))
+            elif start < len(text):
+                new_nodes.append(TextNode(text[start:], TextType.TEXT))
         
         return new_nodes
     
@@ -195,48 +236,126 @@ class TextNode:
         
         for old_node in old_nodes:
             # Só processamos nós do tipo TEXT
-            if old_node.text_type != TextType.TEXT:
+            if old_node.text_type is not TextType.TEXT:
                 new_nodes.append(old_node)
                 continue
             
-            # Extraímos os links do texto
-            links = TextNode.extract_markdown_links(old_node.text)
+            text = old_node.text
             
-            # Se não há links, mantemos o nó original
-            if not links:
-                new_nodes.append(old_node)
-                continue
-            
-            # Processamos o texto para substituir os links por nós apropriados
-            remaining_text = old_node.text
-            
-            for link_text, url in links:
-                # Encontramos a posição do link no texto
-                link_marker = f"[{link_text}]({url})"
-                parts = remaining_text.split(link_marker, 1)
-                
+            # Percorremos os links pelas posições de cada match, sem copiar o
+            # restante do texto a cada link encontrado
+            start = 0
+            for match in LINK_PATTERN.finditer(text):
                 # Adicionamos o texto antes do link, se houver
-                if parts[0]:
-                    new_nodes.append(TextNode(parts[0], TextType.TEXT))
+                if match.start() > start:
+                    new_nodes.append(TextNode(text[start:match.start()], TextType.TEXT))
                 
                 # Adicionamos o link como um nó LINK
+                link_text, url = match.groups()
                 new_nodes.append(TextNode(link_text, TextType.LINK, url))
-                
-                # Atualizamos o texto restante
-                remaining_text = parts[1] if len(parts) > 1 else ""
+                start = match.end()
             
+            # Se não há links, mantemos o nó original
+            if start == 0:
+                new_nodes.append(old_node)
             # Adicionamos o texto restante, se houver
-            if remaining_text:
-                new_nodes.append(TextNode(remaining_text, TextType.TEXT))
+            elif start < len(text):
+                new_nodes.append(TextNode(text[start:], TextType.TEXT))
         
         return new_nodes
     
     @staticmethod
-    def text_to_textnodes(text):
+    def text_to_textnodes(text, legacy=False):
         """
         Transforma um texto em Markdown em uma lista de TextNode,
         processando delimitadores, links e imagens.
         
+        Args:
+            text: String contendo o texto em formato Markdown
+            legacy: Se True, usa o pipeline antigo de cinco passagens
+                (text_to_textnodes_legacy) em vez do tokenizador de passagem única.
+                O pipeline antigo ignora as regras de inline_rules.py
+        
+        Returns:
+            Uma lista de TextNode representando o texto processado
+        """
+        if legacy:
+            return TextNode.text_to_textnodes_legacy(text)
+        if _inline_extension is not None:
+            return _inline_extension.apply(text, TextNode.tokenize_inline(text))
+        return TextNode.tokenize_inline(text)
+    
+    @staticmethod
+    def tokenize_inline(text):
+        """
+        Tokenizador de passagem única: percorre o texto uma vez coletando os
+        delimitadores e gera a mesma sequência de TextNode que o pipeline antigo,
+        sem recriar a lista de nós a cada passagem e sem usar exceções como
+        controle de fluxo.
+        
+        Args:
+            text: String contendo o texto em formato Markdown
+        
+        Returns:
+            Uma lista de TextNode representando o texto processado
+        """
+        if not text:
+            return [TextNode(text, TextType.TEXT)]
+        
+        # O pipeline antigo só aplica "**" quando o número de ocorrências é par;
+        # caso contrário "**" é tratado como dois "*"
+        bold_count = text.count("**")
+        if bold_count and not bold_count % 2:
+            pattern = DELIMITER_PATTERN
+        else:
+            pattern = DELIMITER_PATTERN_NO_BOLD
+        # Uma única busca em C: parts alterna texto e delimitadores
+        parts = pattern.split(text)
+        tokens = parts[1::2]
+        
+        # Decidimos quais delimitadores estão ativos, na mesma ordem do pipeline antigo
+        active = set()
+        for delimiter in DELIMITER_ORDER:
+            if _delimiter_is_active(tokens, delimiter, active):
+                active.add(delimiter)
+        
+        nodes = []
+        if not active:
+            _split_links_and_images(text, nodes)
+            return nodes
+        
+        # Emitimos os segmentos entre delimitadores ativos; delimitadores inativos
+        # continuam fazendo parte do texto
+        state = None
+        pieces = [parts[0]]
+        for i in range(1, len(parts), 2):
+            token = parts[i]
+            if token == state or (state is None and token in active):
+                segment = pieces[0] if len(pieces) == 1 else "".join(pieces)
+                if segment:
+                    if state is not None:
+                        nodes.append(TextNode(segment, DELIMITER_TYPES[state]))
+                    elif "[" in segment:
+                        _split_links_and_images(segment, nodes)
+                    else:
+                        nodes.append(TextNode(segment, TextType.TEXT))
+                state = None if state is not None else token
+                pieces = [parts[i + 1]]
+            else:
+                pieces.append(token)
+                pieces.append(parts[i + 1])
+        segment = pieces[0] if len(pieces) == 1 else "".join(pieces)
+        if segment:
+            _split_links_and_images(segment, nodes)
+        return nodes
+    
+    @staticmethod
+    def text_to_textnodes_legacy(text):
+        """
+        Implementação original de text_to_textnodes, em cinco passagens sobre a lista
+        de nós (negrito, itálico, código, imagens e links). Mantida para testes de
+        paridade com o tokenizador de passagem única.
+        
         Args:
             text: String contendo o texto em formato Markdown
         
@@ -274,5 +393,85 @@ class TextNode:
         nodes = TextNode.split_nodes_link(nodes)
         
         return nodes
-    
-    
\ No newline at end of file
+
+
+def _delimiter_is_active(tokens, delimiter, active):
+    """
+    Reproduz a regra do split_nodes_delimiter: o delimitador só é aplicado se
+    aparece pelo menos uma vez e se cada trecho de texto (fora dos delimitadores
+    já ativos) tem um número par de ocorrências.
+    """
+    if delimiter not in tokens:
+        return False
+    if not active:
+        return not tokens.count(delimiter) % 2
+    state = None
+    count = 0
+    found = False
+    for token in tokens:
+        if state is not None:
+            if token == state:
+                state = None
+        elif token in active:
+            if count % 2:
+                return False
+            state = token
+            count = 0
+        elif token == delimiter:
+            count += 1
+            found = True
+    return found and not count % 2
+
+
+def _iter_links_and_images(text):
+    """
+    Gera tuplas (tipo, início, fim, texto, url) das imagens e links de um
+    texto, na ordem. Como no pipeline antigo, as imagens têm precedência:
+    um link que se sobrepõe a uma imagem ("[a](![b)](c)") é descartado.
+    """
+    # Uma única busca encontra imagens e links; um "!" logo antes do "["
+    # faz do trecho uma imagem. Como o texto do link não pode ter "[", um
+    # link só se sobrepõe a uma imagem se a URL dele tem "!["; nesse caso
+    # raro as imagens são buscadas primeiro, abaixo
+    spans = []
+    for match in BRACKET_LINK_PATTERN.finditer(text):
+        label, url = match.groups()
+        start = match.start()
+        if start and text[start - 1] == "!":
+            spans.append((TextType.IMAGE, start - 1, match.end(), label, url))
+        elif "![" in url:
+            break
+        else:
+            spans.append((TextType.LINK, start, match.end(), label, url))
+    else:
+        yield from spans
+        return
+    start = 0
+    for image in IMAGE_PATTERN.finditer(text):
+        # Links só no trecho entre a imagem anterior e esta; o trecho sempre
+        # começa depois de um ")", então o lookbehind de LINK_PATTERN não muda
+        for match in LINK_PATTERN.finditer(text, start, image.start()):
+            yield TextType.LINK, match.start(), match.end(), *match.groups()
+        yield TextType.IMAGE, image.start(), image.end(), *image.groups()
+        start = image.end()
+    for match in LINK_PATTERN.finditer(text, start):
+        yield TextType.LINK, match.start(), match.end(), *match.groups()
+
+
+def _split_links_and_images(text, nodes):
+    """
+    Adiciona a nodes os nós de um trecho de texto, separando imagens e links.
+    """
+    if "[" not in text:
+        nodes.append(TextNode(text, TextType.TEXT))
+        return
+    start = 0
+    for text_type, span_start, span_end, label, url in _iter_links_and_images(text):
+        if span_start > start:
+            nodes.append(TextNode(text[start:span_start], TextType.TEXT))
+        nodes.append(TextNode(label, text_type, url))
+        start = span_end
+    if start == 0:
+        nodes.append(TextNode(text, TextType.TEXT))
+    elif start < len(text):
+        nodes.append(TextNode(text[start:], TextType.TEXT))
@@ -0,0 +1,128 @@
+"""
+Gravação dos arquivos gerados.
+
+Cada arquivo é gravado de forma atômica (arquivo temporário + rename) e
+apenas se o conteúdo mudou: arquivos idênticos mantêm o mtime, e ferramentas
+de sincronização (rsync, CDN) não os enviam de novo. O OutputWriter faz as
+gravações em um pool de threads com uma fila limitada, para que a
+renderização não espere pelo disco.
+"""
+import os
+import threading
+
+
+def write_if_changed(path, data):
+    """
+    Grava data (str ou bytes) em path se o conteúdo for diferente do atual.
+    
+    Returns:
+        True se o arquivo foi gravado, False se já tinha o mesmo conteúdo
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as fp:
+                if fp.read() == data:
+                    return False
+    except FileNotFoundError:
+        pass
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as fp:
+            fp.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return True
+
+
+def remove_output(path, output_dir):
+    """
+    Remove um arquivo gerado e os diretórios que ficarem vazios, sem sair de output_dir.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    directory = os.path.dirname(path)
+    output_dir = os.path.abspath(output_dir)
+    while os.path.abspath(directory) != output_dir:
+        try:
+            os.rmdir(directory)
+        except OSError:
+            break
+        directory = os.path.dirname(directory)
+
+
+class OutputWriter:
+    def __init__(self, workers=4, max_pending=64):
+        """
+        Args:
+            workers: Número de threads de gravação; 0 grava na própria thread
+            max_pending: Número máximo de arquivos aguardando gravação; submit
+                bloqueia quando a fila está cheia, limitando a memória usada
+        """
+        self.executor = None
+        if workers > 0:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.pending = threading.BoundedSemaphore(max(1, max_pending))
+        self.lock = threading.Lock()
+        self.written = []
+        self.unchanged = []
+        self.errors = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record(self, key, changed, error):
+        with self.lock:
+            if error is not None:
+                self.errors.append((key, f"{type(error).__name__}: {error}"))
+            elif changed:
+                self.written.append(key)
+            else:
+                self.unchanged.append(key)
+
+    def write(self, path, data, key):
+        try:
+            changed = write_if_changed(path, data)
+        except OSError as error:
+            self.record(key, False, error)
+        else:
+            self.record(key, changed, None)
+        finally:
+            self.pending.release()
+
+    def submit(self, path, data, key=None):
+        """
+        Agenda a gravação de data em path. key identifica o arquivo nos
+        relatórios (por padrão, o próprio path).
+        """
+        self.pending.acquire()
+        key = path if key is None else key
+        if self.executor is None:
+            self.write(path, data, key)
+        else:
+            self.executor.submit(self.write, path, data, key)
+
+    def close(self):
+        """
+        Espera todas as gravações terminarem.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+        self.written.sort()
+        self.unchanged.sort()
+        self.errors.sort()